@@ -1,5 +1,6 @@
 """Map an OpenAPI schema to SQLAlchemy models."""
 
+import contextlib
 import functools
 import sys
 import types as py_types
@@ -10,12 +11,15 @@ from sqlalchemy.ext import declarative
 from open_alchemy import types as oa_types
 
 from . import build as _build_module
+from . import cache as _cache
 from . import exceptions
+from . import facades as _facades
 from . import helpers as _helpers
 from . import model_factory as _model_factory
-from . import models_file as _models_file
 from . import schemas as _schemas_module
 from .build import PackageFormat
+from .context import OpenAlchemy
+from .utility_base.validation import Level as ValidationLevel
 
 models = py_types.ModuleType("models")  # pylint: disable=invalid-name
 sys.modules["open_alchemy.models"] = models
@@ -27,6 +31,11 @@ def init_model_factory(
     spec: oa_types.Schema,
     models_filename: typing.Optional[str] = None,
     spec_path: typing.Optional[str] = None,
+    json_schema_draft: typing.Optional[_facades.jsonschema.Draft] = None,
+    processed: bool = False,
+    lazy: bool = False,
+    validation_level: ValidationLevel = ValidationLevel.FULL,
+    context: typing.Optional[OpenAlchemy] = None,
 ) -> oa_types.ModelFactory:
     """
     Create factory that generates SQLAlchemy models based on OpenAPI specification.
@@ -37,15 +46,65 @@ def init_model_factory(
         models_filename: The name of the file to write the models typing information to.
         spec_path: The path the the OpenAPI specification. Mainly used to support remote
             references.
+        json_schema_draft: The JSON schema draft used by the models to validate
+            dictionaries passed to from_dict. If not set, the draft is determined based
+            on the schema.
+        processed: Whether the schemas have already been validated and processed, for
+            example by build_json or build_yaml, in which case they are used as is.
+        lazy: Whether each model is only constructed when it is first retrieved from
+            open_alchemy.models or the model factory, together with any models it
+            depends on. Otherwise all models are constructed immediately.
+        validation_level: The validation of the dictionaries passed to from_dict by
+            the models. Full validation checks the dictionaries against the model
+            schema, types only checks the types of the values and trusted only
+            converts the values. It can be overridden for each call.
+        context: The context whose namespace the models are defined on, whose
+            store the remote schemas are stored in and whose settings, such as the
+            JSON backend of the models, the cache directory and the validation of
+            the schemas, are used. If not set, the models are defined on
+            open_alchemy.models, the remote schemas are shared by the process and
+            the default settings are used.
 
     Returns:
         A factory that returns SQLAlchemy models derived from the base based on the
         OpenAPI specification.
 
     """
+    with _activate(context=context):
+        return _init_model_factory(
+            base=base,
+            spec=spec,
+            models_filename=models_filename,
+            spec_path=spec_path,
+            json_schema_draft=json_schema_draft,
+            processed=processed,
+            lazy=lazy,
+            validation_level=validation_level,
+            context=context,
+        )
+
+
+def _init_model_factory(
+    *,
+    base: typing.Type,
+    spec: oa_types.Schema,
+    models_filename: typing.Optional[str],
+    spec_path: typing.Optional[str],
+    json_schema_draft: typing.Optional[_facades.jsonschema.Draft],
+    processed: bool,
+    lazy: bool,
+    validation_level: ValidationLevel,
+    context: typing.Optional[OpenAlchemy],
+) -> oa_types.ModelFactory:
+    """Create the model factory while the context is active."""
+    namespace = models if context is None else context.models
+    namespace_name = "open_alchemy.models" if context is None else namespace.__name__
+    cache_dir = None if context is None else context.cache_dir
+
     # Record the spec path
     if spec_path is not None:
         _helpers.ref.set_context(path=spec_path)
+    _helpers.ref.set_cache_dir(directory=cache_dir)
 
     # Retrieving the schema from the specification
     if "components" not in spec:
@@ -59,13 +118,55 @@ def init_model_factory(
         )
     schemas = components.get("schemas", {})
 
-    # Pre-processing schemas
-    _schemas_module.process(schemas=schemas)
-
-    # Getting artifacts
-    schemas_artifacts = _schemas_module.artifacts.get_from_schemas(
-        schemas=schemas, stay_within_model=True
-    )
+    # Retrieving the processed schemas and artifacts from the cache
+    cache_key: typing.Optional[str] = None
+    cache_entry: typing.Optional[_cache.Entry] = None
+    if cache_dir is not None:
+        cache_key = _cache.calculate_key(spec=spec, spec_path=spec_path)
+        cache_entry = _cache.load(directory=cache_dir, key=cache_key)
+
+    if cache_entry is not None:
+        schemas.clear()
+        schemas.update(cache_entry.schemas)
+        schemas_artifacts = cache_entry.artifacts
+        models_file_artifacts = cache_entry.models_file_artifacts
+        if models_filename is not None and models_file_artifacts is None:
+            models_file_artifacts = _schemas_module.artifacts.get_from_schemas(
+                schemas=schemas, stay_within_model=False
+            )
+    else:
+        # Loading the remote references concurrently
+        _helpers.ref.prefetch(schemas=schemas)
+
+        # The remote contexts are calculated before the references are resolved
+        remote_hashes: typing.Dict[str, str] = {}
+        if cache_dir is not None:
+            remote_hashes = _cache.calculate_remote_hashes(schemas=schemas)
+        schemas_artifacts, models_file_artifacts = _process_schemas(
+            schemas=schemas,
+            models_file=models_filename is not None,
+            processed=processed,
+            validation_workers=(
+                None if context is None else context.validation_workers
+            ),
+            validation_executor=(
+                _schemas_module.validation.Executor.PROCESS
+                if context is None
+                else context.validation_executor
+            ),
+        )
+        if cache_dir is not None:
+            assert cache_key is not None
+            _cache.store(
+                directory=cache_dir,
+                key=cache_key,
+                entry=_cache.Entry(
+                    schemas=schemas,
+                    artifacts=schemas_artifacts,
+                    models_file_artifacts=models_file_artifacts,
+                    remote_hashes=remote_hashes,
+                ),
+            )
 
     # Binding the base and schemas
     bound_model_factories = functools.partial(
@@ -73,33 +174,112 @@ def init_model_factory(
         schemas=schemas,
         artifacts=schemas_artifacts,
         get_base=_get_base,
+        json_schema_draft=json_schema_draft,
+        json_backend=None if context is None else context.json_backend,
+        validation_level=validation_level,
     )
     # Caching calls
     cached_model_factories = functools.lru_cache(maxsize=None)(bound_model_factories)
 
     # Making Base importable
-    setattr(models, "Base", base)
+    setattr(namespace, "Base", base)
 
     # Intercept factory calls to make models available
     def _register_model(*, name: str) -> typing.Type:
         """Intercept calls to model factory and register model on models."""
-        model = cached_model_factories(name=name)
-        setattr(models, name, model)
+        with _activate(context=context):
+            model = cached_model_factories(name=name)
+        setattr(namespace, name, model)
         return model
 
     if models_filename is not None:
-        schemas_artifacts = _schemas_module.artifacts.get_from_schemas(
-            schemas=schemas, stay_within_model=False
-        )
-        models_file_contents = _models_file.generate(artifacts=schemas_artifacts)
+        assert models_file_artifacts is not None
+        # pylint: disable=import-outside-toplevel
+        from . import models_file as _models_file
+
+        models_file_contents = _models_file.generate(artifacts=models_file_artifacts)
         with open(models_filename, "w") as out_file:
             out_file.write(models_file_contents)
 
+    if lazy:
+        define_lazy = _helpers.define_lazy(
+            model_factory=_register_model, artifacts=schemas_artifacts
+        )
+
+        def _getattr(name: str) -> typing.Type:
+            """Construct models when they are first retrieved from the module."""
+            if name not in schemas_artifacts:
+                raise AttributeError(
+                    f"module '{namespace_name}' has no attribute '{name}'"
+                )
+            return define_lazy(name=name)
+
+        setattr(namespace, "__getattr__", _getattr)
+        return define_lazy
+
+    # Remove the lazy construction of any previous initialization
+    namespace.__dict__.pop("__getattr__", None)
     _helpers.define_all(model_factory=_register_model, schemas=schemas)
 
     return _register_model
 
 
+def _activate(*, context: typing.Optional[OpenAlchemy]) -> typing.ContextManager:
+    """Activate the context if it is set."""
+    if context is None:
+        return contextlib.nullcontext()
+    return context.activate()
+
+
+def _process_schemas(
+    *,
+    schemas: oa_types.Schemas,
+    models_file: bool,
+    processed: bool = False,
+    validation_workers: typing.Optional[int] = None,
+    validation_executor: _schemas_module.validation.Executor = (
+        _schemas_module.validation.Executor.PROCESS
+    ),
+) -> typing.Tuple[
+    oa_types.ModelsModelArtifacts, typing.Optional[oa_types.ModelsModelArtifacts]
+]:
+    """
+    Process the schemas and calculate the artifacts.
+
+    Args:
+        schemas: The schemas to process in place.
+        models_file: Whether to calculate the artifacts for the models file.
+        processed: Whether the schemas have already been processed.
+        validation_workers: The number of workers used to validate the models.
+        validation_executor: The kind of pool used to validate the models.
+
+    Returns:
+        The artifacts of the models and the artifacts for the models file.
+
+    """
+    # Share the values resolved from the schemas for the duration of the processing
+    with _schemas_module.helpers.index.build(schemas=schemas):
+        # Pre-processing schemas
+        if not processed:
+            _schemas_module.process(
+                schemas=schemas,
+                validation_workers=validation_workers,
+                validation_executor=validation_executor,
+            )
+
+        # Getting artifacts
+        schemas_artifacts = _schemas_module.artifacts.get_from_schemas(
+            schemas=schemas, stay_within_model=True
+        )
+        models_file_artifacts: typing.Optional[oa_types.ModelsModelArtifacts] = None
+        if models_file:
+            models_file_artifacts = _schemas_module.artifacts.get_from_schemas(
+                schemas=schemas, stay_within_model=False
+            )
+
+    return schemas_artifacts, models_file_artifacts
+
+
 BaseAndModelFactory = typing.Tuple[typing.Type, oa_types.ModelFactory]
 
 
@@ -109,6 +289,10 @@ def _init_optional_base(
     spec: oa_types.Schema,
     models_filename: typing.Optional[str] = None,
     spec_path: typing.Optional[str] = None,
+    processed: bool = False,
+    lazy: bool = False,
+    validation_level: ValidationLevel = ValidationLevel.FULL,
+    context: typing.Optional[OpenAlchemy] = None,
 ) -> BaseAndModelFactory:
     """Wrap init_model_factory with optional base."""
     if base is None:
@@ -120,6 +304,10 @@ def _init_optional_base(
             spec=spec,
             models_filename=models_filename,
             spec_path=spec_path,
+            processed=processed,
+            lazy=lazy,
+            validation_level=validation_level,
+            context=context,
         ),
     )
 
@@ -129,6 +317,10 @@ def init_json(
     *,
     base: typing.Optional[typing.Type] = None,
     models_filename: typing.Optional[str] = None,
+    processed: bool = False,
+    lazy: bool = False,
+    validation_level: ValidationLevel = ValidationLevel.FULL,
+    context: typing.Optional[OpenAlchemy] = None,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a JSON file.
@@ -139,6 +331,16 @@ def init_json(
               If base=None, construct a new SQLAlchemy declarative base.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        processed: (optional) Whether the schemas in the specification have already
+            been validated and processed, for example the specification of a package
+            built with build_json or build_yaml. Defaults to False.
+        lazy: (optional) Whether each model is only constructed when it is first
+            used. Defaults to False.
+        validation_level: (optional) The validation of the dictionaries passed to
+            from_dict by the models. Defaults to full validation.
+        context: (optional) The context whose namespace the models are defined on,
+            whose store the remote schemas are stored in and whose settings are used.
+            If it is not provided, the models are defined on open_alchemy.models.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -148,18 +350,20 @@ def init_json(
             base based on the OpenAPI specification.
 
     """
-    # Most OpenAPI specs are YAML, so, for efficiency, we only import json if we
-    # need it:
-    import json  # pylint: disable=import-outside-toplevel
-
     with open(spec_filename) as spec_file:
-        spec = json.load(spec_file)
+        spec = _facades.json.load(
+            spec_file, backend=None if context is None else context.json_backend
+        )
 
     return _init_optional_base(
         base=base,
         spec=spec,
         models_filename=models_filename,
         spec_path=spec_filename,
+        processed=processed,
+        lazy=lazy,
+        validation_level=validation_level,
+        context=context,
     )
 
 
@@ -168,6 +372,10 @@ def init_yaml(
     *,
     base: typing.Optional[typing.Type] = None,
     models_filename: typing.Optional[str] = None,
+    processed: bool = False,
+    lazy: bool = False,
+    validation_level: ValidationLevel = ValidationLevel.FULL,
+    context: typing.Optional[OpenAlchemy] = None,
 ) -> BaseAndModelFactory:
     """
     Create SQLAlchemy models factory based on an OpenAPI specification as a YAML file.
@@ -180,6 +388,15 @@ def init_yaml(
               If base=None, construct a new SQLAlchemy declarative base.
         models_filename: (optional) The path to write the models file to. If it is not
             provided, the models file is not created.
+        processed: (optional) Whether the schemas in the specification have already
+            been validated and processed. Defaults to False.
+        lazy: (optional) Whether each model is only constructed when it is first
+            used. Defaults to False.
+        validation_level: (optional) The validation of the dictionaries passed to
+            from_dict by the models. Defaults to full validation.
+        context: (optional) The context whose namespace the models are defined on,
+            whose store the remote schemas are stored in and whose settings are used.
+            If it is not provided, the models are defined on open_alchemy.models.
 
     Returns:
         A tuple (Base, model_factory), where:
@@ -190,20 +407,31 @@ def init_yaml(
 
     """
     try:
-        import yaml  # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel,unused-import
+        import yaml  # noqa: F401
     except ImportError as exc:
         raise ImportError(
             "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
         ) from exc
 
-    with open(spec_filename) as spec_file:
-        spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
+    cache_dir = None if context is None else context.cache_dir
+    if cache_dir is not None:
+        spec = _cache.load_spec(
+            directory=cache_dir, filename=spec_filename, parse=_facades.yaml.load
+        )
+    else:
+        with open(spec_filename) as spec_file:
+            spec = _facades.yaml.load(spec_file)
 
     return _init_optional_base(
         base=base,
         spec=spec,
         models_filename=models_filename,
         spec_path=spec_filename,
+        processed=processed,
+        lazy=lazy,
+        validation_level=validation_level,
+        context=context,
     )
 
 
@@ -235,13 +463,13 @@ def _get_base(*, name: str, schemas: oa_types.Schemas) -> typing.Type:
     if _helpers.schema.inherits(schema=schema, schemas=schemas):
         parent = _helpers.inheritance.retrieve_parent(schema=schema, schemas=schemas)
         try:
-            return getattr(models, parent)
+            return getattr(_facades.models.get_namespace(), parent)
         except AttributeError as exc:
             raise exceptions.InheritanceError(
                 "Any parents of a schema must be constructed before the schema can be "
                 "constructed."
             ) from exc
-    return getattr(models, "Base")
+    return _facades.models.get_base()
 
 
 def build_json(
@@ -249,6 +477,7 @@ def build_json(
     package_name: str,
     dist_path: str,
     format_: PackageFormat = PackageFormat.NONE,
+    precompiled: bool = False,
 ) -> None:
     """
     Create an OpenAlchemy distribution package with the SQLAlchemy models.
@@ -268,17 +497,19 @@ def build_json(
         package_name: The name of the package.
         dist_path: The directory to output the package to.
         format_: (optional) The format(s) of the archive(s) to build.
+        precompiled: (optional) Whether importing the package skips validating and
+            processing the specification again. Defaults to False.
 
     """
-    # Most OpenAPI specs are YAML, so, for efficiency, we only import json if we
-    # need it:
-    import json  # pylint: disable=import-outside-toplevel
-
     with open(spec_filename) as spec_file:
-        spec = json.load(spec_file)
+        spec = _facades.json.load(spec_file)
 
     return _build_module.execute(
-        spec=spec, name=package_name, path=dist_path, format_=format_
+        spec=spec,
+        name=package_name,
+        path=dist_path,
+        format_=format_,
+        precompiled=precompiled,
     )
 
 
@@ -287,6 +518,7 @@ def build_yaml(
     package_name: str,
     dist_path: str,
     format_: PackageFormat = PackageFormat.NONE,
+    precompiled: bool = False,
 ) -> None:
     """
     Create an OpenAlchemy distribution package with the SQLAlchemy models.
@@ -306,20 +538,27 @@ def build_yaml(
         package_name: The name of the package.
         dist_path: The directory to output the package to.
         format_: (optional) The format(s) of the archive(s) to build.
+        precompiled: (optional) Whether importing the package skips validating and
+            processing the specification again. Defaults to False.
 
     """
     try:
-        import yaml  # pylint: disable=import-outside-toplevel
+        # pylint: disable=import-outside-toplevel,unused-import
+        import yaml  # noqa: F401
     except ImportError as exc:
         raise ImportError(
             "Using init_yaml requires the pyyaml package. Try `pip install pyyaml`."
         ) from exc
 
     with open(spec_filename) as spec_file:
-        spec = yaml.load(spec_file, Loader=yaml.SafeLoader)
+        spec = _facades.yaml.load(spec_file)
 
     return _build_module.execute(
-        spec=spec, name=package_name, path=dist_path, format_=format_
+        spec=spec,
+        name=package_name,
+        path=dist_path,
+        format_=format_,
+        precompiled=precompiled,
     )
 
 
@@ -330,4 +569,6 @@ __all__ = [
     "build_json",
     "build_yaml",
     "PackageFormat",
+    "OpenAlchemy",
+    "ValidationLevel",
 ]
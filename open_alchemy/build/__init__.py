@@ -2,17 +2,16 @@
 
 import dataclasses
 import enum
+import functools
 import hashlib
 import json
 import pathlib
 import sys
 import typing
 
-import jinja2
-
 from .. import exceptions
+from .. import facades
 from .. import helpers
-from .. import models_file as models_file_module
 from .. import schemas as schemas_module
 from .. import types
 
@@ -22,14 +21,24 @@ from .. import types
 
 
 _DIRECTORY = pathlib.Path(__file__).parent.absolute()
-with open(_DIRECTORY / "setup.j2") as in_file:
-    _SETUP_TEMPLATE = in_file.read()
-with open(_DIRECTORY / "MANIFEST.j2") as in_file:
-    _MANIFEST_TEMPLATE = in_file.read()
-with open(_DIRECTORY / "init_init_open_alchemy.j2") as in_file:
-    _INIT_INIT_OPEN_ALCHEMY_TEMPLATE = in_file.read()
-with open(_DIRECTORY / "init.j2") as in_file:
-    _INIT_TEMPLATE = in_file.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template(filename: str) -> typing.Any:
+    """
+    Load a template, only reading it and importing jinja2 on first use.
+
+    Args:
+        filename: The name of the file with the template.
+
+    Returns:
+        The template.
+
+    """
+    import jinja2  # pylint: disable=import-outside-toplevel
+
+    with open(_DIRECTORY / filename) as in_file:
+        return jinja2.Template(in_file.read())
 
 
 class PackageFormat(enum.Flag):
@@ -125,8 +134,8 @@ def generate_spec_str(
     if description is not None:
         info["description"] = description
 
-    return json.dumps(
-        {"info": info, "components": {"schemas": schemas}}, separators=(",", ":")
+    return facades.json.dumps(
+        {"info": info, "components": {"schemas": schemas}}, compact=True
     )
 
 
@@ -221,7 +230,7 @@ def generate_setup(*, name: TName, version: TVersion) -> str:
         The contents of the setup.py file for the models package.
 
     """
-    template = jinja2.Template(_SETUP_TEMPLATE)
+    template = _get_template("setup.j2")
 
     return template.render(
         name=name,
@@ -240,24 +249,28 @@ def generate_manifest(*, name: TName) -> str:
         The contents of the MANIFEST.in file for the models package.
 
     """
-    template = jinja2.Template(_MANIFEST_TEMPLATE)
+    template = _get_template("MANIFEST.j2")
 
     return template.render(
         name=name,
     )
 
 
-def generate_init_open_alchemy() -> str:
+def generate_init_open_alchemy(*, precompiled: bool = False) -> str:
     """
     Generate the OpenAlchemy initialization component of the __init__ file.
 
+    Args:
+        precompiled: Whether the spec of the package is used without validating and
+            processing it again.
+
     Returns:
         The OpenAlchemy initialization portion of the __init__ file.
 
     """
-    template = jinja2.Template(_INIT_INIT_OPEN_ALCHEMY_TEMPLATE)
+    template = _get_template("init_init_open_alchemy.j2")
 
-    return template.render()
+    return template.render(precompiled=precompiled)
 
 
 def generate_init_models_file(schemas: types.Schemas) -> str:
@@ -275,6 +288,9 @@ def generate_init_models_file(schemas: types.Schemas) -> str:
     artifacts = schemas_module.artifacts.get_from_schemas(
         schemas=schemas, stay_within_model=False
     )
+    # pylint: disable=import-outside-toplevel
+    from .. import models_file as models_file_module
+
     return models_file_module.generate(artifacts=artifacts)
 
 
@@ -290,7 +306,7 @@ def generate_init(open_alchemy: str, models_file: str) -> str:
         The contents of the __init__ file.
 
     """
-    template = jinja2.Template(_INIT_TEMPLATE)
+    template = _get_template("init.j2")
 
     return template.render(
         open_alchemy=open_alchemy,
@@ -397,15 +413,22 @@ def execute(
     name: TName,
     path: TPath,
     format_: PackageFormat,
+    precompiled: bool = False,
 ) -> None:
     """
     Execute the build for a spec.
 
+    The spec of the package contains the schemas after they have been processed. If
+    precompiled is set, importing the package uses them as is rather than validating
+    and processing them again.
+
     Args:
         spec: The spec to execute the build on.
         name: The name of the package.
         path: The build output path.
         format_: The format of the distribution package to build.
+        precompiled: Whether the package is initialized without validating and
+            processing the spec.
 
     """
     validate_dist_format(format_)
@@ -414,7 +437,7 @@ def execute(
     setup = generate_setup(name=name, version=spec_info.version)
     manifest = generate_manifest(name=name)
 
-    init_open_alchemy = generate_init_open_alchemy()
+    init_open_alchemy = generate_init_open_alchemy(precompiled=precompiled)
     init_models_file = generate_init_models_file(schemas=schemas)
     init = generate_init(open_alchemy=init_open_alchemy, models_file=init_models_file)
 
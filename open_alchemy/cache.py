@@ -0,0 +1,419 @@
+"""Cache the parsed specification and its processed schemas and artifacts on disk."""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import stat
+import typing
+
+from . import exceptions
+from . import helpers
+from . import types
+
+# Changed whenever the structure of the cache entries changes
+_FORMAT = "2"
+_EXTENSION = ".pickle"
+# Written before each entry so that files that are not entries are never unpickled
+_HEADER = f"open-alchemy-cache-{_FORMAT}\n".encode()
+# The maximum number of entries kept in a directory, the least recently used
+# entries are removed first
+MAX_ENTRIES = 128
+
+
+class Entry(typing.NamedTuple):
+    """
+    The cached result of processing the schemas of a specification.
+
+    Attrs:
+        schemas: The schemas after they have been processed.
+        artifacts: The artifacts of the models staying within each model.
+        models_file_artifacts: The artifacts used to generate the models file, if they
+            have been calculated.
+        remote_hashes: The hash of the schemas of each remote context that was loaded.
+
+    """
+
+    schemas: types.Schemas
+    artifacts: types.ModelsModelArtifacts
+    models_file_artifacts: typing.Optional[types.ModelsModelArtifacts]
+    remote_hashes: typing.Dict[str, str]
+
+
+def _calculate_hash(value: typing.Any) -> str:
+    """Calculate the hash of a JSON like value."""
+    value_str = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(value_str.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _calculate_source_hash() -> str:
+    """
+    Calculate the hash of the source of OpenAlchemy.
+
+    The source is hashed instead of using the version so that the cache is not used
+    with entries written by different code that has the same version, for example in
+    a source checkout or an editable install.
+
+    Returns:
+        The hash of all the files of the package.
+
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    source_hash = hashlib.sha256()
+    for directory, directories, files in os.walk(root):
+        directories[:] = sorted(name for name in directories if name != "__pycache__")
+        for name in sorted(files):
+            if name.endswith(".pyc"):
+                continue
+            path = os.path.join(directory, name)
+            source_hash.update(os.path.relpath(path, root).encode())
+            with open(path, "rb") as in_file:
+                source_hash.update(in_file.read())
+    return source_hash.hexdigest()
+
+
+def calculate_key(*, spec: typing.Any, spec_path: typing.Optional[str] = None) -> str:
+    """
+    Calculate the key of the cache entry for a specification.
+
+    The key changes if the specification, the path remote references are resolved
+    relative to, the source of OpenAlchemy or the structure of the cache entries
+    changes.
+
+    Args:
+        spec: The specification before its schemas are processed.
+        spec_path: The path to the specification.
+
+    Returns:
+        The key of the cache entry.
+
+    """
+    return _calculate_hash(
+        {
+            "format": _FORMAT,
+            "source": _calculate_source_hash(),
+            "spec": spec,
+            "spec_path": None if spec_path is None else os.path.abspath(spec_path),
+        }
+    )
+
+
+def calculate_remote_hashes(*, schemas: types.Schemas) -> typing.Dict[str, str]:
+    """
+    Calculate the hash of the schemas of each remote context the schemas reach.
+
+    Args:
+        schemas: The schemas of the specification before they are processed.
+
+    Returns:
+        The hash for each context.
+
+    """
+    return {
+        context: _calculate_hash(helpers.ref.get_remote_schemas(context=context))
+        for context in helpers.ref.get_reachable_contexts(schemas=schemas)
+    }
+
+
+def _remote_hashes_valid(remote_hashes: typing.Dict[str, str]) -> bool:
+    """Check whether the remote schemas have not changed."""
+    for context, remote_hash in remote_hashes.items():
+        try:
+            schemas = helpers.ref.get_remote_schemas(context=context)
+        except exceptions.BaseError:
+            return False
+        if _calculate_hash(schemas) != remote_hash:
+            return False
+    return True
+
+
+def _is_trusted(path: str) -> bool:
+    """
+    Check that only the current user can write to a path.
+
+    Entries are unpickled which can execute arbitrary code, so entries that someone
+    else could have written are never loaded. Always true on platforms without user
+    ids.
+
+    Args:
+        path: The path to check.
+
+    Returns:
+        Whether the path is trusted.
+
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    path_stat = os.stat(path)
+    return path_stat.st_uid == os.getuid() and not path_stat.st_mode & (
+        stat.S_IWGRP | stat.S_IWOTH
+    )
+
+
+def _load(*, directory: str, key: str) -> typing.Any:
+    """Load any entry for a key from the cache returning None if it can't be read."""
+    path = os.path.join(directory, f"{key}{_EXTENSION}")
+    try:
+        if not _is_trusted(directory) or not _is_trusted(path):
+            return None
+        with open(path, "rb") as in_file:
+            if in_file.read(len(_HEADER)) != _HEADER:
+                return None
+            entry = pickle.load(in_file)
+        # Record the use of the entry so that it is evicted last
+        os.utime(path)
+    # Unpickling a truncated or corrupted entry can raise almost any exception
+    except Exception:  # pylint: disable=broad-except
+        return None
+    return entry
+
+
+def load(*, directory: str, key: str) -> typing.Optional[Entry]:
+    """
+    Load the entry for a key from the cache.
+
+    An entry is only returned if none of the remote schemas it depends on have changed.
+    Any entry that can't be read is treated as missing.
+
+    Args:
+        directory: The directory of the cache.
+        key: The key of the entry.
+
+    Returns:
+        The entry or None if it is missing or no longer valid.
+
+    """
+    entry = _load(directory=directory, key=key)
+    if not isinstance(entry, Entry):
+        return None
+
+    if not _remote_hashes_valid(entry.remote_hashes):
+        return None
+    return entry
+
+
+def store(*, directory: str, key: str, entry: Entry) -> None:
+    """
+    Store the entry for a key in the cache.
+
+    Args:
+        directory: The directory of the cache.
+        key: The key of the entry.
+        entry: The entry to store.
+
+    """
+    _store(directory=directory, key=key, entry=entry)
+
+
+def _store(*, directory: str, key: str, entry: typing.Any) -> None:
+    """
+    Store any entry for a key in the cache.
+
+    The entry is first written to a temporary file in the directory which then replaces
+    any existing entry so that concurrent readers never see a partially written entry.
+    The directory is only readable by the current user if it is created. Failing to
+    write the entry is ignored because the cache is only an optimisation. Once the
+    entry is written, the least recently used entries beyond MAX_ENTRIES are removed.
+
+    Args:
+        directory: The directory of the cache.
+        key: The key of the entry.
+        entry: The entry to store.
+
+    """
+    import tempfile  # pylint: disable=import-outside-toplevel
+
+    path = os.path.join(directory, f"{key}{_EXTENSION}")
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        file_descriptor, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=f".{key}.", suffix=".tmp"
+        )
+    except OSError:
+        return
+    try:
+        with os.fdopen(file_descriptor, "wb") as out_file:
+            out_file.write(_HEADER)
+            pickle.dump(entry, out_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+    _evict(directory=directory)
+
+
+def _evict(*, directory: str) -> None:
+    """Remove the least recently used entries beyond MAX_ENTRIES."""
+    try:
+        with os.scandir(directory) as dir_entries:
+            entries = [
+                (dir_entry.stat().st_mtime_ns, dir_entry.path)
+                for dir_entry in dir_entries
+                if dir_entry.name.endswith(_EXTENSION) and dir_entry.is_file()
+            ]
+    except OSError:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[MAX_ENTRIES:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class SpecEntry(typing.NamedTuple):
+    """
+    The cached result of parsing a specification file.
+
+    Attrs:
+        mtime_ns: The modification time of the file when it was parsed.
+        size: The size of the file when it was parsed.
+        file_hash: The hash of the contents of the file when it was parsed.
+        spec: The parsed specification.
+
+    """
+
+    mtime_ns: int
+    size: int
+    file_hash: str
+    spec: typing.Any
+
+
+def _spec_key(filename: str) -> str:
+    """Calculate the key of the parsed specification of a file."""
+    path_hash = hashlib.sha256(os.path.abspath(filename).encode()).hexdigest()
+    return f"{path_hash}.spec"
+
+
+def load_spec(
+    *, directory: str, filename: str, parse: typing.Callable[[bytes], typing.Any]
+) -> typing.Any:
+    """
+    Load the parsed specification of a file using the cache.
+
+    The cached specification is used as is if the modification time and size of the
+    file have not changed. Otherwise the contents of the file are hashed and the
+    cached specification is only used if the hash has not changed. In any other case
+    the file is parsed and the result is stored in the cache.
+
+    Args:
+        directory: The directory of the cache.
+        filename: The name of the specification file.
+        parse: Parses the contents of the file.
+
+    Returns:
+        The parsed specification.
+
+    """
+    key = _spec_key(filename)
+    entry = _load(directory=directory, key=key)
+    if not isinstance(entry, SpecEntry):
+        entry = None
+
+    with open(filename, "rb") as spec_file:
+        file_stat = os.fstat(spec_file.fileno())
+        if (
+            entry is not None
+            and entry.mtime_ns == file_stat.st_mtime_ns
+            and entry.size == file_stat.st_size
+        ):
+            return entry.spec
+        contents = spec_file.read()
+
+    file_hash = hashlib.sha256(contents).hexdigest()
+    if entry is not None and entry.file_hash == file_hash:
+        spec = entry.spec
+    else:
+        spec = parse(contents)
+    _store(
+        directory=directory,
+        key=key,
+        entry=SpecEntry(
+            mtime_ns=file_stat.st_mtime_ns,
+            size=file_stat.st_size,
+            file_hash=file_hash,
+            spec=spec,
+        ),
+    )
+    return spec
+
+
+class UrlEntry(typing.NamedTuple):
+    """
+    The cached contents of a document retrieved from a URL.
+
+    Attrs:
+        etag: The ETag header of the response with the contents.
+        last_modified: The Last-Modified header of the response with the contents.
+        contents: The contents of the document.
+
+    """
+
+    etag: typing.Optional[str]
+    last_modified: typing.Optional[str]
+    contents: bytes
+
+
+def load_url(*, directory: str, url: str, timeout: float) -> bytes:
+    """
+    Retrieve the contents of a document at a URL using the cache.
+
+    If the document has been cached, it is revalidated using the ETag and
+    Last-Modified headers of the cached response and the cached contents are used if
+    the server responds that the document has not been modified. The cached contents
+    are also used if the server can't be reached or responds with a server error.
+
+    Raise urllib.error.URLError if the document can't be retrieved and has not been
+    cached.
+
+    Args:
+        directory: The directory of the cache.
+        url: The URL of the document.
+        timeout: The number of seconds to wait for the server to respond.
+
+    Returns:
+        The contents of the document.
+
+    """
+    # pylint: disable=import-outside-toplevel
+    from urllib import error
+    from urllib import request
+
+    key = f"{hashlib.sha256(url.encode()).hexdigest()}.url"
+    entry = _load(directory=directory, key=key)
+    if not isinstance(entry, UrlEntry):
+        entry = None
+
+    headers = {}
+    if entry is not None and entry.etag is not None:
+        headers["If-None-Match"] = entry.etag
+    if entry is not None and entry.last_modified is not None:
+        headers["If-Modified-Since"] = entry.last_modified
+
+    try:
+        with request.urlopen(
+            request.Request(url, headers=headers), timeout=timeout
+        ) as response:
+            contents = response.read()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+    except error.HTTPError as exc:
+        if entry is not None and (exc.code == 304 or exc.code >= 500):
+            return entry.contents
+        raise
+    except OSError:
+        if entry is not None:
+            return entry.contents
+        raise
+
+    _store(
+        directory=directory,
+        key=key,
+        entry=UrlEntry(etag=etag, last_modified=last_modified, contents=contents),
+    )
+    return contents
@@ -75,6 +75,11 @@ def build_application_parser() -> argparse.Namespace:
         choices=["sdist", "wheel"],
         help="limit the format to either sdist or wheel, defaults to both",
     )
+    build_parser.add_argument(
+        "--precompiled",
+        action="store_true",
+        help="import the package without validating and processing the spec again",
+    )
     build_parser.set_defaults(func=build)
 
     # Define the parser for the "generate" subcommand.
@@ -116,7 +121,13 @@ def build(args: argparse.Namespace) -> None:
 
     # Build the package.
     builder = builders.get(specfile.suffix.lower())
-    builder(args.specfile, args.name, args.output, fmt.get(args.format))  # type: ignore
+    builder(  # type: ignore
+        args.specfile,
+        args.name,
+        args.output,
+        fmt.get(args.format),  # type: ignore
+        precompiled=args.precompiled,
+    )
 
 
 def generate(args):
@@ -0,0 +1,88 @@
+"""The state of initialising the models of a specification."""
+
+import contextlib
+import types as py_types
+import typing
+
+from . import facades
+from . import helpers
+from . import schemas
+
+
+class OpenAlchemy:
+    """
+    The state of the models of a specification kept apart from any other specification.
+
+    By default the models are defined on open_alchemy.models and the remote schemas
+    are stored in a store that is shared by the process. Passing a context to the
+    init_* functions instead defines the models on the namespace of the context and
+    stores the remote schemas in the store of the context so that independent
+    specifications can be initialised at the same time, for example in different
+    threads. The context also holds the settings used to process the specification.
+
+    Attrs:
+        models: The namespace the models and Base are defined on.
+        remote_schema_store: The store of the remote schemas of the specification.
+        validation_workers: The number of workers used to validate the models in
+            parallel.
+        validation_executor: The kind of pool used to validate the models in
+            parallel.
+        json_backend: The library used by the models to encode and decode JSON.
+        cache_dir: The directory to cache the specification, the processed schemas
+            and artifacts and the documents of remote references in.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str = "models",
+        validation_workers: typing.Optional[int] = None,
+        validation_executor: schemas.validation.Executor = (
+            schemas.validation.Executor.PROCESS
+        ),
+        json_backend: typing.Optional[facades.json.Backend] = None,
+        cache_dir: typing.Optional[str] = None,
+    ) -> None:
+        """
+        Construct.
+
+        Args:
+            name: The name of the namespace of the models.
+            validation_workers: The number of workers used to validate the models in
+                parallel. If not set, the models are validated one after the other.
+            validation_executor: The kind of pool, processes or threads, used to
+                validate the models in parallel.
+            json_backend: The library used by the models to encode and decode JSON.
+                It also decodes the specification passed to init_json. If not set,
+                the default backend of the JSON facade is used.
+            cache_dir: The directory to cache the processed schemas and artifacts
+                in. If the specification, any remote reference and the version of
+                OpenAlchemy have not changed since the cache was written, the schemas
+                are not processed again. The specification passed to init_yaml and
+                the documents of remote references to URLs are also cached in the
+                directory. If not set, no cache is used.
+
+        """
+        self.models = py_types.ModuleType(name)
+        self.remote_schema_store = helpers.ref.RemoteSchemaStore()
+        self.validation_workers = validation_workers
+        self.validation_executor = schemas.validation.Executor(validation_executor)
+        self.json_backend = (
+            None if json_backend is None else facades.json.Backend(json_backend)
+        )
+        self.cache_dir = cache_dir
+
+    @contextlib.contextmanager
+    def activate(self) -> typing.Iterator["OpenAlchemy"]:
+        """
+        Use the namespace and remote schema store of the context in the current context.
+
+        Returns:
+            The context.
+
+        """
+        with helpers.ref.use_store(
+            self.remote_schema_store
+        ), facades.models.use_namespace(self.models):
+            yield self
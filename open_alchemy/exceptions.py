@@ -74,3 +74,7 @@ class BuildError(BaseError):
 
 class CLIError(BaseError):
     """Raised when an error occurs when the CLI is used."""
+
+
+class BatchError(BaseError):
+    """Raised when converting one or more items of a batch fails."""
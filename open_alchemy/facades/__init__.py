@@ -2,6 +2,8 @@
 # pylint: disable=useless-import-alias
 
 from . import code_formatter as code_formatter
+from . import json as json
 from . import jsonschema as jsonschema
 from . import models as models
 from . import sqlalchemy as sqlalchemy
+from . import yaml as yaml
@@ -0,0 +1,262 @@
+"""Facade for encoding and decoding JSON using the fastest available library."""
+
+import datetime
+import enum
+import functools
+import importlib
+import json
+import typing
+
+
+class Backend(str, enum.Enum):
+    """The libraries that can be used to encode and decode JSON."""
+
+    # Decode with the fastest installed library and encode with json
+    AUTO = "auto"
+    JSON = "json"
+    ORJSON = "orjson"
+    UJSON = "ujson"
+    RAPIDJSON = "rapidjson"
+
+
+# The fast libraries in order of preference
+_FAST_BACKENDS = (Backend.ORJSON, Backend.UJSON, Backend.RAPIDJSON)
+
+
+class DecodeError(ValueError):
+    """Raised when a value is not valid JSON."""
+
+
+class _Codec(typing.NamedTuple):
+    """The functions to encode and decode JSON with."""
+
+    backend: Backend
+    # Decode a string or bytes
+    loads: typing.Callable[[typing.Union[str, bytes]], typing.Any]
+    # Encode a value, the second argument is whether to omit whitespace
+    dumps: typing.Callable[[typing.Any, bool], str]
+
+
+def _default(value: typing.Any) -> str:
+    """
+    Convert values that are not natively supported in the same way as to_dict.
+
+    Raise TypeError if the value is not supported.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The JSON serializable value.
+
+    """
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        return value.decode()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _separators(compact: bool) -> typing.Tuple[str, str]:
+    """Calculate the separators between items and keys and values."""
+    return (",", ":") if compact else (", ", ": ")
+
+
+def _json_dumps(value: typing.Any, compact: bool) -> str:
+    """Encode using json."""
+    return json.dumps(value, default=_default, separators=_separators(compact))
+
+
+def _import(backend: Backend) -> typing.Any:
+    """
+    Import the library of a backend.
+
+    Raise ImportError if the library is not installed.
+
+    Args:
+        backend: The backend to import the library for.
+
+    Returns:
+        The library module.
+
+    """
+    try:
+        return importlib.import_module(backend.value)
+    except ImportError as exc:
+        package = "python-rapidjson" if backend == Backend.RAPIDJSON else backend.value
+        raise ImportError(
+            f"Using the {backend.value} JSON backend requires the {package} package. "
+            f"Try `pip install {package}`."
+        ) from exc
+
+
+@functools.lru_cache(maxsize=None)
+def _codec(backend: Backend) -> _Codec:
+    """
+    Construct the codec for a backend.
+
+    The output of orjson and rapidjson never contains whitespace. ujson is passed
+    the same separators as json. The fast backends may still encode strings and
+    floats differently to json, for example orjson does not escape non-ASCII
+    characters and rapidjson uses upper case hexadecimal digits in escapes.
+
+    Raise ImportError if the library of the backend is not installed.
+
+    Args:
+        backend: The backend to construct the codec for.
+
+    Returns:
+        The codec.
+
+    """
+    if backend == Backend.JSON:
+        return _Codec(backend=backend, loads=json.loads, dumps=_json_dumps)
+    if backend == Backend.AUTO:
+        for fast_backend in _FAST_BACKENDS:
+            try:
+                fast_codec = _codec(fast_backend)
+            except ImportError:
+                continue
+            return _Codec(backend=backend, loads=fast_codec.loads, dumps=_json_dumps)
+        return _Codec(backend=backend, loads=json.loads, dumps=_json_dumps)
+
+    module = _import(backend)
+    if backend == Backend.ORJSON:
+        option = module.OPT_PASSTHROUGH_DATETIME
+        return _Codec(
+            backend=backend,
+            loads=module.loads,
+            dumps=lambda value, _: module.dumps(
+                value, default=_default, option=option
+            ).decode(),
+        )
+    if backend == Backend.UJSON:
+        return _Codec(
+            backend=backend,
+            loads=module.loads,
+            dumps=lambda value, compact: module.dumps(
+                value,
+                separators=_separators(compact),
+                ensure_ascii=True,
+                escape_forward_slashes=False,
+                reject_bytes=False,
+                default=_default,
+            ),
+        )
+    return _Codec(
+        backend=backend,
+        loads=module.loads,
+        dumps=lambda value, _: module.dumps(value, default=_default),
+    )
+
+
+# The backend used when none is passed
+_BACKEND = Backend.AUTO
+
+
+def _get_codec(backend: typing.Optional[Backend] = None) -> _Codec:
+    """Get the codec for a backend, using the default backend if it is not set."""
+    return _codec(_BACKEND if backend is None else Backend(backend))
+
+
+def set_backend(backend: Backend) -> None:
+    """
+    Select the library used to encode and decode JSON when no backend is passed.
+
+    The automatic backend decodes with orjson, ujson or rapidjson, whichever is
+    installed first, and encodes with json so that the output is the same as
+    encoding with json. Any other backend is opt-in and is used for both encoding
+    and decoding. Its output is valid JSON but is not byte compatible with json:
+    orjson and rapidjson omit all whitespace and the fast backends may encode
+    strings and floats differently.
+
+    The default is shared by the process. To select a backend for the models of a
+    specification only, pass json_backend to the OpenAlchemy context instead.
+
+    Raise ImportError if the library of the backend is not installed.
+
+    Args:
+        backend: The backend to use.
+
+    """
+    global _BACKEND  # pylint: disable=global-statement
+    backend = Backend(backend)
+    _codec(backend)
+    _BACKEND = backend
+
+
+def get_backend() -> Backend:
+    """
+    Get the library used to encode and decode JSON when no backend is passed.
+
+    Returns:
+        The default backend.
+
+    """
+    return _BACKEND
+
+
+def loads(
+    value: typing.Union[str, bytes], *, backend: typing.Optional[Backend] = None
+) -> typing.Any:
+    """
+    Decode a JSON string.
+
+    Raise DecodeError if the value is not valid JSON.
+
+    Args:
+        value: The JSON string to decode.
+        backend: The library to decode with. If not set, the default is used.
+
+    Returns:
+        The decoded value.
+
+    """
+    codec = _get_codec(backend)
+    try:
+        return codec.loads(value)
+    except ValueError as exc:
+        raise DecodeError(str(exc)) from exc
+
+
+def load(file: typing.IO, *, backend: typing.Optional[Backend] = None) -> typing.Any:
+    """
+    Decode the JSON contents of a file.
+
+    Raise DecodeError if the contents are not valid JSON.
+
+    Args:
+        file: The file to decode.
+        backend: The library to decode with. If not set, the default is used.
+
+    Returns:
+        The decoded value.
+
+    """
+    return loads(file.read(), backend=backend)
+
+
+def dumps(
+    value: typing.Any,
+    *,
+    compact: bool = False,
+    backend: typing.Optional[Backend] = None,
+) -> str:
+    """
+    Encode a value as a JSON string.
+
+    Dates and date-times are encoded in ISO format and bytes are decoded, which is
+    the same as what to_dict does.
+
+    Raise TypeError if the value can't be encoded.
+
+    Args:
+        value: The value to encode.
+        compact: Whether to omit whitespace between items and keys and values.
+        backend: The library to encode with. If not set, the default is used.
+
+    Returns:
+        The JSON string.
+
+    """
+    return _get_codec(backend).dumps(value, compact)
@@ -1,14 +1,147 @@
-"""Facade for jsonschema."""
+"""
+Facade for jsonschema.
 
+jsonschema is only imported when it is first used because importing it is slow.
+"""
+
+import enum
 import functools
-import json
+import threading
 import typing
 
-import jsonschema
+from .. import json as json_facade
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import jsonschema
+
+
+def __getattr__(name: str) -> typing.Any:
+    """Re-map the ValidationError of jsonschema, importing it on first use."""
+    if name == "ValidationError":
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import jsonschema
+
+        return jsonschema.ValidationError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def validate(instance: typing.Any, schema: typing.Any, **kwargs: typing.Any) -> None:
+    """
+    Validate an instance against a schema using jsonschema.validate.
+
+    Raise ValidationError if the instance is not valid.
+
+    Args:
+        instance: The instance to validate.
+        schema: The schema to validate against.
+        kwargs: Any other arguments for jsonschema.validate.
+
+    """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import jsonschema
+
+    jsonschema.validate(instance, schema, **kwargs)
+
+
+class Draft(str, enum.Enum):
+    """The JSON schema drafts a validator can be compiled for."""
+
+    DRAFT4 = "draft4"
+    DRAFT6 = "draft6"
+    DRAFT7 = "draft7"
+
 
-# Re mapping values
-ValidationError = jsonschema.ValidationError
-validate = jsonschema.validate  # pylint: disable=invalid-name
+_DRAFT_VALIDATORS: typing.Dict[Draft, str] = {
+    Draft.DRAFT4: "Draft4Validator",
+    Draft.DRAFT6: "Draft6Validator",
+    Draft.DRAFT7: "Draft7Validator",
+}
+
+
+class Validator:
+    """
+    Validator compiled once for a schema that can be re-used for many instances.
+
+    The schema is checked against the meta schema on first use only. Each thread
+    receives its own underlying jsonschema validator because the reference resolver
+    of a jsonschema validator is not safe to share across threads.
+
+    Attrs:
+        schema: The schema instances are validated against.
+        draft: The JSON schema draft to validate with. If it is not set, the draft is
+            determined based on the $schema key of the schema.
+        resolver_schema: The schema that references are resolved against. If it is
+            not set, references are resolved against the schema.
+
+    """
+
+    def __init__(
+        self,
+        *,
+        schema: typing.Dict[str, typing.Any],
+        draft: typing.Optional[Draft] = None,
+        resolver_schema: typing.Optional[typing.Dict[str, typing.Any]] = None,
+    ) -> None:
+        """Construct."""
+        self.schema = schema
+        self.draft = draft
+        self.resolver_schema = resolver_schema
+        self._validator_class: typing.Optional[typing.Any] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _get_validator_class(self) -> typing.Any:
+        """Calculate and check the validator class, only once for all threads."""
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import jsonschema
+
+        with self._lock:
+            if self._validator_class is None:
+                if self.draft is None:
+                    validator_class = jsonschema.validators.validator_for(self.schema)
+                else:
+                    validator_class = getattr(jsonschema, _DRAFT_VALIDATORS[self.draft])
+                validator_class.check_schema(self.schema)
+                self._validator_class = validator_class
+            return self._validator_class
+
+    def _get_validator(self) -> typing.Any:
+        """Retrieve the jsonschema validator for the current thread."""
+        validator = getattr(self._local, "validator", None)
+        if validator is None:
+            validator_class = self._get_validator_class()
+            if self.resolver_schema is None:
+                validator = validator_class(self.schema)
+            else:
+                # pylint: disable=import-outside-toplevel,redefined-outer-name
+                import jsonschema
+
+                validator = validator_class(
+                    self.schema,
+                    resolver=jsonschema.RefResolver.from_schema(self.resolver_schema),
+                )
+            self._local.validator = validator
+        return validator
+
+    def validate(self, instance: typing.Any) -> None:
+        """
+        Validate an instance against the schema.
+
+        Raise ValidationError if the instance is not valid.
+        Raise SchemaError if the schema is not valid.
+
+        Args:
+            instance: The instance to validate.
+
+        """
+        # pylint: disable=import-outside-toplevel,redefined-outer-name
+        import jsonschema
+
+        error = jsonschema.exceptions.best_match(
+            self._get_validator().iter_errors(instance)
+        )
+        if error is not None:
+            raise error
 
 
 def _filename_to_dict(filename: str) -> typing.Dict:
@@ -23,14 +156,14 @@ def _filename_to_dict(filename: str) -> typing.Dict:
 
     """
     with open(filename) as in_file:
-        json_dict = json.loads(in_file.read())
+        json_dict = json_facade.load(in_file)
     return json_dict
 
 
 def resolver(
     *filenames: str,
 ) -> typing.Tuple[
-    jsonschema.RefResolver, typing.Tuple[typing.Dict[str, typing.Any], ...]
+    "jsonschema.RefResolver", typing.Tuple[typing.Dict[str, typing.Any], ...]
 ]:
     """
     Create resolver for references to schemas in another file.
@@ -42,6 +175,9 @@ def resolver(
         The resolver and the underlying schemas as a dictionary.
 
     """
+    # pylint: disable=import-outside-toplevel,redefined-outer-name
+    import jsonschema
+
     schema_dicts = tuple(map(_filename_to_dict, filenames))
     initial: typing.Dict[str, typing.Any] = {}
     merged_schema = functools.reduce(lambda x, y: {**x, **y}, schema_dicts, initial)
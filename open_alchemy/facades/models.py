@@ -1,5 +1,8 @@
 """Functions for interacting with the OpenAlchemy models."""
 
+import contextlib
+import contextvars
+import types as py_types
 import typing
 
 import open_alchemy
@@ -8,57 +11,121 @@ from open_alchemy import types
 from ..utility_base import TOptUtilityBase
 from ..utility_base import TUtilityBase
 
+# The namespace used instead of open_alchemy.models in the current context
+_NAMESPACE: contextvars.ContextVar[
+    typing.Optional[py_types.ModuleType]
+] = contextvars.ContextVar("open_alchemy_models_namespace", default=None)
+
+
+def get_namespace() -> py_types.ModuleType:
+    """
+    Get the namespace the models are defined on in the current context.
+
+    Returns:
+        The namespace that is in use or open_alchemy.models if no namespace is in use.
 
-def get_base() -> typing.Any:
+    """
+    namespace = _NAMESPACE.get()
+    if namespace is None:
+        return open_alchemy.models
+    return namespace
+
+
+@contextlib.contextmanager
+def use_namespace(
+    namespace: py_types.ModuleType,
+) -> typing.Iterator[py_types.ModuleType]:
+    """
+    Define and retrieve the models on a namespace in the current context.
+
+    Args:
+        namespace: The namespace to use instead of open_alchemy.models.
+
+    Returns:
+        The namespace.
+
+    """
+    token = _NAMESPACE.set(namespace)
+    try:
+        yield namespace
+    finally:
+        _NAMESPACE.reset(token)
+
+
+def get_base(*, namespace: typing.Optional[py_types.ModuleType] = None) -> typing.Any:
     """
     Get the models.Base used as the declarative base for models.
 
+    Args:
+        namespace: The namespace of the models. Defaults to the namespace of the
+            current context.
+
     Returns:
         The models.Base.
 
     """
-    # pylint: disable=no-member
-    return open_alchemy.models.Base  # type: ignore
+    if namespace is None:
+        namespace = get_namespace()
+    return namespace.Base  # type: ignore
 
 
-def get_model(*, name: str) -> TOptUtilityBase:
+def get_model(
+    *, name: str, namespace: typing.Optional[py_types.ModuleType] = None
+) -> TOptUtilityBase:
     """
     Get a model by name from models.
 
     Args:
         name: The name of the model.
+        namespace: The namespace of the models. Defaults to the namespace of the
+            current context.
 
     Returns:
         The model with the name.
 
     """
-    return getattr(open_alchemy.models, name, None)
+    if namespace is None:
+        namespace = get_namespace()
+    return getattr(namespace, name, None)
 
 
-def get_model_schema(*, name: str) -> typing.Optional[types.Schema]:
+def get_model_schema(
+    *, name: str, namespace: typing.Optional[py_types.ModuleType] = None
+) -> typing.Optional[types.Schema]:
     """
     Get the schema of a model by name from models.
 
     Args:
         name: The name of the model.
+        namespace: The namespace of the models. Defaults to the namespace of the
+            current context.
 
     Returns:
         The schema of the model with the name.
 
     """
-    model = get_model(name=name)
+    model = get_model(name=name, namespace=namespace)
     if model is None:
         return None
     return model._schema  # pylint: disable=protected-access
 
 
-def set_model(*, name: str, model: TUtilityBase) -> None:
+def set_model(
+    *,
+    name: str,
+    model: TUtilityBase,
+    namespace: typing.Optional[py_types.ModuleType] = None,
+) -> None:
     """
     Set model by name on models.
 
     Args:
         model: The model to set.
         name: The name of the model.
+        namespace: The namespace of the models. Defaults to the namespace of the
+            current context.
 
     """
-    setattr(open_alchemy.models, name, model)
+    if namespace is None:
+        namespace = get_namespace()
+    setattr(namespace, name, model)
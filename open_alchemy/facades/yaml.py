@@ -0,0 +1,79 @@
+"""Facade for PyYAML that uses the C loader of libyaml when it is available."""
+
+import typing
+
+
+class DecodeError(ValueError):
+    """Raised when a value is not valid YAML."""
+
+
+def _import() -> typing.Any:
+    """
+    Import PyYAML.
+
+    Raise ImportError if PyYAML is not installed.
+
+    Returns:
+        The yaml module.
+
+    """
+    try:
+        import yaml  # pylint: disable=import-outside-toplevel
+    except ImportError as exc:
+        raise ImportError(
+            "Loading YAML requires the pyyaml package. Try `pip install pyyaml`."
+        ) from exc
+    return yaml
+
+
+def get_loader() -> typing.Any:
+    """
+    Get the safe loader, preferring the faster loader implemented using libyaml.
+
+    Raise ImportError if PyYAML is not installed.
+
+    Returns:
+        The CSafeLoader if PyYAML was built with libyaml and the SafeLoader otherwise.
+
+    """
+    yaml = _import()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load(stream: typing.Union[str, bytes, typing.IO]) -> typing.Any:
+    """
+    Decode YAML safely.
+
+    Raise ImportError if PyYAML is not installed.
+    Raise yaml.YAMLError if the contents are not valid YAML.
+
+    Args:
+        stream: The YAML string or file to decode.
+
+    Returns:
+        The decoded value.
+
+    """
+    yaml = _import()
+    return yaml.load(stream, Loader=get_loader())
+
+
+def loads(value: typing.Union[str, bytes]) -> typing.Any:
+    """
+    Decode a YAML string safely.
+
+    Raise ImportError if PyYAML is not installed.
+    Raise DecodeError if the value is not valid YAML.
+
+    Args:
+        value: The YAML string to decode.
+
+    Returns:
+        The decoded value.
+
+    """
+    yaml = _import()
+    try:
+        return yaml.load(value, Loader=get_loader())
+    except yaml.YAMLError as exc:
+        raise DecodeError(str(exc)) from exc
@@ -15,3 +15,4 @@ from . import schema as schema
 from . import type_ as type_
 from .calculate_nullable import calculate_nullable as calculate_nullable
 from .define_all import define_all as define_all
+from .define_all import define_lazy as define_lazy
@@ -1,5 +1,8 @@
 """Define all the models with x-tablename properties."""
 
+import threading
+import typing
+
 from .. import types
 from . import inheritance as inheritance_helper
 from . import schema as schema_helper
@@ -22,3 +25,103 @@ def define_all(*, model_factory: types.ModelFactory, schemas: types.Schemas) ->
             for parent in parents:
                 model_factory(name=parent)
         model_factory(name=name)
+
+
+def calculate_dependencies(
+    *, artifacts: types.ModelsModelArtifacts
+) -> typing.Dict[str, typing.Set[str]]:
+    """
+    Calculate the models each model directly depends on.
+
+    A model depends on the models that have to be defined before its mapper can be
+    configured, which are its parent for inheritance, the models it has a
+    relationship to, the association tables of its many-to-many relationships and
+    the tables its foreign keys refer to. Children and the models that define a back
+    reference on it are not needed by its mapper and are not dependencies.
+
+    Args:
+        artifacts: The artifacts of each model.
+
+    Returns:
+        The names of the models each model depends on.
+
+    """
+    tablename_models: typing.Dict[str, typing.List[str]] = {}
+    for name, model_artifacts in artifacts.items():
+        tablename_models.setdefault(model_artifacts.tablename, []).append(name)
+
+    dependencies: typing.Dict[str, typing.Set[str]] = {}
+    for name, model_artifacts in artifacts.items():
+        model_dependencies: typing.Set[str] = set()
+
+        if model_artifacts.inherits and model_artifacts.parent is not None:
+            model_dependencies.add(model_artifacts.parent)
+
+        for _, property_artifacts in model_artifacts.properties:
+            if isinstance(property_artifacts, types.RelationshipPropertyArtifacts):
+                model_dependencies.add(property_artifacts.parent)
+            if isinstance(
+                property_artifacts, types.ManyToManyRelationshipPropertyArtifacts
+            ):
+                model_dependencies.update(
+                    tablename_models.get(property_artifacts.secondary, [])
+                )
+            if (
+                isinstance(property_artifacts, types.SimplePropertyArtifacts)
+                and property_artifacts.extension.foreign_key is not None
+            ):
+                tablename = property_artifacts.extension.foreign_key.split(".")[0]
+                model_dependencies.update(tablename_models.get(tablename, []))
+
+        model_dependencies.discard(name)
+        dependencies[name] = model_dependencies
+
+    return dependencies
+
+
+def define_lazy(
+    *, model_factory: types.ModelFactory, artifacts: types.ModelsModelArtifacts
+) -> types.ModelFactory:
+    """
+    Create a model factory that also defines all the models a model depends on.
+
+    The models a model depends on have to be defined before the SQLAlchemy mappers
+    are configured. They are only defined the first time a model is requested. A
+    model is only recorded as defined once it and all the models it depends on have
+    been constructed so that it is defined again if constructing any of them fails.
+    The factory can be called from multiple threads.
+
+    Args:
+        model_factory: Factory used to construct models.
+        artifacts: The artifacts of each model.
+
+    Returns:
+        The model factory.
+
+    """
+    dependencies = calculate_dependencies(artifacts=artifacts)
+    defined: typing.Set[str] = set()
+    # Re-entrant because constructing a model may retrieve other models
+    lock = threading.RLock()
+
+    def _define(*, name: str) -> typing.Type:
+        """Define a model and all the models it depends on."""
+        with lock:
+            model = model_factory(name=name)
+            if name in defined:
+                return model
+
+            constructed = {name}
+            pending = list(dependencies.get(name, ()))
+            while pending:
+                dependency = pending.pop()
+                if dependency in constructed or dependency in defined:
+                    continue
+                model_factory(name=dependency)
+                constructed.add(dependency)
+                pending.extend(dependencies.get(dependency, ()))
+
+            defined.update(constructed)
+            return model
+
+    return _define
@@ -1,5 +1,6 @@
 """Read the value of an extension property, validate the schema and return it."""
 
+import functools
 import json
 import os
 import typing
@@ -11,9 +12,125 @@ from open_alchemy import types
 _DIRECTORY = os.path.dirname(__file__)
 _SCHEMAS_FILE = os.path.join(_DIRECTORY, "extension-schemas.json")
 _COMMON_SCHEMAS_FILE = os.path.join(_DIRECTORY, "common-schemas.json")
-_resolver, (_SCHEMAS, _) = facades.jsonschema.resolver(  # pylint: disable=invalid-name
-    _SCHEMAS_FILE, _COMMON_SCHEMAS_FILE
-)
+
+
+# The python types of the extension properties whose schema only defines the type
+_SCALAR_TYPES: typing.Dict[str, typing.Tuple[typing.Type, ...]] = {
+    "boolean": (bool,),
+    "string": (str,),
+    "integer": (int,),
+    "number": (int, float),
+}
+# The maximum number of valid values that are remembered
+_MAX_VALID = 4096
+
+
+@functools.lru_cache(maxsize=None)
+def _get_schemas() -> typing.Tuple[typing.Dict[str, typing.Any], typing.Dict]:
+    """Load the extension property schemas and the schema to resolve references."""
+    _, (schemas, common_schemas) = facades.jsonschema.resolver(
+        _SCHEMAS_FILE, _COMMON_SCHEMAS_FILE
+    )
+    return schemas, {**schemas, **common_schemas}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_validator(name: str) -> facades.jsonschema.Validator:
+    """
+    Compile the validator of an extension property once.
+
+    Raise MalformedExtensionPropertyError if the extension property has no schema.
+
+    """
+    schemas, resolver_schema = _get_schemas()
+    schema = schemas.get(name)
+    if schema is None:
+        raise exceptions.MalformedExtensionPropertyError(
+            f"The {json.dumps(name)} extension property is not known."
+        )
+    return facades.jsonschema.Validator(schema=schema, resolver_schema=resolver_schema)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_scalar_types(name: str) -> typing.Optional[typing.Tuple[typing.Type, ...]]:
+    """Calculate the python types of an extension property that only defines a type."""
+    schemas, _ = _get_schemas()
+    schema = schemas.get(name)
+    if (
+        schema is None
+        or set(schema.keys()) - {"description"} != {"type"}
+        or not isinstance(schema["type"], str)
+    ):
+        return None
+    return _SCALAR_TYPES.get(schema["type"])
+
+
+def _freeze(value: typing.Any) -> typing.Hashable:
+    """
+    Convert a JSON like value to a hashable value that is only equal for equal values.
+
+    Raise TypeError if the value contains a value that is not hashable.
+
+    """
+    if isinstance(value, dict):
+        return (
+            dict,
+            frozenset((key, _freeze(sub_value)) for key, sub_value in value.items()),
+        )
+    if isinstance(value, list):
+        return (list, tuple(map(_freeze, value)))
+    hash(value)
+    return (type(value), value)
+
+
+def _thaw(frozen: typing.Hashable) -> typing.Any:
+    """Convert a value converted by _freeze back to the JSON like value."""
+    type_, value = typing.cast(typing.Tuple[typing.Type, typing.Any], frozen)
+    if type_ is dict:
+        return {key: _thaw(sub_value) for key, sub_value in value}
+    if type_ is list:
+        return list(map(_thaw, value))
+    return value
+
+
+@functools.lru_cache(maxsize=_MAX_VALID)
+def _validate_frozen(name: str, frozen: typing.Hashable) -> None:
+    """
+    Validate a frozen value, remembering the most recently used valid values.
+
+    Raise ValidationError if the value is not valid.
+
+    """
+    _get_validator(name).validate(_thaw(frozen))
+
+
+def _validate(*, name: str, value: typing.Any) -> None:
+    """
+    Validate the value of an extension property.
+
+    Values that only need their type to be checked are checked directly. Any other
+    values are validated using the compiled validator of the extension property and
+    remembered if they are valid.
+
+    Raise ValidationError if the value is not valid.
+    Raise MalformedExtensionPropertyError if the extension property has no schema.
+
+    """
+    scalar_types = _get_scalar_types(name)
+    # bool is a subclass of int but not a JSON integer or number
+    if (
+        scalar_types is not None
+        and isinstance(value, scalar_types)
+        and (bool in scalar_types or not isinstance(value, bool))
+    ):
+        return
+
+    try:
+        frozen = _freeze(value)
+    except TypeError:
+        _get_validator(name).validate(value)
+        return
+    _validate_frozen(name, frozen)
 
 
 def get(
@@ -63,14 +180,14 @@ def get(
             f"The value of the {name} extension property cannot be null."
         )
 
-    schema = _SCHEMAS.get(name)
     try:
-        facades.jsonschema.validate(instance=value, schema=schema, resolver=_resolver)
+        _validate(name=name, value=value)
     except facades.jsonschema.ValidationError as exc:
+        schemas, _ = _get_schemas()
         raise exceptions.MalformedExtensionPropertyError(
             f"The value of the {json.dumps(name)} extension property is not "
             "valid. "
-            f"The expected schema is {json.dumps(schema)}. "
+            f"The expected schema is {json.dumps(schemas.get(name))}. "
             f"The given value is {json.dumps(value)}."
         ) from exc
     if pop:
@@ -1,14 +1,17 @@
 """Used to resolve schema references."""
 
-import functools
-import json
+import contextlib
+import contextvars
+import copy
+import logging
 import os
 import re
+import threading
 import typing
-from urllib import error
-from urllib import request
 
+from open_alchemy import cache
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import types
 
 _REF_PATTER = re.compile(r"^#\/components\/schemas\/(\w+)$")
@@ -226,32 +229,53 @@ def _add_remote_context(*, context: str, ref: str) -> str:
     return f"{context_hostname}{norm_new_ref_context_path}#{ref_schema}"
 
 
-def _handle_match(match: typing.Match, *, context: str) -> str:
+def _map_remote_value_ref(value: typing.Any, *, context: str) -> typing.Any:
     """
-    Map a match to the updated value.
+    Update any $ref within a value with the remote context.
+
+    Values that don't contain any $ref that changes are returned as is so that they
+    are shared with the original value.
 
     Args:
-        match: The match to the regular expression for the reference.
-        context: The context to use to update the reference.
+        value: The value to update.
+        context: The context of the value.
 
     Returns:
-        The updated reference.
+        The value with any $ref mapped to include the context.
 
     """
-    ref = match.group(1)
-    mapped_ref = _add_remote_context(context=context, ref=ref)
-    return match.group(0).replace(ref, mapped_ref)
-
-
-# Pattern used to look for any $ref after converting the schema to JSON
-_REF_VALUE_PATTERN = re.compile(r'"\$ref": "(.*?)"')
+    if isinstance(value, dict):
+        mapped_dict = {}
+        dict_changed = False
+        for key, sub_value in value.items():
+            if key == types.OpenApiProperties.REF and isinstance(sub_value, str):
+                mapped_sub_value = _add_remote_context(context=context, ref=sub_value)
+                changed = mapped_sub_value != sub_value
+            else:
+                mapped_sub_value = _map_remote_value_ref(sub_value, context=context)
+                changed = mapped_sub_value is not sub_value
+            mapped_dict[key] = mapped_sub_value
+            dict_changed = dict_changed or changed
+        return mapped_dict if dict_changed else value
+    if isinstance(value, list):
+        mapped_list = [
+            _map_remote_value_ref(sub_value, context=context) for sub_value in value
+        ]
+        if any(
+            mapped_sub_value is not sub_value
+            for mapped_sub_value, sub_value in zip(mapped_list, value)
+        ):
+            return mapped_list
+        return value
+    return value
 
 
 def _map_remote_schema_ref(*, schema: types.Schema, context: str) -> types.Schema:
     """
     Update any $ref within the schema with the remote context.
 
-    Serialize the schema, look for $ref and update value to include context.
+    Walk the schema and update the value of any $ref to include the context. Any part
+    of the schema without a $ref that changes is shared with the original schema.
 
     Args:
         schema: The schema to update.
@@ -261,30 +285,88 @@ def _map_remote_schema_ref(*, schema: types.Schema, context: str) -> types.Schem
         The schema with any $ref mapped to include the context.
 
     """
-    # Define context for mapping
-    handle_match_context = functools.partial(_handle_match, context=context)
+    return _map_remote_value_ref(schema, context=context)
+
 
-    str_schema = json.dumps(schema)
-    mapped_str_schema = _REF_VALUE_PATTERN.sub(handle_match_context, str_schema)
-    mapped_schema = json.loads(mapped_str_schema)
-    return mapped_schema
+# The number of seconds to wait for a server to respond when loading a URL
+URL_TIMEOUT = 30.0
 
+_LOGGER = logging.getLogger(__name__)
 
-class _RemoteSchemaStore:
-    """Store remote schemas in memory to speed up use."""
+
+def _remote_contexts(
+    value: typing.Any, *, context: typing.Optional[str]
+) -> typing.Set[str]:
+    """
+    Calculate the remote contexts referenced by any $ref within a value.
+
+    Args:
+        value: The value to search for $ref.
+        context: The context of the value or None for the original OpenAPI
+            specification.
+
+    Returns:
+        The normalized remote contexts.
+
+    """
+    contexts: typing.Set[str] = set()
+    if isinstance(value, dict):
+        for key, sub_value in value.items():
+            if key == types.OpenApiProperties.REF and isinstance(sub_value, str):
+                try:
+                    if context is not None:
+                        sub_value = _add_remote_context(context=context, ref=sub_value)
+                    ref_context, _ = _separate_context_path(ref=sub_value)
+                except exceptions.BaseError:
+                    continue
+                if ref_context:
+                    contexts.add(_norm_context(context=ref_context))
+            else:
+                contexts.update(_remote_contexts(sub_value, context=context))
+    elif isinstance(value, list):
+        for sub_value in value:
+            contexts.update(_remote_contexts(sub_value, context=context))
+    return contexts
+
+
+class RemoteSchemaStore:
+    """
+    Store remote schemas in memory to speed up use.
+
+    The store can be used from multiple threads, each context is only loaded once.
+    """
 
     _schemas: typing.Dict[str, types.Schemas]
+    _mapped_schemas: typing.Dict[typing.Tuple[str, str], NameSchema]
+    _lock: threading.RLock
     spec_context: typing.Optional[str]
+    cache_dir: typing.Optional[str]
 
     def __init__(self) -> None:
         """Construct."""
         self._schemas = {}
+        self._mapped_schemas = {}
+        self._lock = threading.RLock()
         self.spec_context = None
+        self.cache_dir = None
 
     def reset(self):
         """Reset the state of the schema store."""
-        self._schemas = {}
-        self.spec_context = None
+        with self._lock:
+            self._schemas = {}
+            self._mapped_schemas = {}
+            self.spec_context = None
+            self.cache_dir = None
+
+    def contexts(self) -> typing.List[str]:
+        """
+        Retrieve the contexts for which the schemas have been loaded.
+
+        Returns:
+            The contexts in the order they were loaded.
+
+        """
+        return list(self._schemas.keys())
 
     def get_schemas(self, *, context: str) -> types.Schema:
         """
@@ -303,10 +385,34 @@ class _RemoteSchemaStore:
             The schemas.
 
         """
-        # Check whether the context is already loaded
-        if context in self._schemas:
-            return self._schemas[context]
+        with self._lock:
+            # Check whether the context is already loaded
+            if context in self._schemas:
+                return self._schemas[context]
+
+            schemas = self._load_schemas(context=context)
+
+            # Store for faster future retrieval
+            self._schemas[context] = schemas
+            return schemas
+
+    def _load_schemas(self, *, context: str) -> types.Schema:
+        """
+        Load the schemas for a context without storing them.
+
+        Raise MissingArgumentError if the context for the original OpenAPI specification
+            has not been set.
+        Raise SchemaNotFoundError if the context doesn't exist or is not a json nor yaml
+            file.
+
+        Args:
+            context: The path, relative to the original OpenAPI specification, for the
+                file containing the schemas.
 
+        Returns:
+            The schemas.
+
+        """
         if self.spec_context is None:
             raise exceptions.MissingArgumentError(
                 "Cannot find the file containing the remote reference, either "
@@ -323,48 +429,196 @@ class _RemoteSchemaStore:
                 f"{context}"
             )
 
-        # Get context manager with file
+        # Read the contents of the file, urllib is only imported here because
+        # importing it is slow
+        # pylint: disable=import-outside-toplevel
+        from urllib import request
+
         try:
-            if _URL_REF_PATTERN.search(context) is not None:
-                file_cm = request.urlopen(context)
-            else:
+            if _URL_REF_PATTERN.search(context) is None:
                 spec_dir = os.path.dirname(self.spec_context)
                 remote_spec_filename = os.path.join(spec_dir, context)
-                file_cm = open(remote_spec_filename)
-        except (FileNotFoundError, error.HTTPError) as exc:
+                with open(remote_spec_filename, "rb") as in_file:
+                    contents = in_file.read()
+            elif self.cache_dir is not None:
+                contents = cache.load_url(
+                    directory=self.cache_dir, url=context, timeout=URL_TIMEOUT
+                )
+            else:
+                with request.urlopen(context, timeout=URL_TIMEOUT) as response:
+                    contents = response.read()
+        except OSError as exc:
             raise exceptions.SchemaNotFoundError(
                 "The file with the remote reference was not found. The path is: "
                 f"{context}"
             ) from exc
 
         # Calculate location of schemas
-        with file_cm as in_file:
-            if extension == ".json":
-                try:
-                    schemas = json.load(in_file)
-                except json.JSONDecodeError as exc:
-                    raise exceptions.SchemaNotFoundError(
-                        "The remote reference file is not valid JSON. The path "
-                        f"is: {context}"
-                    ) from exc
-            else:
-                # Import as needed to make yaml optional
-                import yaml  # pylint: disable=import-outside-toplevel
+        if extension == ".json":
+            try:
+                return facades.json.loads(contents)
+            except facades.json.DecodeError as exc:
+                raise exceptions.SchemaNotFoundError(
+                    "The remote reference file is not valid JSON. The path "
+                    f"is: {context}"
+                ) from exc
 
-                try:
-                    schemas = yaml.safe_load(in_file)
-                except yaml.scanner.ScannerError as exc:
-                    raise exceptions.SchemaNotFoundError(
-                        "The remote reference file is not valid YAML. The path "
-                        f"is: {context}"
-                    ) from exc
+        try:
+            return facades.yaml.loads(contents)
+        except facades.yaml.DecodeError as exc:
+            raise exceptions.SchemaNotFoundError(
+                "The remote reference file is not valid YAML. The path "
+                f"is: {context}"
+            ) from exc
+
+    def reachable_contexts(self, *, schemas: types.Schemas) -> typing.List[str]:
+        """
+        Calculate the remote contexts reachable from the schemas, loading them.
+
+        Any context that fails to load is skipped so that the error is raised when it
+        is used.
+
+        Args:
+            schemas: The schemas of the original OpenAPI specification.
+
+        Returns:
+            The contexts that could be loaded in the order they were reached.
+
+        """
+        seen = _remote_contexts(schemas, context=None)
+        pending = sorted(seen)
+        contexts: typing.List[str] = []
+        while pending:
+            context = pending.pop(0)
+            try:
+                context_schemas = self.get_schemas(context=context)
+            except exceptions.BaseError:
+                continue
+            contexts.append(context)
+            for ref_context in sorted(
+                _remote_contexts(context_schemas, context=context) - seen
+            ):
+                seen.add(ref_context)
+                pending.append(ref_context)
+        return contexts
+
+    def prefetch(
+        self, *, schemas: types.Schemas, workers: typing.Optional[int] = None
+    ) -> None:
+        """
+        Load the schemas of all remote contexts reachable from the schemas concurrently.
+
+        The remote contexts referenced by the schemas are loaded first, followed by the
+        remote contexts referenced by the loaded schemas, and so on. Any context that
+        fails to load is logged and skipped so that the error is raised when it is used.
+
+        Args:
+            schemas: The schemas of the original OpenAPI specification.
+            workers: The maximum number of contexts loaded at the same time.
+
+        """
+        if self.spec_context is None:
+            return
+
+        from concurrent import futures  # pylint: disable=import-outside-toplevel
+
+        seen = _remote_contexts(schemas, context=None)
+        pending = sorted(context for context in seen if context not in self._schemas)
+        with futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            while pending:
+                loading = [
+                    (context, executor.submit(self._load_schemas, context=context))
+                    for context in pending
+                ]
+                pending = []
+                for context, future in loading:
+                    try:
+                        context_schemas = future.result()
+                    except Exception as exc:  # pylint: disable=broad-except
+                        _LOGGER.warning(
+                            "Could not prefetch the remote context %s: %s", context, exc
+                        )
+                        continue
+                    with self._lock:
+                        self._schemas.setdefault(context, context_schemas)
+                    for ref_context in sorted(
+                        _remote_contexts(context_schemas, context=context) - seen
+                    ):
+                        seen.add(ref_context)
+                        if ref_context not in self._schemas:
+                            pending.append(ref_context)
+
+    def get_mapped_schema(self, *, context: str, path: str) -> NameSchema:
+        """
+        Retrieve the schema at a path of a context with any $ref mapped to the context.
+
+        Raise MissingArgumentError if the context for the original OpenAPI specification
+            has not been set.
+        Raise SchemaNotFoundError if the context doesn't exist, is not a json nor yaml
+            file or the schema is not found at the path.
+
+        Args:
+            context: The path, relative to the original OpenAPI specification, for the
+                file containing the schemas.
+            path: The location of the schema in the file.
+
+        Returns:
+            The name of the schema and a copy of the schema with any $ref mapped to
+            include the context so that changing it does not change the stored schema.
+
+        """
+        key = (context, path)
+        with self._lock:
+            if key not in self._mapped_schemas:
+                schemas = self.get_schemas(context=context)
+                name, schema = _retrieve_schema(schemas=schemas, path=path)
+                mapped_schema = _map_remote_schema_ref(schema=schema, context=context)
+
+                # Store for faster future retrieval
+                self._mapped_schemas[key] = (name, mapped_schema)
+            name, mapped_schema = self._mapped_schemas[key]
 
-        # Store for faster future retrieval
-        self._schemas[context] = schemas
-        return schemas
+        return name, copy.deepcopy(mapped_schema)
 
 
-_remote_schema_store = _RemoteSchemaStore()  # pylint: disable=invalid-name
+_remote_schema_store = RemoteSchemaStore()  # pylint: disable=invalid-name
+# The store used instead of the default store in the current context
+_STORE: contextvars.ContextVar[
+    typing.Optional[RemoteSchemaStore]
+] = contextvars.ContextVar("open_alchemy_remote_schema_store", default=None)
+
+
+def get_store() -> RemoteSchemaStore:
+    """
+    Retrieve the remote schema store of the current context.
+
+    Returns:
+        The store that is in use or the default store if no store is in use.
+
+    """
+    store = _STORE.get()
+    if store is None:
+        return _remote_schema_store
+    return store
+
+
+@contextlib.contextmanager
+def use_store(store: RemoteSchemaStore) -> typing.Iterator[RemoteSchemaStore]:
+    """
+    Use a remote schema store instead of the default store in the current context.
+
+    Args:
+        store: The store to use.
+
+    Returns:
+        The store.
+
+    """
+    token = _STORE.set(store)
+    try:
+        yield store
+    finally:
+        _STORE.reset(token)
 
 
 def set_context(*, path: str) -> None:
@@ -375,7 +629,82 @@ def set_context(*, path: str) -> None:
         path: The path to the OpenAPI specification
 
     """
-    _remote_schema_store.spec_context = path
+    get_store().spec_context = path
+
+
+def set_cache_dir(*, directory: typing.Optional[str]) -> None:
+    """
+    Set the directory to cache documents retrieved from URLs in.
+
+    Args:
+        directory: The directory of the cache or None to not cache the documents.
+
+    """
+    get_store().cache_dir = directory
+
+
+def prefetch(*, schemas: types.Schemas) -> None:
+    """
+    Load the schemas of all remote contexts reachable from the schemas concurrently.
+
+    Args:
+        schemas: The schemas of the original OpenAPI specification.
+
+    """
+    get_store().prefetch(schemas=schemas)
+
+
+def get_context() -> typing.Optional[str]:
+    """
+    Retrieve the context for the initial OpenAPI specification.
+
+    Returns:
+        The path to the OpenAPI specification or None if it has not been set.
+
+    """
+    return get_store().spec_context
+
+
+def get_remote_contexts() -> typing.List[str]:
+    """
+    Retrieve the contexts of all remote schemas that have been loaded.
+
+    Returns:
+        The contexts of the loaded remote schemas.
+
+    """
+    return get_store().contexts()
+
+
+def get_reachable_contexts(*, schemas: types.Schemas) -> typing.List[str]:
+    """
+    Calculate the remote contexts reachable from the schemas, loading them.
+
+    Args:
+        schemas: The schemas of the original OpenAPI specification.
+
+    Returns:
+        The contexts of the remote schemas that could be loaded.
+
+    """
+    return get_store().reachable_contexts(schemas=schemas)
+
+
+def get_remote_schemas(*, context: str) -> types.Schema:
+    """
+    Retrieve the remote schemas for a context, loading them if required.
+
+    Raise SchemaNotFoundError if the context doesn't exist or is not a json nor yaml
+        file.
+
+    Args:
+        context: The context of the remote schemas.
+
+    Returns:
+        The remote schemas.
+
+    """
+    return get_store().get_schemas(context=context)
 
 
 def _retrieve_schema(*, schemas: types.Schemas, path: str) -> NameSchema:
@@ -426,7 +755,4 @@ def get_remote_ref(*, ref: str) -> NameSchema:
     """
     context, path = _separate_context_path(ref=ref)
     context = _norm_context(context=context)
-    schemas = _remote_schema_store.get_schemas(context=context)
-    name, schema = _retrieve_schema(schemas=schemas, path=path)
-    schema = _map_remote_schema_ref(schema=schema, context=context)
-    return name, schema
+    return get_store().get_mapped_schema(context=context, path=path)
@@ -4,6 +4,7 @@ import typing
 
 from . import column_factory
 from . import exceptions
+from . import facades
 from . import helpers
 from . import mixins
 from . import table_args
@@ -25,6 +26,11 @@ def model_factory(
     get_base: GetBase,
     schemas: types.Schemas,
     artifacts: types.ModelsModelArtifacts,
+    json_schema_draft: typing.Optional[facades.jsonschema.Draft] = None,
+    json_backend: typing.Optional[facades.json.Backend] = None,
+    validation_level: utility_base.validation.Level = (
+        utility_base.validation.Level.FULL
+    ),
 ) -> typing.Type:
     """
     Convert OpenAPI schema to SQLAlchemy model.
@@ -34,6 +40,11 @@ def model_factory(
         get_base: Funcrtion to retrieve the base class for the model.
         schemas: The OpenAPI schemas.
         artifacts: The artifacts for the models.
+        json_schema_draft: The JSON schema draft used to validate dictionaries passed
+            to from_dict. If not set, the draft is determined based on the schema.
+        json_backend: The library the model uses to encode and decode JSON. If not
+            set, the default backend of the JSON facade is used.
+        validation_level: The validation of the dictionaries passed to from_dict.
 
     Returns:
         The model as a class.
@@ -87,11 +98,32 @@ def model_factory(
 
     # Assembling model
     base = get_base(name=name, schemas=schemas)
+    namespace = facades.models.get_namespace()
+    resolved_properties = utility_base.resolved.resolve_properties(
+        properties=model_schema[types.OpenApiProperties.PROPERTIES]
+    )
     return type(
         name,
         (base, utility_base.UtilityBase, *mixin_classes),
         {
             "_schema": model_schema,
+            "_validator": facades.jsonschema.Validator(
+                schema=model_schema, draft=json_schema_draft
+            ),
+            "_resolved_properties": resolved_properties,
+            "_from_dict_plan": utility_base.from_dict.compile_plan(
+                properties=model_schema[types.OpenApiProperties.PROPERTIES],
+                resolved_properties=resolved_properties,
+                namespace=namespace,
+            ),
+            "_to_dict_plan": utility_base.to_dict.compile_plan(
+                schema=model_schema, resolved_properties=resolved_properties
+            ),
+            "_validation_level": utility_base.validation.Level(validation_level),
+            "_json_backend": (
+                None if json_backend is None else facades.json.Backend(json_backend)
+            ),
+            "_models": namespace,
             **model_class_vars,
             "__table_args__": table_args.construct(schema=schema),
             **_get_kwargs(schema=schema),
@@ -1,5 +1,7 @@
 """Performs operations on the schemas to prepare them for further processing."""
 
+import typing
+
 from .. import types as _types
 from . import artifacts
 from . import association
@@ -9,18 +11,40 @@ from . import helpers
 from . import validation
 
 
-def process(*, schemas: _types.Schemas) -> None:
+def process(
+    *,
+    schemas: _types.Schemas,
+    validation_workers: typing.Optional[int] = None,
+    validation_executor: validation.Executor = validation.Executor.PROCESS,
+) -> None:
     """
     Pre-process schemas.
 
     The processing actions executed are:
-    1. Calculate the back references.
+    1. Validate the schemas,
+    2. calculate the back references,
+    3. calculate the foreign keys and
+    4. calculate the association tables.
+
+    The values resolved from the schemas are shared by all stages through an index.
 
     Args:
         schemas: The schemas to pre-process in place.
+        validation_workers: The number of workers used to validate the models in
+            parallel. If not set, the models are validated one after the other.
+        validation_executor: The kind of pool used to validate the models in
+            parallel.
 
     """
-    validation.process(schemas=schemas)
-    backref.process(schemas=schemas)
-    foreign_key.process(schemas=schemas)
-    association.process(schemas=schemas)
+    with helpers.index.build(schemas=schemas) as index:
+        validation.process(
+            schemas=schemas, workers=validation_workers, executor=validation_executor
+        )
+        # The stages add schemas and properties so the constructable schemas and the
+        # properties of each schema are calculated again after each of them
+        backref.process(schemas=schemas)
+        index.invalidate()
+        foreign_key.process(schemas=schemas)
+        index.invalidate()
+        association.process(schemas=schemas)
+        index.invalidate()
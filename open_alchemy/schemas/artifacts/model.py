@@ -36,7 +36,8 @@ def get(
     """
     Retrieve the artifacts for the model.
 
-    Assume that the schema is valid.
+    Assume that the schema is valid. The artifacts are memoised if an index is active
+    for the schemas.
 
     Args:
         schema: The model schema.
@@ -46,6 +47,19 @@ def get(
         The artifacts for the model.
 
     """
+    return helpers.index.memoise(
+        schemas=schemas,
+        kind="model_artifacts",
+        schema=schema,
+        calculate=lambda: _get(schemas, schema),
+        derived=True,
+    )
+
+
+def _get(
+    schemas: oa_types.Schemas, schema: oa_types.Schema
+) -> types.ModelExPropertiesArtifacts:
+    """Implement get."""
     tablename = oa_helpers.peek.prefer_local(
         get_value=oa_helpers.peek.tablename, schema=schema, schemas=schemas
     )
@@ -2,6 +2,7 @@
 
 from .... import helpers as oa_helpers
 from .... import types as oa_types
+from ... import helpers
 from .. import types
 from . import backref
 from . import json
@@ -19,6 +20,8 @@ def get(
     """
     Retrieve the artifacts for a property.
 
+    The artifacts are memoised if an index is active for the schemas.
+
     Args:
         schemas: All the defined schemas.
         model_schema: The schema that contains the property.
@@ -30,6 +33,24 @@ def get(
         The artifacts for the property.
 
     """
+    return helpers.index.memoise_property(
+        schemas=schemas,
+        kind=("property_artifacts", required),
+        schema=model_schema,
+        property_name=property_name,
+        property_schema=schema,
+        calculate=lambda: _get(schemas, model_schema, property_name, schema, required),
+    )
+
+
+def _get(
+    schemas: oa_types.Schemas,
+    model_schema: oa_types.Schema,
+    property_name: str,
+    schema: oa_types.Schema,
+    required: bool,
+) -> types.TAnyPropertyArtifacts:
+    """Implement get."""
     type_ = oa_helpers.property_.calculate_type(schema=schema, schemas=schemas)
 
     if type_ == oa_types.PropertyType.SIMPLE:
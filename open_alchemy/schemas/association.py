@@ -73,18 +73,14 @@ def _get_tablename_schema_names(
     # Get mapping of tablename to parent schema name
     constructables = helpers.iterate.constructable(schemas=schemas)
     not_single_inheritance_constructables = filter(
-        lambda args: oa_helpers.inheritance.calculate_type(
-            schema=args[1], schemas=schemas
-        )
+        lambda args: helpers.index.inheritance_type(schema=args[1], schemas=schemas)
         != oa_helpers.inheritance.Type.SINGLE_TABLE,
         constructables,
     )
     tablename_parent_name_map = dict(
         map(
             lambda args: (
-                oa_helpers.peek.prefer_local(
-                    get_value=oa_helpers.peek.tablename, schema=args[1], schemas=schemas
-                ),
+                helpers.index.tablename(schema=args[1], schemas=schemas),
                 args[0],
             ),
             not_single_inheritance_constructables,
@@ -96,9 +92,7 @@ def _get_tablename_schema_names(
     name_tablenames = map(
         lambda args: (
             args[0],
-            oa_helpers.peek.prefer_local(
-                get_value=oa_helpers.peek.tablename, schema=args[1], schemas=schemas
-            ),
+            helpers.index.tablename(schema=args[1], schemas=schemas),
         ),
         constructables,
     )
@@ -108,6 +102,7 @@ def _get_tablename_schema_names(
 
     mapping: _TTablenameParentAllNames = {}
     for name, tablename in filtered_name_tablenames:
+        assert tablename is not None
         if tablename not in mapping:
             mapping[tablename] = _TParentAllNames(
                 parent_name=tablename_parent_name_map[tablename], all_names=[]
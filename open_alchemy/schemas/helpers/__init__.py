@@ -3,5 +3,6 @@
 from . import association
 from . import backref
 from . import clean
+from . import index
 from . import iterate
 from . import process
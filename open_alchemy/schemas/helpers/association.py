@@ -166,9 +166,7 @@ def calculate_property_schema(
     assert next(primary_key_properties, None) is None
 
     # Get artifacts
-    tablename = oa_helpers.peek.prefer_local(
-        get_value=oa_helpers.peek.tablename, schema=schema, schemas=schemas
-    )
+    tablename = helpers.index.tablename(schema=schema, schemas=schemas)
     primary_key_property_name, primary_key_property_schema = primary_key_property
     type_ = oa_helpers.peek.type_(schema=primary_key_property_schema, schemas=schemas)
     format_ = oa_helpers.peek.format_(
@@ -0,0 +1,261 @@
+"""Index of the values resolved from the schemas shared by the processing stages."""
+
+import contextlib
+import contextvars
+import typing
+
+from ... import helpers as oa_helpers
+from ... import types
+
+TValue = typing.TypeVar("TValue")
+_TKey = typing.Tuple[typing.Hashable, int]
+_TEntry = typing.Tuple[types.Schema, typing.Any]
+
+
+class Index:
+    """
+    Memoises values resolved from the schemas of a spec.
+
+    Values are keyed by the identity of the schema they were resolved from and the
+    schema is kept with the value so that the identity can't be re-used. The stages
+    only add schemas and replace schemas with an allOf that adds properties or back
+    references. This means that the constructability, inheritance and tablename of a
+    schema don't change whereas values that depend on the properties do. These are
+    recorded as derived values which are cleared using invalidate after a stage has
+    modified the schemas.
+
+    Attrs:
+        schemas: The schemas the values are resolved from.
+
+    """
+
+    def __init__(self, *, schemas: types.Schemas) -> None:
+        """Construct."""
+        self.schemas = schemas
+        self._values: typing.Dict[_TKey, _TEntry] = {}
+        self._derived_values: typing.Dict[_TKey, _TEntry] = {}
+
+    def memoise(
+        self,
+        *,
+        kind: typing.Hashable,
+        schema: types.Schema,
+        calculate: typing.Callable[[], TValue],
+        derived: bool = False,
+    ) -> TValue:
+        """
+        Retrieve a value for a schema, calculating it only on the first retrieval.
+
+        Any exception raised by calculate is not recorded.
+
+        Args:
+            kind: Identifies the value for the schema.
+            schema: The schema the value is resolved from.
+            calculate: Calculates the value.
+            derived: Whether the value is cleared by invalidate.
+
+        Returns:
+            The value for the schema.
+
+        """
+        values = self._derived_values if derived else self._values
+        key = (kind, id(schema))
+        entry = values.get(key)
+        if entry is not None and entry[0] is schema:
+            return entry[1]
+        value = calculate()
+        values[key] = (schema, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Clear all derived values."""
+        self._derived_values.clear()
+
+
+_INDEX: contextvars.ContextVar[typing.Optional[Index]] = contextvars.ContextVar(
+    "open_alchemy_schemas_index", default=None
+)
+
+
+@contextlib.contextmanager
+def build(*, schemas: types.Schemas) -> typing.Iterator[Index]:
+    """
+    Build the index for the schemas which is active until the context is exited.
+
+    If an index is already active for the schemas, it is re-used so that the values are
+    shared with the enclosing context.
+
+    Args:
+        schemas: The schemas to index.
+
+    Returns:
+        The index.
+
+    """
+    active_index = get(schemas=schemas)
+    if active_index is not None:
+        yield active_index
+        return
+
+    index = Index(schemas=schemas)
+    token = _INDEX.set(index)
+    try:
+        yield index
+    finally:
+        _INDEX.reset(token)
+
+
+def get(*, schemas: types.Schemas) -> typing.Optional[Index]:
+    """
+    Retrieve the active index for the schemas.
+
+    Args:
+        schemas: All the schemas.
+
+    Returns:
+        The index or None if no index is active for the schemas.
+
+    """
+    index = _INDEX.get()
+    if index is None or index.schemas is not schemas:
+        return None
+    return index
+
+
+def memoise(
+    *,
+    schemas: types.Schemas,
+    kind: typing.Hashable,
+    schema: types.Schema,
+    calculate: typing.Callable[[], TValue],
+    derived: bool = False,
+) -> TValue:
+    """
+    Retrieve a value for a schema from the active index for the schemas.
+
+    Calculates the value without memoising it if no index is active for the schemas.
+
+    Args:
+        schemas: All the schemas.
+        kind: Identifies the value for the schema.
+        schema: The schema the value is resolved from.
+        calculate: Calculates the value.
+        derived: Whether the value depends on the properties of the schemas.
+
+    Returns:
+        The value for the schema.
+
+    """
+    index = get(schemas=schemas)
+    if index is None:
+        return calculate()
+    return index.memoise(kind=kind, schema=schema, calculate=calculate, derived=derived)
+
+
+def memoise_property(
+    *,
+    schemas: types.Schemas,
+    kind: typing.Hashable,
+    schema: types.Schema,
+    property_name: str,
+    property_schema: types.Schema,
+    calculate: typing.Callable[[], TValue],
+) -> TValue:
+    """
+    Retrieve a value for a property of a schema from the active index for the schemas.
+
+    The value is recorded as a derived value. Calculates the value without memoising it
+    if no index is active for the schemas.
+
+    Args:
+        schemas: All the schemas.
+        kind: Identifies the value for the property.
+        schema: The schema the property is on.
+        property_name: The name of the property.
+        property_schema: The schema of the property.
+        calculate: Calculates the value.
+
+    Returns:
+        The value for the property.
+
+    """
+    index = get(schemas=schemas)
+    if index is None:
+        return calculate()
+    values: typing.Dict[str, _TEntry] = index.memoise(
+        kind=kind, schema=schema, calculate=dict, derived=True
+    )
+    entry = values.get(property_name)
+    if entry is not None and entry[0] is property_schema:
+        return entry[1]
+    value = calculate()
+    values[property_name] = (property_schema, value)
+    return value
+
+
+def tablename(*, schema: types.Schema, schemas: types.Schemas) -> typing.Optional[str]:
+    """
+    Retrieve the tablename of a schema, preferring the local value.
+
+    Args:
+        schema: The schema to get the tablename for.
+        schemas: All the schemas.
+
+    Returns:
+        The tablename.
+
+    """
+    return memoise(
+        schemas=schemas,
+        kind="tablename",
+        schema=schema,
+        calculate=lambda: oa_helpers.peek.prefer_local(
+            get_value=oa_helpers.peek.tablename, schema=schema, schemas=schemas
+        ),
+    )
+
+
+def inheritance_type(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> oa_helpers.inheritance.Type:
+    """
+    Calculate the inheritance type of a schema.
+
+    Args:
+        schema: The schema to calculate the inheritance type for.
+        schemas: All the schemas.
+
+    Returns:
+        The inheritance type.
+
+    """
+    return memoise(
+        schemas=schemas,
+        kind="inheritance_type",
+        schema=schema,
+        calculate=lambda: oa_helpers.inheritance.calculate_type(
+            schema=schema, schemas=schemas
+        ),
+    )
+
+
+def parent(*, schema: types.Schema, schemas: types.Schemas) -> str:
+    """
+    Retrieve the name of the parent of a schema that inherits.
+
+    Args:
+        schema: The schema to get the parent of.
+        schemas: All the schemas.
+
+    Returns:
+        The name of the parent.
+
+    """
+    return memoise(
+        schemas=schemas,
+        kind="parent",
+        schema=schema,
+        calculate=lambda: oa_helpers.inheritance.retrieve_parent(
+            schema=schema, schemas=schemas
+        ),
+    )
@@ -6,6 +6,39 @@ import typing
 from ... import exceptions
 from ... import helpers
 from ... import types
+from . import index
+
+
+def _constructable(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[bool]:
+    """
+    Calculate whether a schema is constructable.
+
+    Args:
+        schema: The schema to check.
+        schemas: All the schemas.
+
+    Returns:
+        Whether the schema is constructable or None if that can't be determined.
+
+    """
+    return index.memoise(
+        schemas=schemas,
+        kind="constructable",
+        schema=schema,
+        calculate=lambda: _calculate_constructable(schema=schema, schemas=schemas),
+    )
+
+
+def _calculate_constructable(
+    *, schema: types.Schema, schemas: types.Schemas
+) -> typing.Optional[bool]:
+    """Implement _constructable."""
+    try:
+        return helpers.schema.constructable(schema=schema, schemas=schemas)
+    except (exceptions.MalformedSchemaError, exceptions.SchemaNotFoundError):
+        return None
 
 
 def constructable(
@@ -15,7 +48,8 @@ def constructable(
     Create an iterable with all constructable schemas from all schemas.
 
     Iterates over all items in the schemas, checks whether a schema is constructable and
-    yields those that are.
+    yields those that are. If an index is active for the schemas, the constructable
+    schemas are only calculated once until the index is invalidated.
 
     Args:
         schemas: The schemas to iterate over.
@@ -24,11 +58,25 @@ def constructable(
         iterable with all schemas that are constructable.
 
     """
+    index_ = index.get(schemas=schemas)
+    if index_ is None:
+        yield from _constructable_items(schemas=schemas)
+        return
+
+    yield from index_.memoise(
+        kind="constructable_items",
+        schema=schemas,
+        calculate=lambda: list(_constructable_items(schemas=schemas)),
+        derived=True,
+    )
+
+
+def _constructable_items(
+    *, schemas: types.Schemas
+) -> typing.Iterator[typing.Tuple[str, types.Schema]]:
+    """Implement constructable."""
     for name, schema in schemas.items():
-        try:
-            if not helpers.schema.constructable(schema=schema, schemas=schemas):
-                continue
-        except (exceptions.MalformedSchemaError, exceptions.SchemaNotFoundError):
+        if not _constructable(schema=schema, schemas=schemas):
             continue
 
         yield name, schema
@@ -51,10 +99,7 @@ def not_constructable(
 
     """
     for name, schema in schemas.items():
-        try:
-            if helpers.schema.constructable(schema=schema, schemas=schemas):
-                continue
-        except (exceptions.MalformedSchemaError, exceptions.SchemaNotFoundError):
+        if _constructable(schema=schema, schemas=schemas) is not False:
             continue
 
         yield name, schema
@@ -86,13 +131,9 @@ def _calculate_skip_name(
     if not stay_within_tablename and not stay_within_model:
         return None
 
-    inheritance_type = helpers.inheritance.calculate_type(
-        schema=schema, schemas=schemas
-    )
+    inheritance_type = index.inheritance_type(schema=schema, schemas=schemas)
     if inheritance_type != helpers.inheritance.Type.NONE:
-        parent_name = helpers.inheritance.retrieve_parent(
-            schema=schema, schemas=schemas
-        )
+        parent_name = index.parent(schema=schema, schemas=schemas)
 
         # Check for single
         if stay_within_model:
@@ -148,6 +189,39 @@ def properties_items(
         An iterator with all properties of a schema.
 
     """
+    index_ = index.get(schemas=schemas)
+    if index_ is None:
+        yield from _properties_items(
+            schema=schema,
+            schemas=schemas,
+            stay_within_tablename=stay_within_tablename,
+            stay_within_model=stay_within_model,
+        )
+        return
+
+    yield from index_.memoise(
+        kind=("properties_items", stay_within_tablename, stay_within_model),
+        schema=schema,
+        calculate=lambda: list(
+            _properties_items(
+                schema=schema,
+                schemas=schemas,
+                stay_within_tablename=stay_within_tablename,
+                stay_within_model=stay_within_model,
+            )
+        ),
+        derived=True,
+    )
+
+
+def _properties_items(
+    *,
+    schema: types.Schema,
+    schemas: types.Schemas,
+    stay_within_tablename: bool,
+    stay_within_model: bool,
+) -> typing.Iterator[typing.Any]:
+    """Implement properties_items."""
     init_filter_duplicates = functools.partial(_filter_duplicates, set())
 
     properties_values_iterator = properties_values(
@@ -1,8 +1,11 @@
 """Schema validation pre-processor."""
 
+import enum
 import typing
+from concurrent import futures
 
 from ... import exceptions as _exceptions
+from ... import helpers as _oa_helpers
 from ... import types as _oa_types
 from .. import helpers as _helpers
 from . import association
@@ -88,35 +91,152 @@ def _other_schemas_checks(*, schemas: _oa_types.Schemas) -> types.Result:
     return types.Result(valid=True, reason=None)
 
 
-def process(*, schemas: _oa_types.Schemas) -> None:
+class Executor(str, enum.Enum):
+    """The kind of pool used to validate the models in parallel."""
+
+    THREAD = "THREAD"
+    PROCESS = "PROCESS"
+
+
+# The reason the model is invalid and the exception raised by its properties
+TModelCheck = typing.Tuple[typing.Optional[str], typing.Optional[Exception]]
+
+# The schemas validated by a process of the pool
+_WORKER_SCHEMAS: typing.Optional[_oa_types.Schemas] = None
+# The number of chunks of models submitted to the pool per worker
+_CHUNKS_PER_WORKER = 4
+
+
+def _check_model_and_properties(
+    schemas: _oa_types.Schemas, schema_name: str, schema: _oa_types.Schema
+) -> TModelCheck:
+    """Check a model and, if it is valid, its properties."""
+    model_result = model.check(schemas, schema)
+    if not model_result.valid:
+        return model_result.reason, None
+
+    try:
+        _process_model(schemas, schema_name, schema)
+    except Exception as exc:  # pylint: disable=broad-except
+        return None, exc
+    return None, None
+
+
+def _initialize_worker(
+    schemas: _oa_types.Schemas, spec_context: typing.Optional[str]
+) -> None:
+    """Record the schemas and the context of the spec in a process of the pool."""
+    global _WORKER_SCHEMAS  # pylint: disable=global-statement
+    _WORKER_SCHEMAS = schemas
+    if spec_context is not None:
+        _oa_helpers.ref.set_context(path=spec_context)
+
+
+def _check_models_chunk(
+    names: typing.List[str], schemas: typing.Optional[_oa_types.Schemas] = None
+) -> typing.List[TModelCheck]:
+    """Check the models of a chunk, using the schemas of the process by default."""
+    if schemas is None:
+        schemas = _WORKER_SCHEMAS
+    assert schemas is not None
+    with _helpers.index.build(schemas=schemas):
+        return [
+            _check_model_and_properties(schemas, name, schemas[name]) for name in names
+        ]
+
+
+def _check_models_parallel(
+    *,
+    schemas: _oa_types.Schemas,
+    names: typing.List[str],
+    workers: int,
+    executor: Executor,
+) -> typing.Iterator[TModelCheck]:
+    """Check the models in parallel, returning the results in the order of names."""
+    chunk_count = workers * _CHUNKS_PER_WORKER
+    chunk_size = max(1, -(-len(names) // chunk_count))
+    chunks = [names[idx : idx + chunk_size] for idx in range(0, len(names), chunk_size)]
+
+    pool: futures.Executor
+    if executor == Executor.PROCESS:
+        pool = futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(schemas, _oa_helpers.ref.get_context()),
+        )
+        with pool:
+            chunks_results = list(pool.map(_check_models_chunk, chunks))
+    else:
+        # Threads don't inherit the remote schema store of the current context
+        store = _oa_helpers.ref.get_store()
+
+        def check_models_chunk(chunk: typing.List[str]) -> typing.List[TModelCheck]:
+            """Check the models of a chunk using the remote schema store."""
+            with _oa_helpers.ref.use_store(store):
+                return _check_models_chunk(chunk, schemas)
+
+        pool = futures.ThreadPoolExecutor(max_workers=workers)
+        with pool:
+            chunks_results = list(pool.map(check_models_chunk, chunks))
+
+    for chunk_results in chunks_results:
+        yield from chunk_results
+
+
+def process(
+    *,
+    schemas: _oa_types.Schemas,
+    workers: typing.Optional[int] = None,
+    executor: Executor = Executor.PROCESS,
+) -> None:
     """
     Validate schemas.
 
+    The models can be validated in parallel. The same error is raised as when the
+    models are validated one after the other.
+
     Args:
         schemas: The schemas to validate.
+        workers: The number of workers used to validate the models. If not set or 1,
+            the models are validated one after the other.
+        executor: The kind of pool used to validate the models in parallel.
 
     """
     schemas_result = schemas_validation.check(schemas=schemas)
     if not schemas_result.valid:
         raise _exceptions.MalformedSchemaError(schemas_result.reason)
 
-    # Check constructable schemas model
+    # Check the model and properties of the constructable schemas in one pass. Any
+    # invalid model is reported before any invalid property, so the first property
+    # error is only raised once all models have been checked.
+    property_exc: typing.Optional[Exception] = None
     constructables = _helpers.iterate.constructable(schemas=schemas)
-    model_results = map(
-        lambda args: (args[0], model.check(schemas, args[1])), constructables
-    )
-    invalid_model_result = next(
-        filter(lambda args: not args[1].valid, model_results), None
-    )
-    if invalid_model_result is not None:
-        name, result = invalid_model_result
-        raise _exceptions.MalformedSchemaError(f"{name} :: {result.reason}")
-
-    # Check constructable schemas properties
-    constructables = _helpers.iterate.constructable(schemas=schemas)
-    for constructable in constructables:
-        name, schema = constructable
-        _process_model(schemas, name, schema)
+    if workers is not None and workers > 1:
+        names = [name for name, _ in constructables]
+        checks = _check_models_parallel(
+            schemas=schemas, names=names, workers=workers, executor=executor
+        )
+        for name, (model_reason, exc) in zip(names, checks):
+            if model_reason is not None:
+                raise _exceptions.MalformedSchemaError(f"{name} :: {model_reason}")
+            if property_exc is None:
+                property_exc = exc
+    else:
+        for name, schema in constructables:
+            model_result = model.check(schemas, schema)
+            if not model_result.valid:
+                raise _exceptions.MalformedSchemaError(
+                    f"{name} :: {model_result.reason}"
+                )
+
+            if property_exc is not None:
+                continue
+            try:
+                _process_model(schemas, name, schema)
+            except Exception as exc:  # pylint: disable=broad-except
+                property_exc = exc
+    if property_exc is not None:
+        raise property_exc
 
     other_results_result = _other_schemas_checks(schemas=schemas)
     if not other_results_result.valid:
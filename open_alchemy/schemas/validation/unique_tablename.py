@@ -25,9 +25,7 @@ def _is_single_table_inheritance(
     if not oa_helpers.schema.inherits(schema=schema, schemas=schemas):
         return False
 
-    inheritance_type = oa_helpers.inheritance.calculate_type(
-        schema=schema, schemas=schemas
-    )
+    inheritance_type = helpers.index.inheritance_type(schema=schema, schemas=schemas)
     return inheritance_type == oa_helpers.inheritance.Type.SINGLE_TABLE
 
 
@@ -62,9 +60,7 @@ def check(*, schemas: oa_types.Schemas) -> types.Result:
 
     for name, schema in not_single_inheritance_schemas:
         # Retrieve tablename
-        tablename = oa_helpers.peek.prefer_local(
-            get_value=oa_helpers.peek.tablename, schemas=schemas, schema=schema
-        )
+        tablename = helpers.index.tablename(schema=schema, schemas=schemas)
         assert tablename is not None
 
         # Check whether the tablename has already been seen
@@ -1,15 +1,22 @@
 """Base class providing utilities for SQLAlchemy models."""
 
-import json
+import types as py_types
 import typing
 
 from .. import exceptions
 from .. import facades
 from .. import helpers
 from .. import types as oa_types
+from . import batch
+from . import bulk
+from . import eager
 from . import from_dict
 from . import repr_
+from . import resolved
+from . import stream
 from . import to_dict
+from . import types
+from . import validation
 
 TUtilityBase = typing.TypeVar("TUtilityBase", bound="UtilityBase")
 TOptUtilityBase = typing.Optional[TUtilityBase]
@@ -23,6 +30,39 @@ class UtilityBase:
     # be recorded as a free-form object and have a x-de-$ref extension property with
     # the de-referenced name of the schema.
     _schema: typing.ClassVar[oa_types.Schema]
+    # The validator for dictionaries passed to from_dict compiled from the schema. It
+    # is constructed from _schema on first use if the model does not define it.
+    _validator: typing.ClassVar[facades.jsonschema.Validator]
+    # The validator composed from _schema and the schemas of the nested models that
+    # validates a dictionary and its nested dictionaries at once. It is calculated on
+    # first use.
+    _document: typing.ClassVar[validation.Document]
+    # The values of each property schema used by the utilities resolved once from
+    # _schema. It is calculated on first use if the model does not define it.
+    _resolved_properties: typing.ClassVar[typing.Dict[str, resolved.Property]]
+    # The functions that convert the value of each property passed to from_dict. It is
+    # calculated from _schema on first use if the model does not define it.
+    _from_dict_plan: typing.ClassVar[types.TFromDictPlan]
+    # The same as _from_dict_plan except that the types of simple values are not
+    # checked. It is calculated from _schema on first use for the trusted level.
+    _from_dict_trusted_plan: typing.ClassVar[types.TFromDictPlan]
+    # The validation of the dictionaries passed to from_dict unless it is overridden
+    # for the current context.
+    _validation_level: typing.ClassVar[validation.Level] = validation.Level.FULL
+    # The library used to encode and decode JSON. If it is not set, the default
+    # backend of the JSON facade is used.
+    _json_backend: typing.ClassVar[typing.Optional[facades.json.Backend]] = None
+    # The properties included by to_dict with the function that converts each value.
+    # It is calculated from _schema on first use if the model does not define it.
+    _to_dict_plan: typing.ClassVar[types.TToDictPlan]
+    # The function that constructs model instances from dictionaries with any
+    # inheritance resolved. It is calculated on first use.
+    _from_dict: typing.ClassVar[
+        typing.Callable[[typing.Dict[str, typing.Any]], typing.Any]
+    ]
+    # The namespace the model is defined on that any related models are retrieved
+    # from. If it is not set, the namespace of the current context is used.
+    _models: typing.ClassVar[typing.Optional[py_types.ModuleType]] = None
 
     def __init__(self, **kwargs: typing.Any) -> None:
         """Construct."""
@@ -47,6 +87,123 @@ class UtilityBase:
             )
         return cls._schema
 
+    @classmethod
+    def _get_validator(cls) -> facades.jsonschema.Validator:
+        """
+        Get the validator compiled from the schema.
+
+        Raise ModelAttributeError if _schema is not defined.
+
+        Returns:
+            The validator for the schema.
+
+        """
+        # Only consider the validator of the class itself, not of any parent
+        validator = cls.__dict__.get("_validator")
+        if validator is None:
+            validator = facades.jsonschema.Validator(schema=cls._get_schema())
+            cls._validator = validator
+        return validator
+
+    @classmethod
+    def _get_document(cls) -> validation.Document:
+        """
+        Get the validator that also validates the dictionaries of nested models.
+
+        The nested models are retrieved once when the validator is first used, at
+        which point all models have been defined.
+
+        Raise ModelAttributeError if _schema is not defined.
+
+        Returns:
+            The validator and the nested models it validates.
+
+        """
+        # Only consider the document of the class itself, not of any parent
+        document = cls.__dict__.get("_document")
+        if document is None:
+            validator = cls._get_validator()
+            schema, models = validation.compose(model=cls)
+            if models:
+                validator = facades.jsonschema.Validator(
+                    schema=schema, draft=validator.draft
+                )
+            document = validation.Document(validator=validator, models=models)
+            cls._document = document
+        return document
+
+    @classmethod
+    def _get_resolved_properties(cls) -> typing.Dict[str, resolved.Property]:
+        """
+        Get the properties resolved from the schema.
+
+        Raise ModelAttributeError if _schema is not defined.
+        Raise MalformedSchemaError if the schema does not have any properties.
+
+        Returns:
+            The resolved property for each property that could be resolved.
+
+        """
+        # Only consider the properties of the class itself, not of any parent
+        resolved_properties = cls.__dict__.get("_resolved_properties")
+        if resolved_properties is None:
+            resolved_properties = resolved.resolve_properties(
+                properties=cls.get_properties()
+            )
+            cls._resolved_properties = resolved_properties
+        return resolved_properties
+
+    @classmethod
+    def _get_from_dict_plan(cls, *, trusted: bool = False) -> types.TFromDictPlan:
+        """
+        Get the plan for converting the values passed to from_dict.
+
+        Raise ModelAttributeError if _schema is not defined.
+        Raise MalformedSchemaError if the schema does not have any properties.
+
+        Args:
+            trusted: Whether to get the plan that does not check the types of simple
+                values.
+
+        Returns:
+            The function that converts the value for each property.
+
+        """
+        attr = "_from_dict_trusted_plan" if trusted else "_from_dict_plan"
+        # Only consider the plan of the class itself, not of any parent
+        plan = cls.__dict__.get(attr)
+        if plan is None:
+            plan = from_dict.compile_plan(
+                properties=cls.get_properties(),
+                resolved_properties=cls._get_resolved_properties(),
+                check_types=not trusted,
+                namespace=cls._models,
+            )
+            setattr(cls, attr, plan)
+        return plan
+
+    @classmethod
+    def _get_to_dict_plan(cls) -> types.TToDictPlan:
+        """
+        Get the plan for converting instances to a dictionary.
+
+        Raise ModelAttributeError if _schema is not defined.
+        Raise MalformedSchemaError if the schema does not have any properties.
+
+        Returns:
+            The properties included in the dictionary with their conversion.
+
+        """
+        # Only consider the plan of the class itself, not of any parent
+        plan = cls.__dict__.get("_to_dict_plan")
+        if plan is None:
+            plan = to_dict.compile_plan(
+                schema=cls._get_schema(),
+                resolved_properties=cls._get_resolved_properties(),
+            )
+            cls._to_dict_plan = plan
+        return plan
+
     @classmethod
     def get_properties(cls) -> oa_types.Schema:
         """
@@ -68,8 +225,8 @@ class UtilityBase:
             )
         return properties
 
-    @staticmethod
-    def _get_parent(*, schema: oa_types.Schema) -> typing.Type[TUtilityBase]:
+    @classmethod
+    def _get_parent(cls, *, schema: oa_types.Schema) -> typing.Type[TUtilityBase]:
         """Get the parent model of a model."""
         parent_name = helpers.peek.inherits(schema=schema, schemas={})
         if parent_name is None or not isinstance(parent_name, str):
@@ -81,7 +238,9 @@ class UtilityBase:
                 x_inherits_type=type(parent_name),
             )
         # Try to get model
-        parent: TOptUtilityBase = facades.models.get_model(name=parent_name)
+        parent: TOptUtilityBase = facades.models.get_model(
+            name=parent_name, namespace=cls._models
+        )
         if parent is None:
             raise exceptions.SchemaNotFoundError(
                 "The parent model was not found on open_alchemy.models.",
@@ -94,26 +253,79 @@ class UtilityBase:
     def construct_from_dict_init(
         cls: typing.Type[TUtilityBase], **kwargs: typing.Any
     ) -> typing.Dict[str, typing.Any]:
-        """Construct the dictionary passed to model construction."""
+        """
+        Construct the dictionary passed to model construction.
+
+        The dictionary is validated based on the level for the current context or,
+        if it is not set, the level of the model. With full validation, any nested
+        dictionaries are validated together with the dictionary unless it is itself
+        nested in a dictionary that has already been validated.
+
+        Raise MalformedModelDictionaryError with the path to the value that is not
+        valid and the innermost model along the path if the dictionary is not valid.
+
+        """
+        level = validation.get_level() or cls._validation_level
+
         # Check dictionary
-        schema = cls._get_schema()
-        try:
-            facades.jsonschema.validate(instance=kwargs, schema=schema)
-        except facades.jsonschema.ValidationError as exc:
-            raise exceptions.MalformedModelDictionaryError(
-                "The dictionary passed to from_dict is not a valid instance of the "
-                "model schema.",
-                schema=schema,
-                kwargs=kwargs,
-            ) from exc
+        if level == validation.Level.FULL and cls not in validation.get_validated():
+            document = cls._get_document()
+            try:
+                document.validator.validate(kwargs)
+            except facades.jsonschema.ValidationError as exc:
+                raise cls._get_from_dict_error(
+                    exc, kwargs=kwargs, models=document.models
+                ) from exc
+            if document.models:
+                with validation.use_validated(document.models):
+                    return cls._convert_from_dict_init(kwargs, level=level)
 
-        # Assemble dictionary for construction
-        properties = cls.get_properties()
+        return cls._convert_from_dict_init(kwargs, level=level)
+
+    @classmethod
+    def _get_from_dict_error(
+        cls,
+        exc: "facades.jsonschema.ValidationError",
+        *,
+        kwargs: typing.Dict[str, typing.Any],
+        models: typing.FrozenSet = frozenset(),
+    ) -> exceptions.MalformedModelDictionaryError:
+        """
+        Construct the error for a dictionary that is not a valid instance of the schema.
+
+        Args:
+            exc: The error raised by the validator.
+            kwargs: The dictionary that is not valid.
+            models: The models whose schemas were composed into the validator.
+
+        Returns:
+            The error with the path to the value that is not valid and the innermost
+            model along the path.
+
+        """
+        path = list(exc.absolute_path)
+        model = validation.locate(model=cls, models=models, path=path)
+        return exceptions.MalformedModelDictionaryError(
+            "The dictionary passed to from_dict is not a valid instance of the model "
+            "schema.",
+            schema=model._get_schema(),
+            kwargs=kwargs,
+            path=path,
+            model=model,
+        )
+
+    @classmethod
+    def _convert_from_dict_init(
+        cls, kwargs: typing.Dict[str, typing.Any], *, level: validation.Level
+    ) -> typing.Dict[str, typing.Any]:
+        """Convert the values of the dictionary passed to model construction."""
+        schema = cls._get_schema()
+        plan = cls._get_from_dict_plan(trusted=level == validation.Level.TRUSTED)
         model_dict: typing.Dict[str, typing.Any] = {}
         for name, value in kwargs.items():
-            # Get the specification and type of the property
-            property_schema = properties.get(name)
-            if property_schema is None:
+            # Get the conversion for the property
+            convert = plan.get(name)
+            if convert is None:
                 raise exceptions.MalformedModelDictionaryError(
                     "A parameter was passed in that is not a property in the model "
                     "schema.",
@@ -123,12 +335,10 @@ class UtilityBase:
 
             # Convert to column value
             try:
-                model_dict[name] = from_dict.convert(
-                    value=value, schema=property_schema
-                )
+                model_dict[name] = convert(value)
             except exceptions.BaseError as exc:
                 exc.schema = schema  # type: ignore
-                exc.property_schema = property_schema  # type: ignore
+                exc.property_schema = cls.get_properties()[name]  # type: ignore
                 exc.property_name = name  # type: ignore
                 exc.property_value = value  # type: ignore
                 raise
@@ -141,7 +351,8 @@ class UtilityBase:
         Construct model instance from a dictionary.
 
         Raise MalformedModelDictionaryError when the dictionary does not satisfy the
-        model schema.
+        model schema. How much of the schema is checked depends on the validation
+        level, which can be overridden using validation.use_level.
 
         Args:
             kwargs: The values to construct the class with.
@@ -150,22 +361,61 @@ class UtilityBase:
             An instance of the model constructed using the dictionary.
 
         """
+        return cls._compile_from_dict()(kwargs)
+
+    @classmethod
+    def _compile_from_dict(
+        cls: typing.Type[TUtilityBase],
+    ) -> typing.Callable[[typing.Dict[str, typing.Any]], TUtilityBase]:
+        """
+        Calculate the function that constructs model instances from dictionaries.
+
+        Any inheritance is resolved once so that the function can be used for many
+        dictionaries, including the dictionaries of the model nested in other
+        dictionaries.
+
+        Returns:
+            The function that constructs a model instance from a dictionary.
+
+        """
+        # Only consider the function of the class itself, not of any parent
+        from_dict_ = cls.__dict__.get("_from_dict")
+        if from_dict_ is None:
+            from_dict_ = cls._calculate_from_dict()
+            cls._from_dict = from_dict_
+        return from_dict_
+
+    @classmethod
+    def _calculate_from_dict(
+        cls: typing.Type[TUtilityBase],
+    ) -> typing.Callable[[typing.Dict[str, typing.Any]], TUtilityBase]:
+        """Calculate the function that constructs model instances from dictionaries."""
         schema = cls._get_schema()
-        # Handle model that inherits
-        if helpers.schema.inherits(schema=schema, schemas={}):
-            # Retrieve parent model
-            parent: typing.Type[UtilityBase] = cls._get_parent(schema=schema)
+        # Handle model that does not inherit
+        if not helpers.schema.inherits(schema=schema, schemas={}):
+            return lambda kwargs: cls(**cls.construct_from_dict_init(**kwargs))
+
+        # Retrieve parent model
+        parent: typing.Type[UtilityBase] = cls._get_parent(schema=schema)
+        # Get properties for schema
+        properties = cls.get_properties()
+
+        def _from_dict(kwargs: typing.Dict[str, typing.Any]) -> TUtilityBase:
+            """Construct model instance that inherits from a dictionary."""
+            # The dictionaries of models that inherit are not validated as part of
+            # the documents they are nested in
+            if validation.get_validated():
+                with validation.use_validated(frozenset()):
+                    return _from_dict(kwargs)
 
             # Construct parent initialization dictionary
-            # Get properties for schema
-            properties = cls.get_properties()
             # Pass kwargs that don't belong to the current model to the parent
             parent_kwargs = {
                 key: value for key, value in kwargs.items() if key not in properties
             }
             parent_init_dict = parent.construct_from_dict_init(**parent_kwargs)
 
-            # COnstruct child (the current model) initialization dictionary
+            # Construct child (the current model) initialization dictionary
             child_kwargs = {
                 key: value for key, value in kwargs.items() if key in properties
             }
@@ -173,10 +423,143 @@ class UtilityBase:
                 **parent_init_dict,
                 **cls.construct_from_dict_init(**child_kwargs),
             }
-        else:
-            init_dict = cls.construct_from_dict_init(**kwargs)
+            return cls(**init_dict)
 
-        return cls(**init_dict)
+        return _from_dict
+
+    @classmethod
+    def iter_from_dicts(
+        cls: typing.Type[TUtilityBase],
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        collect_errors: bool = False,
+        validation_level: typing.Optional[validation.Level] = None,
+    ) -> typing.Iterator[TUtilityBase]:
+        """
+        Lazily construct model instances from dictionaries.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema. The index of the dictionary is recorded on the error as index.
+        Raise BatchError with the errors by index if collect_errors is set and any
+        dictionary could not be converted, once all dictionaries have been consumed.
+
+        Args:
+            values: The dictionaries to construct the instances with.
+            collect_errors: Whether to convert all dictionaries before raising any
+                errors.
+            validation_level: The validation of the dictionaries. If not set, the
+                level for the current context or of the model is used.
+
+        Returns:
+            The instances of the model constructed using the dictionaries.
+
+        """
+        from_dict_ = cls._compile_from_dict()
+
+        def _from_dict(value: typing.Dict[str, typing.Any]) -> TUtilityBase:
+            """Construct model instance from a dictionary."""
+            if not isinstance(value, dict):
+                raise exceptions.MalformedModelDictionaryError(
+                    "The value is not a Python dictionary.",
+                    value=value,
+                    value_type=type(value),
+                )
+            if validation_level is None:
+                return from_dict_(value)
+            with validation.use_level(validation_level):
+                return from_dict_(value)
+
+        return batch.iterate(_from_dict, values, collect_errors=collect_errors)
+
+    @classmethod
+    def from_dicts(
+        cls: typing.Type[TUtilityBase],
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        collect_errors: bool = False,
+        validation_level: typing.Optional[validation.Level] = None,
+    ) -> typing.List[TUtilityBase]:
+        """
+        Construct model instances from dictionaries.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema. The index of the dictionary is recorded on the error as index.
+        Raise BatchError with the errors by index if collect_errors is set and any
+        dictionary could not be converted.
+
+        Args:
+            values: The dictionaries to construct the instances with.
+            collect_errors: Whether to convert all dictionaries before raising any
+                errors.
+            validation_level: The validation of the dictionaries. If not set, the
+                level for the current context or of the model is used.
+
+        Returns:
+            The instances of the model constructed using the dictionaries.
+
+        """
+        return list(
+            cls.iter_from_dicts(
+                values,
+                collect_errors=collect_errors,
+                validation_level=validation_level,
+            )
+        )
+
+    @classmethod
+    def bulk_insert_from_dicts(
+        cls,
+        bind: typing.Any,
+        values: typing.Iterable[typing.Dict[str, typing.Any]],
+        *,
+        batch_size: int = 1000,
+        collect_errors: bool = False,
+        validation_level: typing.Optional[validation.Level] = None,
+    ) -> int:
+        """
+        Insert rows into the table of the model from dictionaries.
+
+        The dictionaries are validated and their values converted in the same way as
+        for from_dict, but the rows are inserted using executemany without
+        constructing model instances. Foreign key columns can be passed directly or
+        using the dictionary of a many to one relationship with the properties that
+        the foreign key references, such as {"division": {"id": 1}}.
+
+        Raise MalformedModelDictionaryError when a dictionary does not satisfy the
+        model schema. The index of the dictionary is recorded on the error as index.
+        Raise BatchError with the errors by index if collect_errors is set and any
+        dictionary could not be converted, after the other dictionaries have been
+        inserted.
+        Raise FeatureNotImplementedError if the model inherits.
+
+        Args:
+            bind: The session or connection to execute the inserts with. The inserts
+                are not committed.
+            values: The dictionaries of the rows.
+            batch_size: The maximum number of rows per insert.
+            collect_errors: Whether to insert all valid dictionaries before raising
+                any errors.
+            validation_level: The validation of the dictionaries. If not set, the
+                level for the current context or of the model is used.
+
+        Returns:
+            The number of rows that were inserted.
+
+        """
+        level = validation.Level(
+            validation_level or validation.get_level() or cls._validation_level
+        )
+        rows = batch.iterate(
+            bulk.compile_(model=cls, level=level),
+            values,
+            collect_errors=collect_errors,
+        )
+        return bulk.insert(
+            bind=bind,
+            table=cls.__table__,  # type: ignore
+            rows=rows,
+            batch_size=batch_size,
+        )
 
     @classmethod
     def from_str(cls: typing.Type[TUtilityBase], value: str) -> TUtilityBase:
@@ -198,8 +581,8 @@ class UtilityBase:
                 "The value is not of type string.", value=value, value_type=type(value)
             )
         try:
-            dict_value = json.loads(value)
-        except json.JSONDecodeError as exc:
+            dict_value = facades.json.loads(value, backend=cls._json_backend)
+        except facades.json.DecodeError as exc:
             raise exceptions.MalformedModelDictionaryError(
                 "The string value is not valid JSON.", value=value
             ) from exc
@@ -212,55 +595,267 @@ class UtilityBase:
         return cls.from_dict(**dict_value)
 
     @classmethod
-    def instance_to_dict(cls, instance: TUtilityBase) -> typing.Dict[str, typing.Any]:
-        """Convert instance of the model to a dictionary."""
-        schema = cls._get_schema()
-        properties = cls.get_properties()
+    def instance_to_dict(
+        cls,
+        instance: TUtilityBase,
+        selection: typing.Optional[to_dict.fields.Selection] = None,
+    ) -> typing.Dict[str, typing.Any]:
+        """
+        Convert instance of the model to a dictionary.
+
+        The attributes of any property that is not selected are not accessed.
+
+        Args:
+            instance: The instance to convert.
+            selection (optional): The properties to include. All properties are
+                included if it is not set.
+
+        Returns:
+            The dictionary representation of the instance.
+
+        """
+        plan = cls._get_to_dict_plan()
 
         # Collecting the values of the properties
         return_dict: typing.Dict[str, typing.Any] = {}
-        for name, property_schema in properties.items():
-            # Handle for writeOnly
-            if helpers.peek.write_only(schema=property_schema, schemas={}):
+        for name, convert, return_none, relationship in plan:
+            if selection is not None and not selection.includes(
+                name, relationship=relationship
+            ):
                 continue
-
             value = getattr(instance, name, None)
 
             # Handle none value
             if value is None:
-                return_none = to_dict.return_none(schema=schema, property_name=name)
-                if return_none is True:
+                if return_none:
                     return_dict[name] = None
                 # Don't consider for coverage due to coverage bug
                 continue  # pragma: no cover
 
             try:
-                return_dict[name] = to_dict.convert(schema=property_schema, value=value)
+                nested = (
+                    selection.nested(name)
+                    if selection is not None and relationship
+                    else None
+                )
+                if nested is None:
+                    return_dict[name] = convert(value)
+                else:
+                    return_dict[name] = convert(value, nested)
             except exceptions.BaseError as exc:
-                exc.schema = schema  # type: ignore
-                exc.property_schema = property_schema  # type: ignore
+                exc.schema = cls._get_schema()  # type: ignore
+                exc.property_schema = cls.get_properties()[name]  # type: ignore
                 exc.property_name = name  # type: ignore
                 exc.property_value = value  # type: ignore
                 raise
 
         return return_dict
 
-    def to_dict(self) -> typing.Dict[str, typing.Any]:
+    def to_dict(
+        self,
+        *,
+        include: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        max_depth: typing.Optional[int] = None,
+    ) -> typing.Dict[str, typing.Any]:
         """
         Convert model instance to dictionary.
 
+        The properties are selected using field paths which are the name of a property
+        optionally followed by the dot separated path of a property of the related
+        instances, for example division.name. Only the attributes of the selected
+        properties are accessed.
+
+        Args:
+            include (optional): The paths of the properties to include. All
+                properties are included if it is not set.
+            exclude (optional): The paths of the properties not to include.
+            max_depth (optional): The number of levels of related instances to
+                include. 0 excludes all relationships.
+
         Returns:
             The dictionary representation of the model.
 
         """
-        schema = self._get_schema()
-        if helpers.schema.inherits(schema=schema, schemas={}):
-            # Retrieve parent model and convert to dict
-            parent: typing.Type[UtilityBase] = self._get_parent(schema=schema)
-            parent_dict = parent.instance_to_dict(self)
-            return {**parent_dict, **self.instance_to_dict(self)}
+        selection = to_dict.fields.create(
+            include=include, exclude=exclude, max_depth=max_depth
+        )
+        if selection is None:
+            return self._compile_to_dict()(self)
+        return self._compile_to_dict()(self, selection)
+
+    @classmethod
+    def _compile_to_dict(
+        cls: typing.Type[TUtilityBase],
+    ) -> typing.Callable[..., typing.Dict[str, typing.Any]]:
+        """
+        Calculate the function that converts model instances to dictionaries.
 
-        return self.instance_to_dict(self)
+        Any inheritance is resolved once so that the function can be used for many
+        instances. The function optionally accepts the selection of the properties to
+        include.
+
+        Returns:
+            The function that converts a model instance to a dictionary.
+
+        """
+        schema = cls._get_schema()
+        if not helpers.schema.inherits(schema=schema, schemas={}):
+            return cls.instance_to_dict
+
+        # Retrieve parent model and convert to dict
+        parent: typing.Type[UtilityBase] = cls._get_parent(schema=schema)
+
+        def _to_dict(
+            instance: TUtilityBase,
+            selection: typing.Optional[to_dict.fields.Selection] = None,
+        ) -> typing.Dict[str, typing.Any]:
+            """Convert the instance including the properties of the parent."""
+            if selection is None:
+                return {
+                    **parent.instance_to_dict(instance),
+                    **cls.instance_to_dict(instance),
+                }
+            return {
+                **parent.instance_to_dict(instance, selection),
+                **cls.instance_to_dict(instance, selection),
+            }
+
+        return _to_dict
+
+    @classmethod
+    def _compile_selected_to_dict(
+        cls: typing.Type[TUtilityBase],
+        *,
+        include: typing.Optional[typing.Iterable[str]],
+        exclude: typing.Optional[typing.Iterable[str]],
+        max_depth: typing.Optional[int],
+    ) -> typing.Callable[[TUtilityBase], typing.Dict[str, typing.Any]]:
+        """Calculate the function that converts the selected properties of instances."""
+        convert = cls._compile_to_dict()
+        selection = to_dict.fields.create(
+            include=include, exclude=exclude, max_depth=max_depth
+        )
+        if selection is None:
+            return convert
+        return lambda instance: convert(instance, selection)
+
+    @classmethod
+    def iter_to_dicts(
+        cls: typing.Type[TUtilityBase],
+        instances: typing.Iterable[TUtilityBase],
+        *,
+        collect_errors: bool = False,
+        include: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        max_depth: typing.Optional[int] = None,
+    ) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Lazily convert model instances to dictionaries.
+
+        The index of any instance that could not be converted is recorded on the error
+        as index. Raise BatchError with the errors by index if collect_errors is set
+        and any instance could not be converted, once all instances have been
+        consumed.
+
+        Args:
+            instances: The instances of the model to convert.
+            collect_errors: Whether to convert all instances before raising any
+                errors.
+            include (optional): The paths of the properties to include, see to_dict.
+            exclude (optional): The paths of the properties not to include.
+            max_depth (optional): The number of levels of related instances to
+                include.
+
+        Returns:
+            The dictionary representations of the instances.
+
+        """
+        return batch.iterate(
+            cls._compile_selected_to_dict(
+                include=include, exclude=exclude, max_depth=max_depth
+            ),
+            instances,
+            collect_errors=collect_errors,
+        )
+
+    @classmethod
+    def to_dicts(
+        cls: typing.Type[TUtilityBase],
+        instances: typing.Iterable[TUtilityBase],
+        *,
+        collect_errors: bool = False,
+        include: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        max_depth: typing.Optional[int] = None,
+    ) -> typing.List[typing.Dict[str, typing.Any]]:
+        """
+        Convert model instances to dictionaries.
+
+        The index of any instance that could not be converted is recorded on the error
+        as index. Raise BatchError with the errors by index if collect_errors is set
+        and any instance could not be converted.
+
+        Args:
+            instances: The instances of the model to convert.
+            collect_errors: Whether to convert all instances before raising any
+                errors.
+            include (optional): The paths of the properties to include, see to_dict.
+            exclude (optional): The paths of the properties not to include.
+            max_depth (optional): The number of levels of related instances to
+                include.
+
+        Returns:
+            The dictionary representations of the instances.
+
+        """
+        return list(
+            cls.iter_to_dicts(
+                instances,
+                collect_errors=collect_errors,
+                include=include,
+                exclude=exclude,
+                max_depth=max_depth,
+            )
+        )
+
+    @classmethod
+    def eager_load_options(
+        cls,
+        *,
+        include: typing.Optional[typing.Iterable[str]] = None,
+        exclude: typing.Optional[typing.Iterable[str]] = None,
+        max_depth: typing.Optional[int] = None,
+        strategy: typing.Union[eager.Strategy, str] = eager.Strategy.SELECTIN,
+    ) -> typing.List[typing.Any]:
+        """
+        Calculate the loader options that eagerly load what to_dict converts.
+
+        Passing the options to the query of the instances means that converting them
+        using the same include, exclude and max_depth does not load the related
+        instances one instance at a time.
+
+        Raise ValueError if the strategy is not known.
+
+        Args:
+            include (optional): The paths of the properties to include, see to_dict.
+            exclude (optional): The paths of the properties not to include.
+            max_depth (optional): The number of levels of related instances to
+                include.
+            strategy (optional): Whether the related instances are loaded using
+                selectin or joined loading.
+
+        Returns:
+            The loader options to pass to Query.options.
+
+        """
+        return eager.calculate(
+            model=cls,
+            selection=to_dict.fields.create(
+                include=include, exclude=exclude, max_depth=max_depth
+            ),
+            strategy=strategy,
+        )
 
     def to_str(self) -> str:
         """
@@ -271,10 +866,62 @@ class UtilityBase:
 
         """
         instance_dict = self.to_dict()
-        return json.dumps(instance_dict)
+        return facades.json.dumps(instance_dict, backend=self._json_backend)
 
     __str__ = to_str
 
+    @classmethod
+    def iter_str(
+        cls: typing.Type[TUtilityBase],
+        instances: typing.Iterable[TUtilityBase],
+        *,
+        ndjson: bool = False,
+    ) -> typing.Iterator[str]:
+        """
+        Lazily convert model instances to a JSON string one instance at a time.
+
+        Joining the chunks results in a JSON array of the to_str representation of
+        each instance. Only a single instance is converted at a time so that the
+        memory used does not depend on the number of instances.
+
+        Args:
+            instances: The instances of the model to convert, for example a query.
+            ndjson: Whether to encode as newline delimited JSON instead of a JSON
+                array.
+
+        Returns:
+            The chunks of the JSON string.
+
+        """
+        return stream.iterate(
+            cls.iter_to_dicts(instances), ndjson=ndjson, backend=cls._json_backend
+        )
+
+    @classmethod
+    def dump_str(
+        cls: typing.Type[TUtilityBase],
+        instances: typing.Iterable[TUtilityBase],
+        file: types.TWritable,
+        *,
+        ndjson: bool = False,
+    ) -> None:
+        """
+        Write model instances to a file as a JSON string one instance at a time.
+
+        Args:
+            instances: The instances of the model to convert, for example a query.
+            file: The file-like object to write to.
+            ndjson: Whether to encode as newline delimited JSON instead of a JSON
+                array.
+
+        """
+        stream.write(
+            cls.iter_to_dicts(instances),
+            file,
+            ndjson=ndjson,
+            backend=cls._json_backend,
+        )
+
     def __repr__(self) -> str:
         """Calculate the repr for the model."""
         properties = self.get_properties()
@@ -0,0 +1,50 @@
+"""Convert batches of values."""
+
+import typing
+
+from .. import exceptions
+
+TValue = typing.TypeVar("TValue")
+TResult = typing.TypeVar("TResult")
+
+
+def iterate(
+    convert: typing.Callable[[TValue], TResult],
+    values: typing.Iterable[TValue],
+    *,
+    collect_errors: bool = False,
+) -> typing.Iterator[TResult]:
+    """
+    Lazily convert each value.
+
+    The index of the value in the batch is recorded on any error as index.
+    Raise the error of the first value that could not be converted, or, if
+    collect_errors is set, BatchError with every error after all values have been
+    converted.
+
+    Args:
+        convert: The function that converts a single value.
+        values: The values to convert.
+        collect_errors: Whether to convert all values before raising any errors.
+
+    Returns:
+        The converted values.
+
+    """
+    errors: typing.Dict[int, exceptions.BaseError] = {}
+    for index, value in enumerate(values):
+        try:
+            result = convert(value)
+        except exceptions.BaseError as exc:
+            exc.index = index  # type: ignore
+            if not collect_errors:
+                raise
+            errors[index] = exc
+            continue
+        yield result
+
+    if errors:
+        raise exceptions.BatchError(
+            f"{len(errors)} values of the batch could not be converted.",
+            errors=errors,
+        )
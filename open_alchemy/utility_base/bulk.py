@@ -0,0 +1,216 @@
+"""Insert rows from dictionaries without constructing model instances."""
+
+import typing
+
+import sqlalchemy
+from sqlalchemy.orm import interfaces
+
+from .. import exceptions
+from .. import facades
+from .. import helpers
+from . import types
+from . import validation
+
+TRow = typing.Dict[str, typing.Any]
+# Converts the value of a key of a dictionary into the values of the columns
+TRowConverter = typing.Callable[[typing.Any, TRow], None]
+
+
+def _identity(value: typing.Any) -> types.TAnyCol:
+    """Return the value as is."""
+    return value
+
+
+def _column(key: str, convert: types.TFromDictConverter) -> TRowConverter:
+    """Calculate the function that converts the value of a column."""
+
+    def _convert(value: typing.Any, values: TRow) -> None:
+        """Convert the value of the column."""
+        values[key] = convert(value)
+
+    return _convert
+
+
+def _foreign_key(relationship: typing.Any) -> TRowConverter:
+    """
+    Calculate the function that converts the value of a many to one relationship.
+
+    The value of each foreign key column is the value of the property of the
+    dictionary of the related model that the column references.
+    """
+    remote_mapper = relationship.mapper
+    columns = tuple(
+        (local.key, remote_mapper.get_property_by_column(remote).key)
+        for local, remote in relationship.local_remote_pairs
+    )
+
+    def _convert(value: typing.Any, values: TRow) -> None:
+        """Convert the value of the relationship to the foreign key columns."""
+        if value is None:
+            for key, _ in columns:
+                values[key] = None
+            return
+        if not isinstance(value, dict):
+            raise exceptions.MalformedModelDictionaryError(
+                "The value of the relationship is not a Python dictionary.",
+                value=value,
+                value_type=type(value),
+            )
+        for key, remote_key in columns:
+            if remote_key not in value:
+                raise exceptions.MalformedModelDictionaryError(
+                    "The dictionary of the relationship does not have the property "
+                    "referenced by the foreign key.",
+                    foreign_key_property=remote_key,
+                    value=value,
+                )
+            values[key] = value[remote_key]
+
+    return _convert
+
+
+def _reject_relationship(_: typing.Any, __: TRow) -> None:
+    """Raise for relationships whose foreign key is not on the model."""
+    raise exceptions.MalformedModelDictionaryError(
+        "Only the values of relationships with the foreign key on the model can be "
+        "inserted in bulk."
+    )
+
+
+def compile_(
+    *, model: typing.Any, level: validation.Level
+) -> typing.Callable[[TRow], TRow]:
+    """
+    Calculate the function that converts a dictionary to the values of the columns.
+
+    The values of the properties are validated and converted in the same way as for
+    from_dict based on the level. Foreign key columns can be passed directly or
+    using the dictionary of a many to one relationship with the properties that the
+    foreign key references.
+
+    Raise FeatureNotImplementedError if the model inherits.
+
+    Args:
+        model: The model of the dictionaries.
+        level: The validation of the dictionaries.
+
+    Returns:
+        The function that converts a dictionary.
+
+    """
+    schema = model._get_schema()
+    if helpers.schema.inherits(schema=schema, schemas={}):
+        raise exceptions.FeatureNotImplementedError(
+            "Models that inherit can't be inserted in bulk.", schema=schema
+        )
+    plan = model._get_from_dict_plan(trusted=level == validation.Level.TRUSTED)
+    properties = model.get_properties()
+    validator = model._get_validator() if level == validation.Level.FULL else None
+
+    mapper = sqlalchemy.inspect(model)
+    converters: typing.Dict[str, TRowConverter] = {}
+    for column_property in mapper.column_attrs:
+        # Columns that are not in the schema, such as foreign keys, are not converted
+        converters[column_property.key] = _column(
+            column_property.columns[0].key,
+            plan.get(column_property.key, _identity),
+        )
+    for relationship in mapper.relationships:
+        if relationship.key not in properties:
+            continue
+        if relationship.direction is interfaces.MANYTOONE:
+            converters[relationship.key] = _foreign_key(relationship)
+        else:
+            converters[relationship.key] = _reject_relationship
+
+    def _convert(row: TRow) -> TRow:
+        """Convert a dictionary to the values of the columns."""
+        if not isinstance(row, dict):
+            raise exceptions.MalformedModelDictionaryError(
+                "The value is not a Python dictionary.",
+                value=row,
+                value_type=type(row),
+            )
+        if validator is not None:
+            try:
+                validator.validate(row)
+            except facades.jsonschema.ValidationError as exc:
+                raise model._get_from_dict_error(exc, kwargs=row) from exc
+
+        values: TRow = {}
+        for name, value in row.items():
+            convert = converters.get(name)
+            if convert is None:
+                raise exceptions.MalformedModelDictionaryError(
+                    "A parameter was passed in that is not a property or column of "
+                    "the model.",
+                    parameter_name=name,
+                    schema=schema,
+                )
+            try:
+                convert(value, values)
+            except exceptions.BaseError as exc:
+                exc.schema = schema  # type: ignore
+                exc.property_schema = properties.get(name)  # type: ignore
+                exc.property_name = name  # type: ignore
+                exc.property_value = value  # type: ignore
+                raise
+        return values
+
+    return _convert
+
+
+def insert(
+    *,
+    bind: typing.Any,
+    table: sqlalchemy.Table,
+    rows: typing.Iterable[TRow],
+    batch_size: int,
+) -> int:
+    """
+    Insert the values of the columns using executemany in batches.
+
+    Consecutive rows with the same columns are inserted together, up to batch_size
+    rows at a time. If BatchError is raised by the rows, the rows that have not yet
+    been inserted are inserted before it is raised.
+
+    Raise ValueError if the batch size is less than 1.
+
+    Args:
+        bind: The session or connection to execute the inserts with.
+        table: The table to insert into.
+        rows: The values of the columns for each row.
+        batch_size: The maximum number of rows per insert.
+
+    Returns:
+        The number of rows that were inserted.
+
+    """
+    if batch_size < 1:
+        raise ValueError("The batch size must be at least 1.")
+    statement = table.insert()
+    count = 0
+    pending: typing.List[TRow] = []
+    keys: typing.Optional[typing.KeysView[str]] = None
+
+    def _flush() -> None:
+        """Insert the pending rows."""
+        nonlocal count
+        if not pending:
+            return
+        bind.execute(statement, pending)
+        count += len(pending)
+        pending.clear()
+
+    try:
+        for row in rows:
+            if pending and (len(pending) >= batch_size or row.keys() != keys):
+                _flush()
+            if not pending:
+                keys = row.keys()
+            pending.append(row)
+    except exceptions.BatchError:
+        _flush()
+        raise
+    _flush()
+    return count
@@ -0,0 +1,126 @@
+"""Calculate the loader options that eagerly load what to_dict converts."""
+
+import enum
+import typing
+
+import sqlalchemy
+from sqlalchemy import orm
+
+from .. import helpers
+from .. import types as oa_types
+from . import resolved
+from .to_dict import fields
+
+
+class Strategy(str, enum.Enum):
+    """The strategies for eagerly loading relationships."""
+
+    # Load the related instances using a second SELECT ... WHERE ... IN query
+    SELECTIN = "selectin"
+    # Load the related instances using a JOIN in the same query
+    JOINED = "joined"
+
+
+# The name of the loader option for each strategy
+_LOADERS = {Strategy.SELECTIN: "selectinload", Strategy.JOINED: "joinedload"}
+
+
+def _read_only_keys(property_: resolved.Property) -> typing.Optional[typing.List[str]]:
+    """Get the keys of a readOnly property or None if it is not readOnly."""
+    schema = property_.schema
+    read_only = property_.read_only
+    if property_.type == "array" and property_.items is not None:
+        schema = property_.items.schema
+        read_only = read_only or property_.items.read_only
+    if not read_only:
+        return None
+    return list(schema.get(oa_types.OpenApiProperties.PROPERTIES, {}).keys())
+
+
+def _relationships(
+    model: typing.Any,
+) -> typing.Iterator[typing.Tuple[str, typing.Optional[resolved.Property]]]:
+    """Iterate over the relationships of a model and its parents included by to_dict."""
+    schema = model._get_schema()
+    if helpers.schema.inherits(schema=schema, schemas={}):
+        yield from _relationships(model._get_parent(schema=schema))
+    resolved_properties = model._get_resolved_properties()
+    for entry in model._get_to_dict_plan():
+        if entry.relationship:
+            yield entry.name, resolved_properties.get(entry.name)
+
+
+def calculate(
+    *,
+    model: typing.Any,
+    selection: typing.Optional[fields.Selection] = None,
+    strategy: typing.Union[Strategy, str] = Strategy.SELECTIN,
+) -> typing.List[typing.Any]:
+    """
+    Calculate the loader options for the relationships included by to_dict.
+
+    A loader option is calculated for each relationship that is selected, chained
+    through the relationships of the related models. The related instances of
+    readOnly properties are only loaded with the columns in the readOnly schema. If
+    neither the properties nor the depth of the related instances are selected,
+    relationships back to a model that is already being loaded are not followed so
+    that the options are finite.
+
+    Args:
+        model: The model whose instances are converted.
+        selection (optional): The properties to include. All properties are included
+            if it is not set.
+        strategy (optional): How the relationships are loaded.
+
+    Returns:
+        The loader options to pass to Query.options.
+
+    """
+    loader_name = _LOADERS[Strategy(strategy)]
+    options: typing.List[typing.Any] = []
+
+    def _calculate(
+        model_: typing.Any,
+        selection_: typing.Optional[fields.Selection],
+        parent: typing.Optional[typing.Any],
+        path: typing.FrozenSet[typing.Type],
+    ) -> bool:
+        """Add the options of a model returning whether any were added."""
+        relationships = sqlalchemy.inspect(model_).relationships
+        added = False
+        for name, property_ in _relationships(model_):
+            if name not in relationships:
+                continue
+            if selection_ is not None and not selection_.includes(
+                name, relationship=True
+            ):
+                continue
+            attribute = getattr(model_, name)
+            option = getattr(orm if parent is None else parent, loader_name)(attribute)
+            added = True
+
+            related_mapper = relationships[name].mapper
+            nested = None if selection_ is None else selection_.nested(name)
+            keys = None if property_ is None else _read_only_keys(property_)
+            if keys is not None:
+                columns = [
+                    key
+                    for key in keys
+                    if key in related_mapper.column_attrs
+                    and (nested is None or nested.includes(key))
+                ]
+                options.append(option.load_only(*columns) if columns else option)
+                continue
+
+            related_model = related_mapper.class_
+            unbounded = nested is None or (
+                nested.include is None and nested.max_depth is None
+            )
+            if (unbounded and related_model in path) or not _calculate(
+                related_model, nested, option, path | {related_model}
+            ):
+                options.append(option)
+        return added
+
+    _calculate(model, selection, None, frozenset({model}))
+    return options
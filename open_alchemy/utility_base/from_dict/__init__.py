@@ -1,41 +1,136 @@
 """Convert from a dictionary to a column value."""
 
+import types as py_types
 import typing
 
 from ... import exceptions
 from ... import helpers
 from ... import types as oa_types
+from .. import resolved
 from .. import types
 from . import array
 from . import object_
 from . import simple
 
 
-def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyCol:
+def convert(
+    *,
+    schema: oa_types.Schema,
+    value: typing.Any,
+    namespace: typing.Optional[py_types.ModuleType] = None,
+) -> types.TAnyCol:
     """
     Convert value for a schema to a dictionary.
 
     Args:
         value: The value to convert.
         schema: The schema of the value.
+        namespace (optional): The namespace of the models referenced by the schema.
+            Defaults to the namespace of the current context.
 
     Returns:
         The converted value.
 
     """
-    type_ = helpers.peek.type_(schema=schema, schemas={})
-    read_only = helpers.peek.read_only(schema=schema, schemas={})
-    if read_only:
-        raise exceptions.MalformedModelDictionaryError(
-            "readOnly properties cannot be passed to the from_dict constructor."
-        )
-    json = helpers.peek.json(schema=schema, schemas={})
-    if json:
-        return value
+    return compile_(property_=resolved.resolve(schema=schema), namespace=namespace)(
+        value
+    )
+
+
+def _reject_read_only(_: typing.Any) -> types.TAnyCol:
+    """Raise for readOnly properties."""
+    raise exceptions.MalformedModelDictionaryError(
+        "readOnly properties cannot be passed to the from_dict constructor."
+    )
+
+
+def _identity(value: typing.Any) -> types.TAnyCol:
+    """Return the value as is."""
+    return value
+
+
+def compile_(
+    *,
+    property_: resolved.Property,
+    check_types: bool = True,
+    namespace: typing.Optional[py_types.ModuleType] = None,
+) -> types.TFromDictConverter:
+    """
+    Calculate the function that converts values for a property.
+
+    Args:
+        property_: The resolved property of the values.
+        check_types: Whether the function checks that simple values are of the type
+            implied by the schema.
+        namespace (optional): The namespace of the models referenced by the
+            property. Defaults to the namespace of the current context.
+
+    Returns:
+        The function that converts a value from a dictionary to a column value.
+
+    """
+    type_ = resolved.type_(property_=property_)
+    if property_.read_only:
+        return _reject_read_only
+    if property_.json:
+        return _identity
     if type_ == "object":
-        return object_.convert(value, schema=schema)
+        return object_.compile_(property_=property_, namespace=namespace)
     if type_ == "array":
-        return array.convert(value, schema=schema)
+        return array.compile_(property_=property_, namespace=namespace)
     if type_ in helpers.type_.SIMPLE_TYPES:
-        return simple.convert(value, schema=schema)
+        return simple.compile_(property_=property_, check_types=check_types)
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+
+
+def compile_plan(
+    *,
+    properties: oa_types.Schema,
+    resolved_properties: typing.Optional[typing.Dict[str, resolved.Property]] = None,
+    check_types: bool = True,
+    namespace: typing.Optional[py_types.ModuleType] = None,
+) -> types.TFromDictPlan:
+    """
+    Calculate the conversion plan for the properties of a model.
+
+    Any property whose schema can't be resolved or compiled falls back to converting
+    the value with convert so that any error is raised only if a value for it is
+    converted.
+
+    Args:
+        properties: The properties of the model schema.
+        resolved_properties (optional): The properties already resolved from the
+            properties of the model schema.
+        check_types: Whether the functions check that simple values are of the type
+            implied by the schema.
+        namespace (optional): The namespace of the models referenced by the
+            properties, usually the namespace of the model. Defaults to the namespace
+            of the current context when the plan is calculated.
+
+    Returns:
+        The function that converts the value for each property.
+
+    """
+
+    def _defer(property_schema: oa_types.Schema) -> types.TFromDictConverter:
+        """Convert with the schema when the value is converted."""
+        return lambda value: convert(
+            schema=property_schema, value=value, namespace=namespace
+        )
+
+    if resolved_properties is None:
+        resolved_properties = resolved.resolve_properties(properties=properties)
+
+    plan: types.TFromDictPlan = {}
+    for name, property_schema in properties.items():
+        property_ = resolved_properties.get(name)
+        if property_ is None:
+            plan[name] = _defer(property_schema)
+            continue
+        try:
+            plan[name] = compile_(
+                property_=property_, check_types=check_types, namespace=namespace
+            )
+        except exceptions.BaseError:
+            plan[name] = _defer(property_schema)
+    return plan
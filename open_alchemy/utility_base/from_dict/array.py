@@ -1,10 +1,11 @@
 """Convert array values to columns."""
 
-import functools
+import types as py_types
+import typing
 
 from ... import exceptions
-from ... import helpers
 from ... import types as oa_types
+from .. import resolved
 from .. import types
 from . import object_
 
@@ -26,27 +27,55 @@ def convert(
     Returns:
         The converted value.
 
+    """
+    return compile_(property_=resolved.resolve(schema=schema))(value)
+
+
+def compile_(
+    *,
+    property_: resolved.Property,
+    namespace: typing.Optional[py_types.ModuleType] = None,
+) -> types.TFromDictArrayConverter:
+    """
+    Calculate the function that converts array values for a property.
+
+    Raises MalformedSchemaError if the items schema is missing from the schema.
+    Raises MalformedSchemaError if the items type is not object.
+
+    Args:
+        property_: The resolved property of the values.
+        namespace (optional): The namespace of the models of the items. Defaults to
+            the namespace of the current context.
+
+    Returns:
+        The function that converts an array value from a dictionary to a column.
+
     """
     # Check the schema
-    items_schema = helpers.peek.items(schema=schema, schemas={})
-    if items_schema is None:
+    items = property_.items
+    if items is None:
         raise exceptions.MalformedSchemaError(
             "To construct array parameters the schema for the property "
             "must include the items property with the information about "
             "the array items."
         )
-    items_type = helpers.peek.type_(schema=items_schema, schemas={})
-    if items_type != "object":
+    if resolved.type_(property_=items) != "object":
         raise exceptions.MalformedSchemaError(
             "The type of the array items must be object."
         )
+    item_conversion = object_.compile_(property_=items, namespace=namespace)
+
+    def _convert(value: types.TOptArrayDict) -> types.TOptArrayCol:
+        """Convert array value from a dictionary to a column."""
+        if value is None:
+            return None
+        # Convert values
+        try:
+            converted_items = map(item_conversion, value)
+        except TypeError as exc:
+            raise exceptions.InvalidInstanceError(
+                "Array values must be iterable."
+            ) from exc
+        return list(converted_items)
 
-    if value is None:
-        return None
-    # Convert values
-    item_conversion = functools.partial(object_.convert, schema=items_schema)
-    try:
-        converted_items = map(item_conversion, value)
-    except TypeError as exc:
-        raise exceptions.InvalidInstanceError("Array values must be iterable.") from exc
-    return list(converted_items)
+    return _convert
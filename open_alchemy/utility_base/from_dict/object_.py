@@ -1,9 +1,12 @@
 """Convert object dictionary to column value."""
 
+import types as py_types
+import typing
+
 from ... import exceptions
 from ... import facades
-from ... import helpers
 from ... import types as oa_types
+from .. import resolved
 from .. import types
 
 
@@ -23,22 +26,60 @@ def convert(
         The converted value.
 
     """
-    ref_model_name = helpers.ext_prop.get(
-        source=schema, name=oa_types.ExtensionProperties.DE_REF
-    )
+    return compile_(property_=resolved.resolve(schema=schema))(value)
+
+
+def compile_(
+    *,
+    property_: resolved.Property,
+    namespace: typing.Optional[py_types.ModuleType] = None,
+) -> types.TFromDictObjectConverter:
+    """
+    Calculate the function that converts dictionary values to model instances.
+
+    The referenced model is retrieved from the namespace on the first conversion and
+    re-used after that.
+
+    Raises MalformedSchemaError if the schema does not have x-de-$ref.
+
+    Args:
+        property_: The resolved property for the values.
+        namespace (optional): The namespace of the models, usually the namespace of
+            the model of the property. Defaults to the namespace of the current
+            context when the function is calculated.
+
+    Returns:
+        The function that converts a dictionary to a model instance.
+
+    """
+    ref_model_name = property_.de_ref
     if ref_model_name is None:
         raise exceptions.MalformedSchemaError(
             "To construct object parameters the schema for the property must "
             "include the x-de-$ref extension property with the name of the "
             "model to construct for the property."
         )
-    if not isinstance(value, dict):
-        raise exceptions.InvalidInstanceError(
-            "The value for an object parameter must be a dictionary."
-        )
-    ref_model = facades.models.get_model(name=ref_model_name)
-    if ref_model is None:
-        raise exceptions.SchemaNotFoundError(
-            f"The referenced model {ref_model} was not found in the models."
-        )
-    return ref_model.from_dict(**value)
+    ref_model_name_: str = ref_model_name
+    ref_model: typing.Any = None
+    namespace_ = facades.models.get_namespace() if namespace is None else namespace
+
+    def _convert(value: typing.Any) -> types.TOptObjectCol:
+        """Convert dictionary value to model instance."""
+        nonlocal ref_model
+
+        if not isinstance(value, dict):
+            raise exceptions.InvalidInstanceError(
+                "The value for an object parameter must be a dictionary."
+            )
+        if ref_model is None:
+            ref_model = facades.models.get_model(
+                name=ref_model_name_, namespace=namespace_
+            )
+            if ref_model is None:
+                raise exceptions.SchemaNotFoundError(
+                    f"The referenced model {ref_model_name_} was not found in the "
+                    "models."
+                )
+        return ref_model.from_dict(**value)
+
+    return _convert
@@ -3,10 +3,13 @@
 import datetime
 
 from ... import exceptions
-from ... import helpers
 from ... import types as oa_types
+from .. import resolved
 from .. import types
 
+# The formats of strings that are converted to another type for the column
+_STRING_FORMATS = {"date", "date-time", "binary"}
+
 
 def convert(
     value: types.TOptSimpleDict, *, schema: oa_types.Schema
@@ -24,58 +27,127 @@ def convert(
         The value converted for a column.
 
     """
-    type_ = helpers.peek.type_(schema=schema, schemas={})
-    if value is None:
-        return None
+    return compile_(property_=resolved.resolve(schema=schema))(value)
+
+
+def compile_(
+    *, property_: resolved.Property, check_types: bool = True
+) -> types.TFromDictSimpleConverter:
+    """
+    Calculate the function that converts simple values for a property.
+
+    Args:
+        property_: The resolved property for the values.
+        check_types: Whether the function checks that the value is of the type implied
+            by the schema.
 
+    Returns:
+        The function that converts a value from a dictionary to the column equivalent.
+
+    """
+    type_ = resolved.type_(property_=property_)
+
+    # Strings with a format are still converted to the column type
+    if not check_types and (
+        type_ in {"integer", "number", "boolean"}
+        or (type_ == "string" and property_.format not in _STRING_FORMATS)
+    ):
+        return _pass_through
     if type_ == "integer":
-        if not isinstance(value, int):
-            raise exceptions.InvalidInstanceError(
-                "Integer type columns must have int values."
-            )
-        return value
+        return _convert_integer
     if type_ == "number":
-        if not isinstance(value, float):
-            raise exceptions.InvalidInstanceError(
-                "Number type columns must have float values."
-            )
-        return value
+        return _convert_number
     if type_ == "string":
-        return _handle_string(value, schema=schema)
+        return _compile_string(property_=property_)
     if type_ == "boolean":
-        if not isinstance(value, bool):
-            raise exceptions.InvalidInstanceError(
-                "Boolean type columns must have bool values."
-            )
-        return value
+        return _convert_boolean
 
-    raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+    def _convert_not_implemented(value: types.TOptSimpleDict) -> None:
+        """Raise for types that are not supported."""
+        if value is None:
+            return None
+        raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
+    return _convert_not_implemented
 
-def _handle_string(
-    value: types.TSimpleDict, *, schema: oa_types.Schema
-) -> types.TStringCol:
-    """
-    Convert string type value to column type.
 
-    Raises InvalidInstanceError if the value is not of the type implied by the schema.
+def _pass_through(value: types.TOptSimpleDict) -> types.TOptSimpleCol:
+    """Return the value without checking its type."""
+    return value
 
-    Args:
-        value: The value to convert.
 
-    Returns:
-        The converted value.
+def _convert_integer(value: types.TOptSimpleDict) -> types.TOptSimpleCol:
+    """Convert integer value."""
+    if value is None:
+        return None
+    if not isinstance(value, int):
+        raise exceptions.InvalidInstanceError(
+            "Integer type columns must have int values."
+        )
+    return value
 
-    """
-    if not isinstance(value, str):
+
+def _convert_number(value: types.TOptSimpleDict) -> types.TOptSimpleCol:
+    """Convert number value."""
+    if value is None:
+        return None
+    if not isinstance(value, float):
         raise exceptions.InvalidInstanceError(
-            "String type columns must have str values."
+            "Number type columns must have float values."
         )
-    format_ = helpers.peek.format_(schema=schema, schemas={})
-    if format_ == "date":
-        return datetime.date.fromisoformat(value)
-    if format_ == "date-time":
-        return datetime.datetime.fromisoformat(value)
-    if format_ == "binary":
-        return value.encode()
     return value
+
+
+def _convert_boolean(value: types.TOptSimpleDict) -> types.TOptSimpleCol:
+    """Convert boolean value."""
+    if value is None:
+        return None
+    if not isinstance(value, bool):
+        raise exceptions.InvalidInstanceError(
+            "Boolean type columns must have bool values."
+        )
+    return value
+
+
+def _compile_string(*, property_: resolved.Property) -> types.TFromDictSimpleConverter:
+    """
+    Calculate the function that converts string type values to the column type.
+
+    Args:
+        property_: The resolved property for the values.
+
+    Returns:
+        The function that converts the value.
+
+    """
+    format_ = property_.format
+
+    def _handle_string(value: types.TOptSimpleDict) -> types.TOptSimpleCol:
+        """
+        Convert string type value to column type.
+
+        Raises InvalidInstanceError if the value is not of the type implied by the
+        schema.
+
+        Args:
+            value: The value to convert.
+
+        Returns:
+            The converted value.
+
+        """
+        if value is None:
+            return None
+        if not isinstance(value, str):
+            raise exceptions.InvalidInstanceError(
+                "String type columns must have str values."
+            )
+        if format_ == "date":
+            return datetime.date.fromisoformat(value)
+        if format_ == "date-time":
+            return datetime.datetime.fromisoformat(value)
+        if format_ == "binary":
+            return value.encode()
+        return value
+
+    return _handle_string
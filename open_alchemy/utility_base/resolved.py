@@ -0,0 +1,156 @@
+"""Properties of a model schema resolved once for the runtime utilities."""
+
+import typing
+
+from .. import exceptions
+from .. import helpers
+from .. import types as oa_types
+
+
+class Property:
+    """
+    The values of a property schema that the runtime utilities depend on.
+
+    Attrs:
+        schema: The schema the property was resolved from.
+        type: The type of the property or None if it does not have a type.
+        format: The format of the property.
+        nullable: Whether the property is nullable.
+        read_only: Whether the property is readOnly.
+        write_only: Whether the property is writeOnly.
+        json: The value of x-json for the property.
+        items: The resolved items of the property.
+        de_ref: The name of the model referenced by the property (x-de-$ref).
+
+    """
+
+    __slots__ = (
+        "schema",
+        "type",
+        "format",
+        "nullable",
+        "read_only",
+        "write_only",
+        "json",
+        "items",
+        "de_ref",
+    )
+
+    schema: oa_types.Schema
+    type: typing.Optional[str]
+    format: typing.Optional[str]
+    nullable: typing.Optional[bool]
+    read_only: typing.Optional[bool]
+    write_only: typing.Optional[bool]
+    json: typing.Optional[bool]
+    items: typing.Optional["Property"]
+    de_ref: typing.Optional[str]
+
+    def __init__(
+        self,
+        *,
+        schema: oa_types.Schema,
+        type_: typing.Optional[str] = None,
+        format_: typing.Optional[str] = None,
+        nullable: typing.Optional[bool] = None,
+        read_only: typing.Optional[bool] = None,
+        write_only: typing.Optional[bool] = None,
+        json: typing.Optional[bool] = None,
+        items: typing.Optional["Property"] = None,
+        de_ref: typing.Optional[str] = None,
+    ) -> None:
+        """Construct."""
+        self.schema = schema
+        self.type = type_
+        self.format = format_
+        self.nullable = nullable
+        self.read_only = read_only
+        self.write_only = write_only
+        self.json = json
+        self.items = items
+        self.de_ref = de_ref
+
+    def __repr__(self) -> str:
+        """Calculate the repr."""
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self.__slots__[1:]
+        )
+        return f"{type(self).__name__}({values})"
+
+
+def resolve(*, schema: oa_types.Schema) -> Property:
+    """
+    Resolve the values of a property schema used by the runtime utilities.
+
+    Assume that any $ref and allOf has already been resolved. A missing type is
+    recorded as None so that it is only reported where a type is required.
+
+    Raises MalformedSchemaError if any of the values are malformed.
+
+    Args:
+        schema: The schema of the property.
+
+    Returns:
+        The resolved property.
+
+    """
+    type_value = schema.get(oa_types.OpenApiProperties.TYPE)
+    if type_value is not None and not isinstance(type_value, str):
+        raise exceptions.TypeMissingError(
+            "A type property value must be of type string."
+        )
+    items_schema = helpers.peek.items(schema=schema, schemas={})
+    return Property(
+        schema=schema,
+        type_=type_value,
+        format_=helpers.peek.format_(schema=schema, schemas={}),
+        nullable=helpers.peek.nullable(schema=schema, schemas={}),
+        read_only=helpers.peek.read_only(schema=schema, schemas={}),
+        write_only=helpers.peek.write_only(schema=schema, schemas={}),
+        json=helpers.peek.json(schema=schema, schemas={}),
+        items=None if items_schema is None else resolve(schema=items_schema),
+        de_ref=helpers.ext_prop.get(
+            source=schema, name=oa_types.ExtensionProperties.DE_REF
+        ),
+    )
+
+
+def type_(*, property_: Property) -> str:
+    """
+    Get the type of a resolved property.
+
+    Raises TypeMissingError if the property does not have a type.
+
+    Args:
+        property_: The resolved property.
+
+    Returns:
+        The type of the property.
+
+    """
+    if property_.type is None:
+        raise exceptions.TypeMissingError("Every property requires a type.")
+    return property_.type
+
+
+def resolve_properties(*, properties: oa_types.Schema) -> typing.Dict[str, Property]:
+    """
+    Resolve each of the properties of a model schema.
+
+    Any property that can't be resolved is left out so that the error is only raised
+    if a value for it is converted.
+
+    Args:
+        properties: The properties of the model schema.
+
+    Returns:
+        The resolved property for each property name.
+
+    """
+    resolved: typing.Dict[str, Property] = {}
+    for name, schema in properties.items():
+        try:
+            resolved[name] = resolve(schema=schema)
+        except exceptions.BaseError:
+            continue
+    return resolved
@@ -0,0 +1,60 @@
+"""Incrementally encode collections of dictionaries as JSON."""
+
+import typing
+
+from .. import facades
+from . import types
+
+
+def iterate(
+    values: typing.Iterable[typing.Dict[str, typing.Any]],
+    *,
+    ndjson: bool = False,
+    backend: typing.Optional[facades.json.Backend] = None,
+) -> typing.Iterator[str]:
+    """
+    Encode the values as JSON one value at a time.
+
+    Only a single value is held in memory at a time. Joining the chunks of a JSON
+    array results in the same string as encoding the list of values.
+
+    Args:
+        values: The values to encode.
+        ndjson: Whether to encode as newline delimited JSON instead of a JSON array.
+        backend: The library to encode with. If not set, the default is used.
+
+    Returns:
+        The chunks of the JSON string.
+
+    """
+    if ndjson:
+        for value in values:
+            yield f"{facades.json.dumps(value, backend=backend)}\n"
+        return
+
+    separator = "["
+    for value in values:
+        yield f"{separator}{facades.json.dumps(value, backend=backend)}"
+        separator = ", "
+    yield "[]" if separator == "[" else "]"
+
+
+def write(
+    values: typing.Iterable[typing.Dict[str, typing.Any]],
+    file: types.TWritable,
+    *,
+    ndjson: bool = False,
+    backend: typing.Optional[facades.json.Backend] = None,
+) -> None:
+    """
+    Encode the values as JSON and write them to a file one value at a time.
+
+    Args:
+        values: The values to encode.
+        file: The file-like object to write to.
+        ndjson: Whether to encode as newline delimited JSON instead of a JSON array.
+        backend: The library to encode with. If not set, the default is used.
+
+    """
+    for chunk in iterate(values, ndjson=ndjson, backend=backend):
+        file.write(chunk)
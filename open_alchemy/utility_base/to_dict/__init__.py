@@ -5,8 +5,10 @@ import typing
 from ... import exceptions
 from ... import helpers
 from ... import types as oa_types
+from .. import resolved
 from .. import types
 from . import array
+from . import fields
 from . import object_
 from . import simple
 
@@ -23,10 +25,10 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
         The converted value.
 
     """
-    json = helpers.peek.json(schema=schema, schemas={})
-    if json:
+    property_ = resolved.resolve(schema=schema)
+    if property_.json:
         return value
-    type_ = helpers.peek.type_(schema=schema, schemas={})
+    type_ = resolved.type_(property_=property_)
     if type_ == "object":
         return object_.convert(value, schema=schema)
     if type_ == "array":
@@ -36,6 +38,34 @@ def convert(*, schema: oa_types.Schema, value: typing.Any) -> types.TAnyDict:
     raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
 
+def _identity(value: typing.Any) -> types.TAnyDict:
+    """Return the value as is."""
+    return value
+
+
+def compile_(*, property_: resolved.Property) -> types.TToDictConverter:
+    """
+    Calculate the function that converts values for a property to a dictionary value.
+
+    Args:
+        property_: The resolved property of the values.
+
+    Returns:
+        The function that converts a value.
+
+    """
+    if property_.json:
+        return _identity
+    type_ = resolved.type_(property_=property_)
+    if type_ == "object":
+        return object_.compile_(property_=property_)
+    if type_ == "array":
+        return array.compile_(property_=property_)
+    if type_ in helpers.type_.SIMPLE_TYPES:
+        return simple.compile_(property_=property_)
+    raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+
+
 def return_none(*, schema: oa_types.Schema, property_name: str) -> bool:
     """
     Check whether a null value for a property should be returned.
@@ -67,3 +97,74 @@ def return_none(*, schema: oa_types.Schema, property_name: str) -> bool:
     if nullable_value is True:
         return True
     return False
+
+
+def compile_plan(
+    *,
+    schema: oa_types.Schema,
+    resolved_properties: typing.Optional[typing.Dict[str, resolved.Property]] = None,
+) -> types.TToDictPlan:
+    """
+    Calculate the plan for converting instances of a model to a dictionary.
+
+    Assume the schema has properties and that any $ref and allOf has already been
+    resolved. writeOnly properties are not included in the plan. Any property whose
+    schema can't be resolved or compiled falls back to converting the value with
+    convert so that any error is raised only if a value for it is converted.
+
+    Args:
+        schema: The schema for the model.
+        resolved_properties (optional): The properties already resolved from the
+            properties of the model schema.
+
+    Returns:
+        The name, conversion function, whether None is returned and whether the values
+        are related model instances for each property that is included in the
+        dictionary.
+
+    """
+
+    def _defer(property_schema: oa_types.Schema) -> types.TToDictConverter:
+        """Convert with the schema when the value is converted."""
+        return lambda value: convert(schema=property_schema, value=value)
+
+    properties = schema[oa_types.OpenApiProperties.PROPERTIES]
+    if resolved_properties is None:
+        resolved_properties = resolved.resolve_properties(properties=properties)
+    required = set(schema.get(oa_types.OpenApiProperties.REQUIRED, ()))
+
+    entries: typing.List[types.ToDictPlanEntry] = []
+    for name, property_schema in properties.items():
+        property_ = resolved_properties.get(name)
+        if property_ is None:
+            if helpers.peek.write_only(schema=property_schema, schemas={}):
+                continue
+            entries.append(
+                types.ToDictPlanEntry(
+                    name=name,
+                    convert=_defer(property_schema),
+                    return_none=return_none(schema=schema, property_name=name),
+                )
+            )
+            continue
+        if property_.write_only:
+            continue
+
+        try:
+            convert_ = compile_(property_=property_)
+        except exceptions.BaseError:
+            convert_ = _defer(property_schema)
+            relationship = False
+        else:
+            relationship = not property_.json and resolved.type_(
+                property_=property_
+            ) in {"object", "array"}
+        entries.append(
+            types.ToDictPlanEntry(
+                name=name,
+                convert=convert_,
+                return_none=name in required or property_.nullable is True,
+                relationship=relationship,
+            )
+        )
+    return tuple(entries)
@@ -1,12 +1,12 @@
 """Convert array to dictionary."""
 
-import functools
 import typing
 
 from ... import exceptions
-from ... import helpers
 from ... import types as ao_types
+from .. import resolved
 from .. import types
+from . import fields
 from . import object_
 
 
@@ -28,22 +28,51 @@ def convert(value: typing.Any, *, schema: ao_types.Schema) -> types.TOptArrayDic
     """
     if value is None:
         return None
-    item_schema = helpers.peek.items(schema=schema, schemas={})
-    if item_schema is None:
+    return compile_(property_=resolved.resolve(schema=schema))(value)
+
+
+def compile_(*, property_: resolved.Property) -> types.TToDictArrayConverter:
+    """
+    Calculate the function that converts array values for a property.
+
+    Raises MalformedSchemaError if schema does not define item schema.
+    Raises MalformedSchemaError if the item schema is not of type object.
+
+    Args:
+        property_: The resolved property for the values.
+
+    Returns:
+        The function that converts a value to a list of dictionary.
+
+    """
+    items = property_.items
+    if items is None:
         raise exceptions.MalformedSchemaError(
             "The array item schema must have an items property."
         )
-    item_type = helpers.peek.type_(schema=item_schema, schemas={})
-    if item_type != "object":
+    if resolved.type_(property_=items) != "object":
         raise exceptions.FeatureNotImplementedError(
             "The array item schema must be of type object."
         )
-    read_only = helpers.peek.read_only(schema=schema, schemas={})
-    item_conversion = functools.partial(
-        object_.convert, schema=item_schema, read_only=read_only
-    )
-    try:
-        converted_items = map(item_conversion, value)
-    except TypeError as exc:
-        raise exceptions.InvalidInstanceError("Array values must be iterable.") from exc
-    return list(converted_items)
+    item_conversion = object_.compile_(property_=items, read_only=property_.read_only)
+
+    def _convert(
+        value: typing.Any, selection: typing.Optional[fields.Selection] = None
+    ) -> types.TOptArrayDict:
+        """Convert array property to a list of dictionary."""
+        if value is None:
+            return None
+        try:
+            if selection is None:
+                converted_items = map(item_conversion, value)
+            else:
+                converted_items = map(
+                    lambda item: item_conversion(item, selection), value
+                )
+        except TypeError as exc:
+            raise exceptions.InvalidInstanceError(
+                "Array values must be iterable."
+            ) from exc
+        return list(converted_items)
+
+    return _convert
@@ -0,0 +1,135 @@
+"""Select the properties included by to_dict using field paths."""
+
+import functools
+import typing
+
+TPaths = typing.Tuple[str, ...]
+
+
+def _nested_paths(paths: TPaths, name: str) -> TPaths:
+    """Calculate the paths relative to a property for the paths nested in it."""
+    prefix = f"{name}."
+    return tuple(path[len(prefix) :] for path in paths if path.startswith(prefix))
+
+
+class Selection:
+    """
+    The properties of a model instance and its related instances included by to_dict.
+
+    A field path is the name of a property, optionally followed by the dot separated
+    path of a property of the related instances, for example division.name.
+
+    Attrs:
+        include: The paths of the properties to include. If it is None, all
+            properties are included. A property is included if its path or the path
+            of any property nested in it is included.
+        exclude: The paths of the properties not to include.
+        max_depth: The number of levels of related instances to include. If it is
+            None, the related instances are included at any depth.
+
+    """
+
+    __slots__ = ("include", "exclude", "max_depth", "_names", "_excluded", "_nested")
+
+    include: typing.Optional[TPaths]
+    exclude: TPaths
+    max_depth: typing.Optional[int]
+
+    def __init__(
+        self,
+        *,
+        include: typing.Optional[TPaths] = None,
+        exclude: TPaths = (),
+        max_depth: typing.Optional[int] = None,
+    ) -> None:
+        """Construct."""
+        self.include = include
+        self.exclude = exclude
+        self.max_depth = max_depth
+        self._names: typing.Optional[typing.FrozenSet[str]] = (
+            None
+            if include is None
+            else frozenset(path.split(".", 1)[0] for path in include)
+        )
+        self._excluded = frozenset(path for path in exclude if "." not in path)
+        self._nested: typing.Dict[str, typing.Optional["Selection"]] = {}
+
+    def includes(self, name: str, *, relationship: bool = False) -> bool:
+        """
+        Check whether a property is included.
+
+        Args:
+            name: The name of the property.
+            relationship: Whether the property is a relationship.
+
+        Returns:
+            Whether to include the property.
+
+        """
+        if relationship and self.max_depth is not None and self.max_depth <= 0:
+            return False
+        if name in self._excluded:
+            return False
+        return self._names is None or name in self._names
+
+    def nested(self, name: str) -> typing.Optional["Selection"]:
+        """
+        Calculate the selection for the related instances of a property.
+
+        Args:
+            name: The name of the property.
+
+        Returns:
+            The selection or None if all properties of the related instances are
+            included at any depth.
+
+        """
+        if name not in self._nested:
+            include = self.include
+            if include is not None and name not in include:
+                include = _nested_paths(include, name)
+            elif include is not None:
+                include = None
+            self._nested[name] = create(
+                include=include,
+                exclude=_nested_paths(self.exclude, name),
+                max_depth=None if self.max_depth is None else self.max_depth - 1,
+            )
+        return self._nested[name]
+
+
+@functools.lru_cache(maxsize=1024)
+def _create(
+    include: typing.Optional[TPaths], exclude: TPaths, max_depth: typing.Optional[int]
+) -> Selection:
+    """Create the selection, re-using it for the same arguments."""
+    return Selection(include=include, exclude=exclude, max_depth=max_depth)
+
+
+def create(
+    *,
+    include: typing.Optional[typing.Iterable[str]] = None,
+    exclude: typing.Optional[typing.Iterable[str]] = None,
+    max_depth: typing.Optional[int] = None,
+) -> typing.Optional[Selection]:
+    """
+    Create the selection of the properties included by to_dict.
+
+    Args:
+        include: The paths of the properties to include.
+        exclude: The paths of the properties not to include.
+        max_depth: The number of levels of related instances to include.
+
+    Returns:
+        The selection or None if all properties are included at any depth.
+
+    """
+    if isinstance(include, str):
+        include = (include,)
+    if isinstance(exclude, str):
+        exclude = (exclude,)
+    exclude_paths = () if exclude is None else tuple(sorted(set(exclude)))
+    if include is None and not exclude_paths and max_depth is None:
+        return None
+    include_paths = None if include is None else tuple(sorted(set(include)))
+    return _create(include_paths, exclude_paths, max_depth)
@@ -3,12 +3,15 @@
 import typing
 
 from ... import exceptions
-from ... import helpers
 from ... import types as oa_types
+from .. import resolved
 from .. import types
+from . import fields
 
 
-def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
+def _convert_relationship(
+    *, value: types.TModel, selection: typing.Optional[fields.Selection] = None
+) -> types.TOptObjectDict:
     """
     Convert object relationship property to a dictionary.
 
@@ -18,6 +21,7 @@ def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
 
     Args:
         value: The value to convert.
+        selection (optional): The properties of the value to include.
 
     Returns:
         The object as a dictionary.
@@ -27,7 +31,13 @@ def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
         return None
 
     try:
-        return value.to_dict()
+        if selection is None:
+            return value.to_dict()
+        return value.to_dict(  # type: ignore
+            include=selection.include,
+            exclude=selection.exclude,
+            max_depth=selection.max_depth,
+        )
     except AttributeError as exc:
         raise exceptions.InvalidModelInstanceError(
             "The object property instance does not have a to_dict implementation."
@@ -39,18 +49,13 @@ def _convert_relationship(*, value: types.TModel) -> types.TOptObjectDict:
         ) from exc
 
 
-def _convert_read_only(
-    *, schema: oa_types.Schema, value: typing.Any
-) -> types.TOptObjectDict:
+def _compile_read_only(*, schema: oa_types.Schema) -> types.TToDictObjectConverter:
     """
-    Convert readOnly value to a dictionary.
+    Calculate the function that converts readOnly values to a dictionary.
 
     Raise MalformedSchemaError if the schema does not have properties.
     Raise MalformedSchemaError if the schema has empty properties.
     """
-    if value is None:
-        return None
-
     properties = schema.get(oa_types.OpenApiProperties.PROPERTIES)
     if properties is None:
         raise exceptions.MalformedSchemaError(
@@ -64,10 +69,35 @@ def _convert_read_only(
         raise exceptions.MalformedSchemaError(
             "readOnly object definitions must have at least 1 property."
         )
-    return_dict = {}
-    for key in properties.keys():
-        return_dict[key] = getattr(value, key, None)
-    return return_dict
+    keys = tuple(properties.keys())
+
+    def _convert(
+        value: typing.Any, selection: typing.Optional[fields.Selection] = None
+    ) -> types.TOptObjectDict:
+        """Convert readOnly value to a dictionary."""
+        if value is None:
+            return None
+        if selection is None:
+            return {key: getattr(value, key, None) for key in keys}
+        return {
+            key: getattr(value, key, None) for key in keys if selection.includes(key)
+        }
+
+    return _convert
+
+
+def _convert_read_only(
+    *, schema: oa_types.Schema, value: typing.Any
+) -> types.TOptObjectDict:
+    """
+    Convert readOnly value to a dictionary.
+
+    Raise MalformedSchemaError if the schema does not have properties.
+    Raise MalformedSchemaError if the schema has empty properties.
+    """
+    if value is None:
+        return None
+    return _compile_read_only(schema=schema)(value)
 
 
 def convert(
@@ -85,7 +115,28 @@ def convert(
         read_only (optional): Whether the schema is read only.
 
     """
-    schema_read_only = helpers.peek.read_only(schema=schema, schemas={})
+    schema_read_only = resolved.resolve(schema=schema).read_only
     if read_only or schema_read_only:
         return _convert_read_only(schema=schema, value=value)
     return _convert_relationship(value=value)
+
+
+def compile_(
+    *, property_: resolved.Property, read_only: typing.Optional[bool] = None
+) -> types.TToDictObjectConverter:
+    """
+    Calculate the function that converts object schema values to dictionaries.
+
+    Args:
+        property_: The resolved property for the values.
+        read_only (optional): Whether the schema is read only.
+
+    Returns:
+        The function that converts a value to a dictionary.
+
+    """
+    if read_only or property_.read_only:
+        return _compile_read_only(schema=property_.schema)
+    return lambda value, selection=None: _convert_relationship(
+        value=value, selection=selection
+    )
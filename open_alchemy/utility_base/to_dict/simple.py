@@ -1,10 +1,11 @@
 """Convert simple types (not object nor array)."""
 
 import datetime
+import typing
 
 from ... import exceptions
-from ... import helpers
 from ... import types as oa_types
+from .. import resolved
 from .. import types
 
 
@@ -24,69 +25,132 @@ def convert(
         The value converted to the expected dictionary value.
 
     """
-    type_ = helpers.peek.type_(schema=schema, schemas={})
-    if value is None:
-        return None
+    return compile_(property_=resolved.resolve(schema=schema))(value)
+
+
+def compile_(*, property_: resolved.Property) -> types.TToDictSimpleConverter:
+    """
+    Calculate the function that converts values with basic types for a property.
+
+    Args:
+        property_: The resolved property for the values.
+
+    Returns:
+        The function that converts a value to the expected dictionary value.
+
+    """
+    type_ = resolved.type_(property_=property_)
 
     if type_ == "integer":
-        if not isinstance(value, int):
-            raise exceptions.InvalidInstanceError(
-                "Integer type columns must have int values."
-            )
-        return value
+        return _convert_integer
     if type_ == "number":
-        if not isinstance(value, float):
-            raise exceptions.InvalidInstanceError(
-                "Number type columns must have float values."
-            )
-        return value
+        return _convert_number
     if type_ == "string":
-        return _handle_string(value, schema=schema)
+        return _compile_string(format_=property_.format)
     if type_ == "boolean":
-        if not isinstance(value, bool):
-            raise exceptions.InvalidInstanceError(
-                "Boolean type columns must have bool values."
-            )
-        return value
+        return _convert_boolean
 
-    raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
+    def _convert_not_implemented(value: types.TOptSimpleCol) -> None:
+        """Raise for types that are not supported."""
+        if value is None:
+            return None
+        raise exceptions.FeatureNotImplementedError(f"Type {type_} is not supported.")
 
+    return _convert_not_implemented
 
-def _handle_string(value: types.TSimpleCol, *, schema: oa_types.Schema) -> str:
-    """
-    Convert string type column to str.
 
-    Raises InvalidInstanceError if the value is not of the type implied by the schema.
+def _convert_integer(value: types.TOptSimpleCol) -> types.TOptSimpleDict:
+    """Convert integer value."""
+    if value is None:
+        return None
+    if not isinstance(value, int):
+        raise exceptions.InvalidInstanceError(
+            "Integer type columns must have int values."
+        )
+    return value
+
+
+def _convert_number(value: types.TOptSimpleCol) -> types.TOptSimpleDict:
+    """Convert number value."""
+    if value is None:
+        return None
+    if not isinstance(value, float):
+        raise exceptions.InvalidInstanceError(
+            "Number type columns must have float values."
+        )
+    return value
+
+
+def _convert_boolean(value: types.TOptSimpleCol) -> types.TOptSimpleDict:
+    """Convert boolean value."""
+    if value is None:
+        return None
+    if not isinstance(value, bool):
+        raise exceptions.InvalidInstanceError(
+            "Boolean type columns must have bool values."
+        )
+    return value
+
+
+def _convert_date(value: types.TOptSimpleCol) -> types.TOptSimpleDict:
+    """Convert date value."""
+    if value is None:
+        return None
+    if not isinstance(value, datetime.date):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with date format must have date values."
+        )
+    return value.isoformat()
+
+
+def _convert_date_time(value: types.TOptSimpleCol) -> types.TOptSimpleDict:
+    """Convert date-time value."""
+    if value is None:
+        return None
+    if not isinstance(value, datetime.datetime):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with date-time format must have datetime values."
+        )
+    return value.isoformat()
+
+
+def _convert_binary(value: types.TOptSimpleCol) -> types.TOptSimpleDict:
+    """Convert binary value."""
+    if value is None:
+        return None
+    if not isinstance(value, bytes):
+        raise exceptions.InvalidInstanceError(
+            "String type columns with binary format must have bytes values."
+        )
+    return value.decode()
+
+
+def _convert_string(value: types.TOptSimpleCol) -> types.TOptSimpleDict:
+    """Convert string value."""
+    if value is None:
+        return None
+    if not isinstance(value, str):
+        raise exceptions.InvalidInstanceError(
+            "String type columns must have str values."
+        )
+    return value
+
+
+def _compile_string(*, format_: typing.Optional[str]) -> types.TToDictSimpleConverter:
+    """
+    Calculate the function that converts string type columns to str.
 
     Args:
-        value: The value to convert.
+        format_: The format of the values.
 
     Returns:
-        The converted value.
+        The function that converts the value.
 
     """
-    format_ = helpers.peek.format_(schema=schema, schemas={})
     if format_ == "date":
-        if not isinstance(value, datetime.date):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with date format must have date values."
-            )
-        return value.isoformat()
+        return _convert_date
     if format_ == "date-time":
-        if not isinstance(value, datetime.datetime):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with date-time format must have datetime "
-                "values."
-            )
-        return value.isoformat()
+        return _convert_date_time
     if format_ == "binary":
-        if not isinstance(value, bytes):
-            raise exceptions.InvalidInstanceError(
-                "String type columns with binary format must have bytes values."
-            )
-        return value.decode()
-    if not isinstance(value, str):
-        raise exceptions.InvalidInstanceError(
-            "String type columns must have str values."
-        )
-    return value
+        return _convert_binary
+    return _convert_string
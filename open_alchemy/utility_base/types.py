@@ -24,6 +24,31 @@ TArrayCol = typing.Iterable[TOptObjectCol]
 TOptArrayCol = typing.Optional[TArrayCol]
 TComplexCol = typing.Union[TOptObjectCol, TOptArrayCol]
 TAnyCol = typing.Union[TComplexCol, TSimpleCol]
+# Types for compiled conversion from a dictionary
+TFromDictConverter = typing.Callable[[typing.Any], TAnyCol]
+TFromDictSimpleConverter = typing.Callable[[TOptSimpleDict], TOptSimpleCol]
+TFromDictObjectConverter = typing.Callable[[typing.Any], TOptObjectCol]
+TFromDictArrayConverter = typing.Callable[[TOptArrayDict], TOptArrayCol]
+TFromDictPlan = typing.Dict[str, TFromDictConverter]
+# Types for compiled conversion to a dictionary
+# The converters of relationships also accept the selection of the properties of the
+# related instances
+TToDictConverter = typing.Callable[..., TAnyDict]
+TToDictSimpleConverter = typing.Callable[[TOptSimpleCol], TOptSimpleDict]
+TToDictObjectConverter = typing.Callable[..., TOptObjectDict]
+TToDictArrayConverter = typing.Callable[..., TOptArrayDict]
+
+
+class ToDictPlanEntry(typing.NamedTuple):
+    """The conversion of a property included in the dictionary."""
+
+    name: str
+    convert: TToDictConverter
+    return_none: bool
+    relationship: bool = False
+
+
+TToDictPlan = typing.Tuple[ToDictPlanEntry, ...]
 
 
 class TModel(oa_types.Protocol):
@@ -32,3 +57,11 @@ class TModel(oa_types.Protocol):
     def to_dict(self) -> TObjectDict:
         """Interface for to_dict."""
         ...
+
+
+class TWritable(oa_types.Protocol):
+    """Defines interface for a file-like object that can be written to."""
+
+    def write(self, value: str) -> typing.Any:
+        """Interface for write."""
+        ...
@@ -0,0 +1,278 @@
+"""The validation of the dictionaries passed to from_dict."""
+
+import contextlib
+import contextvars
+import enum
+import typing
+
+from .. import facades
+from .. import helpers
+from .. import types as oa_types
+
+
+class Level(str, enum.Enum):
+    """The levels of validation of the dictionaries passed to from_dict."""
+
+    # Validate against the model schema and check the type of each value
+    FULL = "full"
+    # Only check the type of each value
+    TYPES = "types"
+    # Only convert the values, for dictionaries that are known to be valid
+    TRUSTED = "trusted"
+
+
+# The level that overrides the level of any model for the current context
+_LEVEL: contextvars.ContextVar[typing.Optional[Level]] = contextvars.ContextVar(
+    "_LEVEL", default=None
+)
+
+
+def get_level() -> typing.Optional[Level]:
+    """
+    Get the level that overrides the level of the models for the current context.
+
+    Returns:
+        The level or None if the level of each model is used.
+
+    """
+    return _LEVEL.get()
+
+
+@contextlib.contextmanager
+def use_level(level: typing.Union[Level, str]) -> typing.Iterator[None]:
+    """
+    Override the level of the models, including any nested models, in the block.
+
+    Args:
+        level: The level to use.
+
+    """
+    token = _LEVEL.set(Level(level))
+    try:
+        yield
+    finally:
+        _LEVEL.reset(token)
+
+
+class Document(typing.NamedTuple):
+    """
+    The validator of a model that also validates the dictionaries of nested models.
+
+    Attrs:
+        validator: The validator for the dictionaries passed to from_dict.
+        models: The models whose nested dictionaries the validator also validates.
+
+    """
+
+    validator: facades.jsonschema.Validator
+    models: typing.FrozenSet[typing.Type]
+
+
+# The models whose dictionaries have already been validated as part of the document
+# that is being converted in the current context
+_VALIDATED: contextvars.ContextVar[
+    typing.FrozenSet[typing.Type]
+] = contextvars.ContextVar("_VALIDATED", default=frozenset())
+
+
+def get_validated() -> typing.FrozenSet[typing.Type]:
+    """
+    Get the models whose dictionaries have already been validated for the context.
+
+    Returns:
+        The models.
+
+    """
+    return _VALIDATED.get()
+
+
+@contextlib.contextmanager
+def use_validated(models: typing.FrozenSet[typing.Type]) -> typing.Iterator[None]:
+    """
+    Record that the dictionaries of the models have been validated in the block.
+
+    Args:
+        models: The models.
+
+    """
+    token = _VALIDATED.set(models)
+    try:
+        yield
+    finally:
+        _VALIDATED.reset(token)
+
+
+def _definition_ref(name: str) -> oa_types.Schema:
+    """Calculate the reference to the definition of the schema of a model."""
+    return {"$ref": f"#/definitions/{name}"}
+
+
+# Keywords whose validation depends on other keywords of the same schema
+_DEPENDENT_KEYWORDS = {
+    "properties",
+    "patternProperties",
+    "additionalProperties",
+    "items",
+    "additionalItems",
+    "if",
+    "then",
+    "else",
+}
+
+
+def _combine(
+    property_schema: oa_types.Schema, ref_schema: oa_types.Schema
+) -> oa_types.Schema:
+    """
+    Combine the schema of a property with the composed schema of the model.
+
+    The schemas are merged if that is equivalent to validating against both, which
+    saves descending into each of them for every value, and combined using allOf
+    otherwise.
+
+    """
+    if _DEPENDENT_KEYWORDS.isdisjoint(property_schema) and all(
+        ref_schema[key] == value
+        for key, value in property_schema.items()
+        if key in ref_schema
+    ):
+        return {**property_schema, **ref_schema}
+    return {"allOf": [property_schema, ref_schema]}
+
+
+def compose(*, model: typing.Any) -> typing.Tuple[oa_types.Schema, typing.FrozenSet]:
+    """
+    Compose the schema of a model with the schemas of the models nested in it.
+
+    Each object property, or array of objects property, that references a model is
+    combined with the composed schema of that model so that a nested dictionary is
+    validated in a single pass. The composed schemas are inlined because resolving
+    references is slow, except for models that reference themselves, directly or
+    indirectly, which are referenced in the definitions instead. The schemas of
+    models that inherit or can't be retrieved are not composed and their dictionaries
+    are validated when the nested model is constructed, as are the dictionaries of
+    models referenced by any property that can't be composed.
+
+    Args:
+        model: The model whose schema to compose.
+
+    Returns:
+        The composed schema and the models whose schemas were composed into it.
+
+    """
+    composed: typing.Dict[str, typing.Optional[oa_types.Schema]] = {}
+    ref_models: typing.Dict[str, typing.Type] = {}
+    # The models that are being composed and the models referenced in the definitions
+    path: typing.Set[str] = set()
+    referenced: typing.Set[str] = set()
+    # The models referenced by a property whose schema could not be composed
+    not_composed: typing.Set[str] = set()
+
+    def _compose_ref(property_schema: oa_types.Schema, name: str) -> oa_types.Schema:
+        """Combine a property schema with the composed schema of a model."""
+        if name in path:
+            referenced.add(name)
+            return {"allOf": [property_schema, _definition_ref(name)]}
+        if name not in composed:
+            ref_model = facades.models.get_model(name=name, namespace=model._models)
+            if ref_model is None or helpers.schema.inherits(
+                schema=ref_model._get_schema(), schemas={}
+            ):
+                composed[name] = None
+            else:
+                path.add(name)
+                composed[name] = _compose_schema(ref_model)
+                path.remove(name)
+                ref_models[name] = ref_model
+        ref_schema = composed[name]
+        if ref_schema is None:
+            return property_schema
+        return _combine(property_schema, ref_schema)
+
+    def _compose_schema(model_: typing.Any) -> oa_types.Schema:
+        """Compose the schemas of the properties of a model."""
+        properties = model_.get_properties()
+        resolved_properties = model_._get_resolved_properties()
+        composed_properties: oa_types.Schema = {}
+        for name, property_schema in properties.items():
+            property_ = resolved_properties.get(name)
+            if property_ is not None and not property_.json:
+                items = property_.items
+                if property_.type == "object" and property_.de_ref is not None:
+                    property_schema = _compose_ref(property_schema, property_.de_ref)
+                elif (
+                    property_.type == "array"
+                    and items is not None
+                    and items.type == "object"
+                    and items.de_ref is not None
+                ):
+                    if oa_types.OpenApiProperties.ITEMS not in property_schema:
+                        not_composed.add(items.de_ref)
+                        composed_properties[name] = property_schema
+                        continue
+                    property_schema = {
+                        **property_schema,
+                        oa_types.OpenApiProperties.ITEMS: _compose_ref(
+                            property_schema[oa_types.OpenApiProperties.ITEMS],
+                            items.de_ref,
+                        ),
+                    }
+            composed_properties[name] = property_schema
+        return {
+            **model_._get_schema(),
+            oa_types.OpenApiProperties.PROPERTIES: composed_properties,
+        }
+
+    schema = _compose_schema(model)
+    if referenced:
+        schema["definitions"] = {name: composed[name] for name in sorted(referenced)}
+    return schema, frozenset(
+        ref_model for name, ref_model in ref_models.items() if name not in not_composed
+    )
+
+
+def locate(
+    *, model: typing.Any, models: typing.FrozenSet, path: typing.Sequence
+) -> typing.Any:
+    """
+    Find the nested model of the dictionary at a path of a dictionary of a model.
+
+    Follows the object and array of objects properties along the path as long as
+    their schemas were composed into the schema of the model.
+
+    Args:
+        model: The model of the dictionary.
+        models: The models whose schemas were composed into the schema of the model.
+        path: The keys and indexes of the path within the dictionary.
+
+    Returns:
+        The innermost model of a dictionary along the path.
+
+    """
+    index = 0
+    while index < len(path):
+        name = path[index]
+        if not isinstance(name, str):
+            break
+        property_ = model._get_resolved_properties().get(name)
+        if property_ is None or property_.json:
+            break
+        items = property_.items
+        if property_.type == "object" and property_.de_ref is not None:
+            ref_name, length = property_.de_ref, 1
+        elif (
+            property_.type == "array"
+            and items is not None
+            and items.type == "object"
+            and items.de_ref is not None
+            and index + 1 < len(path)
+        ):
+            ref_name, length = items.de_ref, 2
+        else:
+            break
+        ref_model = facades.models.get_model(name=ref_name, namespace=model._models)
+        if ref_model is None or ref_model not in models:
+            break
+        model = ref_model
+        index += length
+    return model
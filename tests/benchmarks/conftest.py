@@ -0,0 +1,42 @@
+"""Fixtures for benchmarks."""
+
+import time
+import typing
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect the benchmarks unless they are selected using -m benchmark."""
+    if "benchmark" in (config.getoption("markexpr") or ""):
+        return
+    selected = [item for item in items if item.get_closest_marker("benchmark") is None]
+    if len(selected) == len(items):
+        return
+    config.hook.pytest_deselected(
+        items=[item for item in items if item.get_closest_marker("benchmark")]
+    )
+    items[:] = selected
+
+
+@pytest.fixture
+def measure(record_property):
+    """
+    Measure the throughput of a function in calls per second.
+
+    The throughput is recorded as a property of the test, which is included in the
+    JUnit XML report, under the name it is measured with.
+    """
+
+    def _measure(
+        name: str, func: typing.Callable[[], typing.Any], *, iterations: int
+    ) -> float:
+        """Calculate and record the throughput of a function."""
+        start = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        throughput = iterations / (time.perf_counter() - start)
+        record_property(name, throughput)
+        return throughput
+
+    return _measure
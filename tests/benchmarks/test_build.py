@@ -0,0 +1,57 @@
+"""Benchmarks for importing built packages."""
+
+import runpy
+
+import pytest
+
+from open_alchemy import build
+
+ITERATIONS = 5
+SPEC = {
+    "components": {
+        "schemas": {
+            f"Schema{idx}": {
+                "type": "object",
+                "x-tablename": f"schema_{idx}",
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string", "maxLength": 255},
+                    **(
+                        {"parent": {"$ref": f"#/components/schemas/Schema{idx - 1}"}}
+                        if idx
+                        else {}
+                    ),
+                },
+            }
+            for idx in range(50)
+        }
+    }
+}
+
+
+@pytest.mark.benchmark
+def test_import_throughput(measure, tmp_path):
+    """
+    GIVEN packages built from the same spec with and without precompiled set
+    WHEN the packages are imported repeatedly
+    THEN the throughput of both is recorded.
+    """
+    init_paths = {}
+    for name, precompiled in [("models", False), ("precompiled_models", True)]:
+        build.execute(
+            spec=SPEC,
+            name=name,
+            path=str(tmp_path),
+            format_=build.PackageFormat.NONE,
+            precompiled=precompiled,
+        )
+        init_paths[name] = str(tmp_path / name / name / "__init__.py")
+
+    measure(
+        "import", lambda: runpy.run_path(init_paths["models"]), iterations=ITERATIONS
+    )
+    measure(
+        "import_precompiled",
+        lambda: runpy.run_path(init_paths["precompiled_models"]),
+        iterations=ITERATIONS,
+    )
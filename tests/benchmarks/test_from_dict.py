@@ -0,0 +1,55 @@
+"""Benchmarks for from_dict."""
+
+import pytest
+
+from open_alchemy import facades
+from open_alchemy import utility_base
+
+ITERATIONS = 2000
+SCHEMA = {
+    "type": "object",
+    "properties": {f"key_{idx}": {"type": "integer"} for idx in range(20)},
+    "required": ["key_0"],
+}
+INSTANCE = {f"key_{idx}": idx for idx in range(20)}
+
+
+@pytest.mark.benchmark
+def test_validate_throughput(measure):
+    """
+    GIVEN wide schema and valid instance
+    WHEN the instance is validated per call and with the compiled validator
+    THEN the throughput of both is recorded.
+    """
+    validator = facades.jsonschema.Validator(schema=SCHEMA)
+
+    measure(
+        "validate_per_call",
+        lambda: facades.jsonschema.validate(instance=INSTANCE, schema=SCHEMA),
+        iterations=ITERATIONS,
+    )
+    measure(
+        "validate_compiled",
+        lambda: validator.validate(INSTANCE),
+        iterations=ITERATIONS,
+    )
+
+
+@pytest.mark.benchmark
+def test_from_dict_throughput(measure):
+    """
+    GIVEN model with a wide schema and valid dictionary
+    WHEN from_dict is called repeatedly
+    THEN the throughput is recorded.
+    """
+
+    def __init__(self, **kwargs):
+        """Construct."""
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    model = type(
+        "Model", (utility_base.UtilityBase,), {"_schema": SCHEMA, "__init__": __init__}
+    )
+
+    measure("from_dict", lambda: model.from_dict(**INSTANCE), iterations=ITERATIONS)
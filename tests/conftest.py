@@ -1,8 +1,12 @@
 """Fixtures for all tests."""
 # pylint: disable=redefined-outer-name
 
+import hashlib
 import os
 import pathlib
+import threading
+import time
+from http import server
 
 import pytest
 import sqlalchemy
@@ -43,3 +47,74 @@ def _remember_current_directory():
     yield
 
     os.chdir(current_dir)
+
+
+class DocumentServer:
+    """
+    Local HTTP server that serves documents and supports ETag revalidation.
+
+    Attrs:
+        documents: The contents of the document at each path.
+        delay: The number of seconds to wait before responding.
+        requests: The path and headers of each request that was received.
+
+    """
+
+    def __init__(self) -> None:
+        """Construct."""
+        self.documents = {}
+        self.delay = 0.0
+        self.requests = []
+
+        document_server = self
+
+        class Handler(server.BaseHTTPRequestHandler):
+            """Respond with the documents of the server."""
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Respond with a document."""
+                document_server.requests.append((self.path, dict(self.headers)))
+                time.sleep(document_server.delay)
+                contents = document_server.documents.get(self.path)
+                if contents is None:
+                    self.send_error(404)
+                    return
+                etag = f'"{hashlib.sha256(contents).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(contents)))
+                self.end_headers()
+                self.wfile.write(contents)
+
+            def log_message(self, *_):  # pylint: disable=arguments-differ
+                """Don't log the requests."""
+
+        self._server = server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def url(self, path: str) -> str:
+        """Calculate the URL of a path."""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}{path}"
+
+    def stop(self) -> None:
+        """Stop the server so that it can no longer be reached."""
+        if self._thread.is_alive():
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+
+
+@pytest.fixture
+def document_server():
+    """Start a local HTTP server that serves documents."""
+    document_server = DocumentServer()
+
+    yield document_server
+
+    document_server.stop()
@@ -0,0 +1,214 @@
+"""Tests for json facade."""
+# pylint: disable=protected-access
+
+import datetime
+import importlib
+import io
+import json
+
+import pytest
+
+from open_alchemy import facades
+
+
+@pytest.fixture(autouse=True)
+def _reset_backend():
+    """Restore the automatic backend after each test."""
+    yield
+
+    facades.json._codec.cache_clear()
+    facades.json.set_backend(facades.json.Backend.AUTO)
+
+
+def _installed(backend):
+    """Check whether the library of a backend is installed."""
+    try:
+        importlib.import_module(backend.value)
+    except ImportError:
+        return False
+    return True
+
+
+BACKENDS = [
+    pytest.param(
+        backend,
+        marks=pytest.mark.skipif(
+            not _installed(backend), reason=f"{backend.value} is not installed"
+        ),
+        id=backend.value,
+    )
+    for backend in facades.json.Backend
+    if backend not in {facades.json.Backend.AUTO, facades.json.Backend.JSON}
+]
+ALL_BACKENDS = [
+    pytest.param(facades.json.Backend.AUTO, id="auto"),
+    pytest.param(facades.json.Backend.JSON, id="json"),
+    *BACKENDS,
+]
+VALUE = {"key_1": "value /1 é", "key_2": [1, 1.5, True, None], "key_3": {}}
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.facade
+def test_loads_dumps(backend):
+    """
+    GIVEN backend
+    WHEN the backend is set and a value is encoded and decoded
+    THEN the decoded value is the same as the original value.
+    """
+    facades.json.set_backend(backend)
+
+    returned_value = facades.json.loads(facades.json.dumps(VALUE))
+
+    assert returned_value == VALUE
+    assert facades.json.get_backend() == backend
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.facade
+def test_load(backend):
+    """
+    GIVEN backend and file with JSON contents
+    WHEN the backend is set and load is called with the file
+    THEN the decoded contents are returned.
+    """
+    facades.json.set_backend(backend)
+
+    returned_value = facades.json.load(io.StringIO(json.dumps(VALUE)))
+
+    assert returned_value == VALUE
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.facade
+def test_loads_invalid(backend):
+    """
+    GIVEN backend
+    WHEN the backend is set and loads is called with invalid JSON
+    THEN DecodeError is raised.
+    """
+    facades.json.set_backend(backend)
+
+    with pytest.raises(facades.json.DecodeError):
+        facades.json.loads("{")
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.facade
+def test_dumps_conversions(backend):
+    """
+    GIVEN backend
+    WHEN the backend is set and dumps is called with date, date-time and binary
+        values
+    THEN the values are converted in the same way as to_dict converts them.
+    """
+    facades.json.set_backend(backend)
+    value = {
+        "date": datetime.date(2000, 1, 2),
+        "date-time": datetime.datetime(2000, 1, 2, 3, 4, 5, 6),
+        "binary": b"some bytes",
+    }
+
+    returned_value = json.loads(facades.json.dumps(value))
+
+    assert returned_value == {
+        "date": "2000-01-02",
+        "date-time": "2000-01-02T03:04:05.000006",
+        "binary": "some bytes",
+    }
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.facade
+def test_dumps_unsupported(backend):
+    """
+    GIVEN backend
+    WHEN the backend is set and dumps is called with a value that is not supported
+    THEN TypeError is raised.
+    """
+    facades.json.set_backend(backend)
+
+    with pytest.raises(TypeError):
+        facades.json.dumps({"key": object()})
+
+
+# The values that the output of each backend is byte compatible with json for
+JSON_COMPATIBLE = {
+    facades.json.Backend.AUTO: (VALUE, False),
+    facades.json.Backend.JSON: (VALUE, False),
+    facades.json.Backend.UJSON: ({"key_1": "value /1 é", "key_2": [1, True]}, False),
+    facades.json.Backend.ORJSON: ({"key_1": "value /1", "key_2": [1, True]}, True),
+    facades.json.Backend.RAPIDJSON: ({"key_1": "value /1", "key_2": [1, True]}, True),
+}
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.facade
+def test_dumps_json_compatible(backend):
+    """
+    GIVEN backend and value the backend is byte compatible with json for
+    WHEN dumps is called with the backend
+    THEN the output is the same as json.dumps with the same separators.
+    """
+    value, compact_only = JSON_COMPATIBLE[backend]
+
+    if not compact_only:
+        assert facades.json.dumps(value, backend=backend) == json.dumps(value)
+    assert facades.json.dumps(value, compact=True, backend=backend) == json.dumps(
+        value, separators=(",", ":")
+    )
+
+
+@pytest.mark.parametrize("backend", ALL_BACKENDS)
+@pytest.mark.facade
+def test_backend_argument(backend):
+    """
+    GIVEN backend
+    WHEN a value is encoded and decoded passing the backend
+    THEN the value is the same and the default backend is not changed.
+    """
+    returned_value = facades.json.loads(
+        facades.json.dumps(VALUE, backend=backend), backend=backend
+    )
+
+    assert returned_value == VALUE
+    assert facades.json.get_backend() == facades.json.Backend.AUTO
+
+
+@pytest.mark.facade
+def test_set_backend_not_installed(monkeypatch):
+    """
+    GIVEN backend whose library is not installed
+    WHEN set_backend is called with the backend
+    THEN ImportError is raised.
+    """
+
+    def import_module(name):
+        """Raise ImportError."""
+        raise ImportError(name)
+
+    monkeypatch.setattr(importlib, "import_module", import_module)
+    facades.json._codec.cache_clear()
+
+    with pytest.raises(ImportError):
+        facades.json.set_backend(facades.json.Backend.ORJSON)
+
+
+@pytest.mark.facade
+def test_auto_no_fast_backend(monkeypatch):
+    """
+    GIVEN no fast backend library is installed
+    WHEN the automatic backend is set
+    THEN json is used to decode.
+    """
+
+    def import_module(name):
+        """Raise ImportError."""
+        raise ImportError(name)
+
+    monkeypatch.setattr(importlib, "import_module", import_module)
+    facades.json._codec.cache_clear()
+
+    facades.json.set_backend(facades.json.Backend.AUTO)
+
+    assert facades.json._get_codec().loads is json.loads
@@ -1,5 +1,7 @@
 """Tests for jsonschema facade."""
 
+from concurrent import futures
+
 import jsonschema
 import pytest
 
@@ -77,3 +79,89 @@ def test_resolver_multiple(tmp_path):
     jsonschema.validate(instance, schema, resolver=resolver)
     assert schema1_dict == {"RefSchema1": {"type": "string"}}
     assert schema2_dict == {"RefSchema2": {"type": "integer"}}
+
+
+@pytest.mark.parametrize(
+    "draft",
+    [
+        pytest.param(None, id="default"),
+        pytest.param(facades.jsonschema.Draft.DRAFT4, id="draft 4"),
+        pytest.param(facades.jsonschema.Draft.DRAFT6, id="draft 6"),
+        pytest.param(facades.jsonschema.Draft.DRAFT7, id="draft 7"),
+    ],
+)
+@pytest.mark.facade
+def test_validator(draft):
+    """
+    GIVEN schema and draft
+    WHEN Validator is constructed and used to validate valid and invalid instances
+    THEN ValidationError is raised only for the invalid instance.
+    """
+    schema = {"type": "object", "properties": {"key": {"type": "integer"}}}
+
+    validator = facades.jsonschema.Validator(schema=schema, draft=draft)
+
+    validator.validate({"key": 1})
+    with pytest.raises(facades.jsonschema.ValidationError):
+        validator.validate({"key": "value"})
+
+
+@pytest.mark.facade
+def test_validator_invalid_schema():
+    """
+    GIVEN schema that is not valid
+    WHEN Validator is constructed and used to validate an instance
+    THEN SchemaError is raised.
+    """
+    validator = facades.jsonschema.Validator(schema={"type": "invalid"})
+
+    with pytest.raises(jsonschema.SchemaError):
+        validator.validate({})
+
+
+@pytest.mark.facade
+def test_validator_resolver_schema():
+    """
+    GIVEN schema with a reference to a schema in another schema
+    WHEN Validator is constructed with the other schema as the resolver schema and used
+        to validate valid and invalid instances
+    THEN ValidationError is raised only for the invalid instance.
+    """
+    schema = {"$ref": "#/Key"}
+    resolver_schema = {"Key": {"type": "integer"}}
+
+    validator = facades.jsonschema.Validator(
+        schema=schema, resolver_schema=resolver_schema
+    )
+
+    validator.validate(1)
+    with pytest.raises(facades.jsonschema.ValidationError):
+        validator.validate("1")
+
+
+@pytest.mark.facade
+def test_validator_threads():
+    """
+    GIVEN validator for a schema with a reference
+    WHEN the validator is used from multiple threads
+    THEN each thread validates correctly.
+    """
+    schema = {
+        "type": "object",
+        "properties": {"key": {"$ref": "#/definitions/Key"}},
+        "definitions": {"Key": {"type": "integer"}},
+    }
+    validator = facades.jsonschema.Validator(schema=schema)
+
+    def validate(value):
+        """Validate the value and return whether it is valid."""
+        try:
+            validator.validate({"key": value})
+        except facades.jsonschema.ValidationError:
+            return False
+        return True
+
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(validate, [1, "1"] * 50))
+
+    assert results == [True, False] * 50
@@ -1,5 +1,6 @@
 """Tests for models facade."""
 
+import types
 from unittest import mock
 
 import pytest
@@ -93,3 +94,37 @@ def test_set_model(mocked_models):
     models.set_model(model=model, name=name)
 
     assert getattr(mocked_models, name) == model
+
+
+@pytest.mark.facade
+def test_use_namespace():
+    """
+    GIVEN namespace with a model
+    WHEN get_model is called while use_namespace is entered with the namespace and
+        after it is exited
+    THEN the model is only returned while it is entered.
+    """
+    namespace = types.ModuleType("models")
+    namespace.Model = mock.MagicMock()
+
+    with models.use_namespace(namespace):
+        assert models.get_namespace() is namespace
+        assert models.get_model(name="Model") is namespace.Model
+
+    assert models.get_model(name="Model") is None
+
+
+@pytest.mark.facade
+def test_get_model_namespace(mocked_models):
+    """
+    GIVE mocked models and namespace with a model
+    WHEN get_model is called with the name of the model and the namespace
+    THEN the model of the namespace is returned.
+    """
+    namespace = types.ModuleType("models")
+    namespace.Model = mock.MagicMock()
+
+    model = models.get_model(name="Model", namespace=namespace)
+
+    assert model is namespace.Model
+    assert model is not mocked_models.Model
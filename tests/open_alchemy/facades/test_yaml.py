@@ -0,0 +1,84 @@
+"""Tests for yaml facade."""
+
+import datetime
+import io
+
+import pytest
+import yaml
+
+from open_alchemy import facades
+
+
+@pytest.mark.facade
+def test_get_loader():
+    """
+    GIVEN PyYAML
+    WHEN get_loader is called
+    THEN the C loader is returned if PyYAML was built with libyaml.
+    """
+    loader = facades.yaml.get_loader()
+
+    if yaml.__with_libyaml__:
+        assert loader is yaml.CSafeLoader
+    else:
+        assert loader is yaml.SafeLoader
+
+
+@pytest.mark.facade
+@pytest.mark.parametrize(
+    "stream",
+    [
+        pytest.param("key: 2020-01-01\nlist: [1, true]\n", id="str"),
+        pytest.param(b"key: 2020-01-01\nlist: [1, true]\n", id="bytes"),
+        pytest.param(io.StringIO("key: 2020-01-01\nlist: [1, true]\n"), id="file"),
+    ],
+)
+def test_load(stream):
+    """
+    GIVEN YAML stream
+    WHEN load is called with the stream
+    THEN the decoded value is returned.
+    """
+    assert facades.yaml.load(stream) == {
+        "key": datetime.date(2020, 1, 1),
+        "list": [1, True],
+    }
+
+
+@pytest.mark.facade
+def test_load_unsafe():
+    """
+    GIVEN YAML with a python object tag
+    WHEN load is called
+    THEN ConstructorError is raised.
+    """
+    with pytest.raises(yaml.constructor.ConstructorError):
+        facades.yaml.load("!!python/object/apply:os.getcwd []")
+
+
+@pytest.mark.facade
+def test_loads():
+    """
+    GIVEN YAML string
+    WHEN loads is called with the string
+    THEN the decoded value is returned.
+    """
+    assert facades.yaml.loads(b"key: [1, true]\n") == {"key": [1, True]}
+
+
+@pytest.mark.facade
+@pytest.mark.parametrize(
+    "value",
+    [
+        pytest.param("key: [1", id="invalid"),
+        pytest.param("!!python/object/apply:os.getcwd []", id="unsafe"),
+    ],
+)
+def test_loads_error(value):
+    """
+    GIVEN YAML string that is not valid or not safe
+    WHEN loads is called with the string
+    THEN DecodeError is raised.
+    """
+    with pytest.raises(facades.yaml.DecodeError):
+        facades.yaml.loads(value)
@@ -1,10 +1,14 @@
 """Tests for define_all helper."""
 
+import copy
 from unittest import mock
 
 import pytest
 
+from open_alchemy import exceptions
 from open_alchemy import helpers
+from open_alchemy import schemas as schemas_module
+from open_alchemy.helpers.define_all import calculate_dependencies
 
 
 @pytest.mark.parametrize(
@@ -138,3 +142,157 @@ def test_remote_ref(tmp_path, _clean_remote_schemas_store):
     model_factory = mock.MagicMock()
 
     helpers.define_all(model_factory=model_factory, schemas=schemas)
+
+
+LAZY_SCHEMAS = {
+    "Parent": {
+        "type": "object",
+        "x-tablename": "parent",
+        "properties": {
+            "id": {"type": "integer", "x-primary-key": True},
+            "child": {
+                "allOf": [
+                    {"$ref": "#/components/schemas/Child"},
+                    {"x-backref": "parents", "x-uselist": True},
+                ]
+            },
+            "tags": {
+                "type": "array",
+                "items": {
+                    "allOf": [
+                        {"$ref": "#/components/schemas/Tag"},
+                        {"x-secondary": "parent_tag"},
+                    ]
+                },
+            },
+        },
+    },
+    "Child": {
+        "type": "object",
+        "x-tablename": "child",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+    "SubChild": {
+        "allOf": [
+            {
+                "x-inherits": True,
+                "x-tablename": "sub_child",
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "x-primary-key": True,
+                        "x-foreign-key": "child.id",
+                    }
+                },
+            },
+            {"$ref": "#/components/schemas/Child"},
+        ]
+    },
+    "Tag": {
+        "type": "object",
+        "x-tablename": "tag",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+    "Unrelated": {
+        "type": "object",
+        "x-tablename": "unrelated",
+        "properties": {"id": {"type": "integer", "x-primary-key": True}},
+    },
+}
+
+
+def _lazy_artifacts():
+    """Calculate the artifacts for the lazy schemas."""
+    schemas = copy.deepcopy(LAZY_SCHEMAS)
+    schemas_module.process(schemas=schemas)
+    return schemas_module.artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+
+
+@pytest.mark.helper
+def test_calculate_dependencies():
+    """
+    GIVEN artifacts for models with inheritance, relationships and foreign keys
+    WHEN calculate_dependencies is called with the artifacts
+    THEN the models each model directly depends on are returned.
+    """
+    returned_dependencies = calculate_dependencies(artifacts=_lazy_artifacts())
+
+    assert returned_dependencies == {
+        "Parent": {"Child", "Tag", "ParentTag"},
+        "Child": set(),
+        "SubChild": {"Child"},
+        "Tag": set(),
+        "ParentTag": {"Parent", "Tag"},
+        "Unrelated": set(),
+    }
+
+
+@pytest.mark.helper
+def test_define_lazy():
+    """
+    GIVEN mocked model factory and artifacts
+    WHEN define_lazy is called and the returned factory is called multiple times
+    THEN the model and all the models it depends on are defined only once and its
+        children and unrelated models are not defined.
+    """
+    model_factory = mock.MagicMock()
+    define = helpers.define_lazy(
+        model_factory=model_factory, artifacts=_lazy_artifacts()
+    )
+
+    returned_model = define(name="Parent")
+    define(name="Parent")
+
+    assert returned_model == model_factory.return_value
+    defined_names = [call[1]["name"] for call in model_factory.call_args_list]
+    assert set(defined_names) == {"Parent", "Child", "Tag", "ParentTag"}
+    assert defined_names.count("Child") == 1
+    assert defined_names.count("Parent") == 2
+
+
+@pytest.mark.helper
+def test_define_lazy_child():
+    """
+    GIVEN mocked model factory and artifacts
+    WHEN define_lazy is called and the returned factory is called for a model with a
+        child and a back reference
+    THEN only the model is defined.
+    """
+    model_factory = mock.MagicMock()
+    define = helpers.define_lazy(
+        model_factory=model_factory, artifacts=_lazy_artifacts()
+    )
+
+    define(name="Child")
+
+    model_factory.assert_called_once_with(name="Child")
+
+
+@pytest.mark.helper
+def test_define_lazy_error():
+    """
+    GIVEN model factory that fails for a dependency the first time and artifacts
+    WHEN define_lazy is called and the returned factory is called twice
+    THEN the model and the dependency are defined again the second time.
+    """
+    calls = []
+
+    def model_factory(*, name):
+        """Record the call and fail the first time for the dependency."""
+        calls.append(name)
+        if name == "Child" and calls.count(name) == 1:
+            raise exceptions.MalformedSchemaError("error")
+        return name
+
+    define = helpers.define_lazy(
+        model_factory=model_factory, artifacts=_lazy_artifacts()
+    )
+
+    with pytest.raises(exceptions.MalformedSchemaError):
+        define(name="SubChild")
+    define(name="SubChild")
+
+    assert calls == ["SubChild", "Child", "SubChild", "Child"]
@@ -1,12 +1,16 @@
 """Tests for ext_prop."""
 
 import functools
+import json
+from unittest import mock
 
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import helpers
 from open_alchemy import types
+from open_alchemy.helpers import ext_prop
 
 
 @pytest.mark.helper
@@ -173,7 +177,7 @@ def test_valid(prefix, name, value):
     source = {f"{prefix}{name}": value}
 
     returned_value = helpers.ext_prop.get(
-        source=source, name=f"{types.KeyPrefixes.SHORT}{name}"
+        source=source, name=f"{types.KeyPrefixes.SHORT.value}{name}"
     )
 
     assert returned_value == value
@@ -195,7 +199,7 @@ def test_pop(prefix):
     source = {f"{prefix}{name}": value}
 
     returned_value = helpers.ext_prop.get(
-        source=source, name=f"{types.KeyPrefixes.SHORT}{name}", pop=True
+        source=source, name=f"{types.KeyPrefixes.SHORT.value}{name}", pop=True
     )
 
     assert returned_value == value
@@ -261,7 +265,7 @@ def test_unique_constraint_valid(prefix, value):
     source = {f"{prefix}{name}": value}
 
     returned_value = helpers.ext_prop.get(
-        source=source, name=f"{types.KeyPrefixes.SHORT}{name}"
+        source=source, name=f"{types.KeyPrefixes.SHORT.value}{name}"
     )
 
     assert returned_value == value
@@ -338,7 +342,7 @@ def test_composite_index_valid(prefix, value):
     source = {f"{prefix}{name}": value}
 
     returned_value = helpers.ext_prop.get(
-        source=source, name=f"{types.KeyPrefixes.SHORT}{name}"
+        source=source, name=f"{types.KeyPrefixes.SHORT.value}{name}"
     )
 
     assert returned_value == value
@@ -418,7 +422,7 @@ def test_relationship_backrefs_valid(prefix, value):
     source = {f"{prefix}{name}": value}
 
     return_value = helpers.ext_prop.get(
-        source=source, name=f"{types.KeyPrefixes.SHORT}{name}"
+        source=source, name=f"{types.KeyPrefixes.SHORT.value}{name}"
     )
 
     assert return_value == value
@@ -507,7 +511,7 @@ def test_kwargs_valid_name(prefix):
     source = {f"{prefix}{name}": value}
 
     returned_value = helpers.ext_prop.get_kwargs(
-        source=source, name=f"{types.KeyPrefixes.SHORT}{name}"
+        source=source, name=f"{types.KeyPrefixes.SHORT.value}{name}"
     )
 
     assert returned_value == value
@@ -627,7 +631,86 @@ def test_mixins_valid(prefix, value):
     source = {f"{prefix}{name}": value}
 
     returned_value = helpers.ext_prop.get(
-        source=source, name=f"{types.KeyPrefixes.SHORT}{name}"
+        source=source, name=f"{types.KeyPrefixes.SHORT.value}{name}"
     )
 
     assert returned_value == value
+
+
+@pytest.mark.parametrize(
+    "name, value, expected_call_count",
+    [
+        pytest.param("x-primary-key", True, 0, id="scalar valid"),
+        pytest.param("x-tablename", "table 1", 0, id="scalar string valid"),
+        pytest.param("x-foreign-key", "table 1.column_1", 1, id="pattern valid"),
+        pytest.param("x-mixins", ["mixin 1"], 1, id="compound valid"),
+        pytest.param("x-primary-key", 1, 3, id="scalar invalid"),
+        pytest.param("x-mixins", [1], 3, id="compound invalid"),
+    ],
+)
+@pytest.mark.helper
+def test_get_memoise(name, value, expected_call_count):
+    """
+    GIVEN name and value of an extension property
+    WHEN get is called multiple times with a source with a copy of the value
+    THEN the validator is only called for values that don't only need their type to be
+        checked until the value is known to be valid.
+    """
+    ext_prop._validate_frozen.cache_clear()
+
+    with mock.patch.object(
+        facades.jsonschema.Validator,
+        "validate",
+        autospec=True,
+        side_effect=facades.jsonschema.Validator.validate,
+    ) as mock_validate:
+        for _ in range(3):
+            source = {name: json.loads(json.dumps(value))}
+            try:
+                returned_value = helpers.ext_prop.get(source=source, name=name)
+            except exceptions.MalformedExtensionPropertyError:
+                continue
+            assert returned_value == value
+
+    assert mock_validate.call_count == expected_call_count
+
+
+@pytest.mark.helper
+def test_get_memoise_changed():
+    """
+    GIVEN valid value of an extension property that has been validated
+    WHEN the value is changed so that it is not valid and get is called
+    THEN MalformedExtensionPropertyError is raised.
+    """
+    ext_prop._validate_frozen.cache_clear()
+    value = ["mixin 1"]
+    source = {"x-mixins": value}
+    helpers.ext_prop.get(source=source, name="x-mixins")
+
+    value.append(1)
+
+    with pytest.raises(exceptions.MalformedExtensionPropertyError):
+        helpers.ext_prop.get(source=source, name="x-mixins")
+
+
+@pytest.mark.helper
+def test_get_memoise_bounded():
+    """
+    GIVEN
+    WHEN the cache of the valid values is inspected
+    THEN it is bounded.
+    """
+    assert ext_prop._validate_frozen.cache_info().maxsize == ext_prop._MAX_VALID
+
+
+@pytest.mark.helper
+def test_get_unknown():
+    """
+    GIVEN source with an extension property that has no schema
+    WHEN get is called with the name of the extension property
+    THEN MalformedExtensionPropertyError is raised.
+    """
+    source = {"x-unknown": ["value 1"]}
+
+    with pytest.raises(exceptions.MalformedExtensionPropertyError):
+        helpers.ext_prop.get(source=source, name="x-unknown")
@@ -435,8 +435,54 @@ def test_map_remote_schema_ref(schema, expected_schema):
     assert returned_schema == expected_schema
 
 
+@pytest.mark.helper
+def test_map_remote_schema_ref_sharing():
+    """
+    GIVEN schema with a $ref nested in one of its properties
+    WHEN _map_remote_schema_ref is called with the schema and context
+    THEN only the values containing the $ref are copied.
+    """
+    # pylint: disable=protected-access
+    schema = {
+        "properties": {
+            "prop_1": {"type": "integer"},
+            "prop_2": {"$ref": "#/Schema1"},
+        },
+        "required": ["prop_1"],
+        "x-kwargs": {"$ref": 1},
+    }
+
+    returned_schema = helpers.ref._map_remote_schema_ref(
+        schema=schema, context="doc.ext"
+    )
+
+    assert returned_schema is not schema
+    assert returned_schema["properties"]["prop_2"] == {"$ref": "doc.ext#/Schema1"}
+    assert schema["properties"]["prop_2"] == {"$ref": "#/Schema1"}
+    assert returned_schema["properties"]["prop_1"] is schema["properties"]["prop_1"]
+    assert returned_schema["required"] is schema["required"]
+    assert returned_schema["x-kwargs"] is schema["x-kwargs"]
+
+
+@pytest.mark.helper
+def test_map_remote_schema_ref_unchanged():
+    """
+    GIVEN schema with only a $ref that doesn't change with the context
+    WHEN _map_remote_schema_ref is called with the schema and context
+    THEN the schema is returned.
+    """
+    # pylint: disable=protected-access
+    schema = {"allOf": [{"$ref": "doc.ext#/Schema1"}, {"type": "object"}]}
+
+    returned_schema = helpers.ref._map_remote_schema_ref(
+        schema=schema, context="doc.ext"
+    )
+
+    assert returned_schema is schema
+
+
 class TestRemoteSchemaStore:
-    """Tests for _RemoteSchemaStore."""
+    """Tests for RemoteSchemaStore."""
 
     # pylint: disable=protected-access
 
@@ -445,10 +491,10 @@ class TestRemoteSchemaStore:
     def test_init():
         """
         GIVEN
-        WHEN _RemoteSchemaStore is initialized
+        WHEN RemoteSchemaStore is initialized
         THEN empty store is created.
         """
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
 
         assert store._schemas == {}
         assert store.spec_context is None
@@ -461,7 +507,7 @@ class TestRemoteSchemaStore:
         WHEN reset is called
         THEN the state is removed.
         """
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store._schemas["key"] = "value"
         store.spec_context = "path 1"
 
@@ -474,11 +520,11 @@ class TestRemoteSchemaStore:
     @pytest.mark.helper
     def test_context_not_set():
         """
-        GIVEN _RemoteSchemaStore without spec context set
+        GIVEN RemoteSchemaStore without spec context set
         WHEN get_schemas is called
         THEN MissingArgumentError is raised.
         """
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
 
         with pytest.raises(exceptions.MissingArgumentError):
             store.get_schemas(context="doc.ext")
@@ -494,7 +540,7 @@ class TestRemoteSchemaStore:
         WHEN get_schemas is called
         THEN SchemaNotFoundError is raised.
         """
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = "doc.ext"
 
         with pytest.raises(exceptions.SchemaNotFoundError):
@@ -513,7 +559,7 @@ class TestRemoteSchemaStore:
         directory.mkdir()
         schemas_file = directory / "original.json"
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         with pytest.raises(exceptions.SchemaNotFoundError):
@@ -539,7 +585,7 @@ class TestRemoteSchemaStore:
         remote_schemas_file = directory / remote_context
         remote_schemas_file.write_text(contents)
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         with pytest.raises(exceptions.SchemaNotFoundError):
@@ -571,7 +617,7 @@ class TestRemoteSchemaStore:
         remote_schemas_file = directory / remote_context
         remote_schemas_file.write_text(contents)
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         remote_schemas = store.get_schemas(context=remote_context)
@@ -594,7 +640,7 @@ class TestRemoteSchemaStore:
         remote_schemas_file = directory / "remote.json"
         remote_schemas_file.write_text('{"key": "value"}')
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         store.get_schemas(context="remote.json")
@@ -620,7 +666,7 @@ class TestRemoteSchemaStore:
         remote_schemas_file = remote_directory / "remote.json"
         remote_schemas_file.write_text('{"key": "value"}')
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = str(schemas_file)
 
         remote_schemas = store.get_schemas(context="remote/remote.json")
@@ -642,7 +688,7 @@ class TestRemoteSchemaStore:
         response_cm.__enter__.return_value = response_cm
         mocked_urlopen.return_value = response_cm
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = "path1"
         remote_context = "http://host.com/doc.json"
 
@@ -663,13 +709,108 @@ class TestRemoteSchemaStore:
             url="some url", code=404, msg="message", hdrs="headers", fp="fp"
         )
         # Create store
-        store = helpers.ref._RemoteSchemaStore()
+        store = helpers.ref.RemoteSchemaStore()
         store.spec_context = "path1"
         remote_context = "http://host.com/doc.json"
 
         with pytest.raises(exceptions.SchemaNotFoundError):
             store.get_schemas(context=remote_context)
 
+    @staticmethod
+    @pytest.mark.helper
+    def test_load_url_cache(tmp_path, document_server):
+        """
+        GIVEN context with HTTP path and cache directory
+        WHEN get_schemas is called, the server stops and get_schemas is called with a
+            new store
+        THEN the cached contents are returned.
+        """
+        document_server.documents["/doc.json"] = b'{"key": "value"}'
+        remote_context = document_server.url("/doc.json")
+        store = helpers.ref.RemoteSchemaStore()
+        store.spec_context = "path1"
+        store.cache_dir = str(tmp_path)
+        store.get_schemas(context=remote_context)
+
+        document_server.stop()
+        store = helpers.ref.RemoteSchemaStore()
+        store.spec_context = "path1"
+        store.cache_dir = str(tmp_path)
+        remote_schemas = store.get_schemas(context=remote_context)
+
+        assert remote_schemas == {"key": "value"}
+
+    @staticmethod
+    @pytest.mark.helper
+    def test_prefetch(tmp_path, caplog):
+        """
+        GIVEN schemas with local, remote and missing references and remote files with
+            further references
+        WHEN prefetch is called with the schemas
+        THEN all the reachable remote schemas are loaded and the missing file is
+            skipped and logged.
+        """
+        directory = tmp_path / "base"
+        (directory / "dir1").mkdir(parents=True)
+        (directory / "remote1.json").write_text(
+            '{"Schema1": {"$ref": "dir1/remote2.json#/Schema2"}, '
+            '"Schema3": {"$ref": "#/Schema1"}}'
+        )
+        (directory / "dir1" / "remote2.json").write_text(
+            '{"Schema2": {"items": [{"$ref": "../remote1.json#/Schema3"}]}}'
+        )
+        schemas = {
+            "Schema1": {"$ref": "remote1.json#/Schema1"},
+            "Schema2": {"$ref": "#/components/schemas/Schema1"},
+            "Schema3": {"properties": {"prop_1": {"$ref": "missing.json#/Schema"}}},
+        }
+        store = helpers.ref.RemoteSchemaStore()
+        store.spec_context = str(directory / "original.json")
+
+        store.prefetch(schemas=schemas)
+
+        assert sorted(store.contexts()) == sorted(
+            ["remote1.json", os.path.join("dir1", "remote2.json")]
+        )
+        assert [record.levelname for record in caplog.records] == ["WARNING"]
+        assert "missing.json" in caplog.records[0].getMessage()
+        with pytest.raises(exceptions.SchemaNotFoundError):
+            store.get_schemas(context="missing.json")
+
+    @staticmethod
+    @pytest.mark.helper
+    def test_prefetch_no_spec_context():
+        """
+        GIVEN store without the context of the specification and schemas with a remote
+            reference
+        WHEN prefetch is called with the schemas
+        THEN no schemas are loaded.
+        """
+        store = helpers.ref.RemoteSchemaStore()
+
+        store.prefetch(schemas={"Schema1": {"$ref": "remote.json#/Schema1"}})
+
+        assert store.contexts() == []
+
+
+@pytest.mark.helper
+def test_use_store(_clean_remote_schemas_store):
+    """
+    GIVEN store
+    WHEN set_context is called while use_store is entered with the store and after it
+        is exited
+    THEN the context is only set on the store while it is entered.
+    """
+    store = helpers.ref.RemoteSchemaStore()
+
+    with helpers.ref.use_store(store):
+        assert helpers.ref.get_store() is store
+        helpers.ref.set_context(path="spec_1.json")
+    helpers.ref.set_context(path="spec_2.json")
+
+    assert store.spec_context == "spec_1.json"
+    assert helpers.ref.get_context() == "spec_2.json"
+
 
 class TestRetrieveSchema:
     """Tests for _retrieve_schema."""
@@ -749,6 +890,73 @@ def test_get_remote_ref(tmp_path, _clean_remote_schemas_store):
     assert name == "Schema1"
 
 
+@pytest.mark.helper
+def test_get_remote_ref_cache(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN remote $ref and file with the remote schemas
+    WHEN get_remote_ref is called with the $ref multiple times
+    THEN the remote schema is only mapped once and equal schemas are returned.
+    """
+    # Create file
+    directory = tmp_path / "base"
+    directory.mkdir()
+    schemas_file = directory / "original.json"
+    remote_schemas_file = directory / "remote.json"
+    remote_schemas_file.write_text('{"Schema1": {"$ref": "#/Schema2"}}')
+    # Set up remote schemas store
+    helpers.ref.set_context(path=str(schemas_file))
+    # Calculate $ref
+    ref = "remote.json#/Schema1"
+
+    with mock.patch.object(
+        helpers.ref,
+        "_map_remote_schema_ref",
+        wraps=helpers.ref._map_remote_schema_ref,  # pylint: disable=protected-access
+    ) as mock_map:
+        _, schema_1 = helpers.ref.get_remote_ref(ref=ref)
+        _, schema_2 = helpers.ref.get_remote_ref(ref=ref)
+
+    assert schema_1 is not schema_2
+    assert schema_1 == schema_2 == {"$ref": "remote.json#/Schema2"}
+    mock_map.assert_called_once()
+
+
+@pytest.mark.helper
+def test_get_remote_ref_mutate(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN remote $ref and file with the remote schemas
+    WHEN the schema returned by get_remote_ref is changed and the $ref is retrieved
+        again
+    THEN the original schema is returned and the loaded schemas are not changed.
+    """
+    # pylint: disable=protected-access
+    # Create file
+    directory = tmp_path / "base"
+    directory.mkdir()
+    schemas_file = directory / "original.json"
+    remote_schemas_file = directory / "remote.json"
+    remote_schemas_file.write_text(
+        '{"Schema1": {"type": "object", "properties": {"id": {"type": "integer"}}}}'
+    )
+    # Set up remote schemas store
+    helpers.ref.set_context(path=str(schemas_file))
+    # Calculate $ref
+    ref = "remote.json#/Schema1"
+    _, schema = helpers.ref.get_remote_ref(ref=ref)
+
+    schema["type"] = "array"
+    schema["properties"]["id"]["type"] = "string"
+    schema["properties"]["name"] = {"type": "string"}
+
+    _, returned_schema = helpers.ref.get_remote_ref(ref=ref)
+    expected_schema = {"type": "object", "properties": {"id": {"type": "integer"}}}
+    assert returned_schema == expected_schema
+    assert (
+        helpers.ref._remote_schema_store._schemas["remote.json"]["Schema1"]
+        == expected_schema
+    )
+
+
 @pytest.mark.helper
 def test_get_remote_ref_norm(tmp_path, _clean_remote_schemas_store):
     """
@@ -0,0 +1,315 @@
+"""Integration tests for inserting rows from dictionaries in bulk."""
+
+import datetime
+
+import pytest
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string", "maxLength": 10},
+                    "employees": {
+                        "type": "array",
+                        "items": {"$ref": "#/components/schemas/Project"},
+                    },
+                },
+                "x-tablename": "division",
+                "type": "object",
+            },
+            "Project": {
+                "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                "x-tablename": "project",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {
+                        "type": "integer",
+                        "x-primary-key": True,
+                        "x-autoincrement": True,
+                    },
+                    "name": {"type": "string", "maxLength": 10},
+                    "joined": {"type": "string", "format": "date"},
+                    "photo": {"type": "string", "format": "binary"},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+def _define_models(engine, validation_level=open_alchemy.ValidationLevel.FULL):
+    """Define the models and create their tables."""
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base, spec=SPEC, validation_level=validation_level
+    )
+    model_factory(name="Project")
+    division = model_factory(name="Division")
+    employee = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+    return division, employee
+
+
+@pytest.mark.integration
+def test_bulk_insert_from_dicts(engine, sessionmaker):
+    """
+    GIVEN models and dictionaries with formatted values and foreign keys passed
+        using the relationship and the column
+    WHEN bulk_insert_from_dicts is called with the dictionaries
+    THEN the rows are inserted with the converted values.
+    """
+    division, employee = _define_models(engine)
+    session = sessionmaker()
+    division.bulk_insert_from_dicts(
+        session, [{"id": 1, "name": "division 1"}, {"id": 2, "name": "division 2"}]
+    )
+
+    count = employee.bulk_insert_from_dicts(
+        session,
+        [
+            {
+                "name": "employee 1",
+                "joined": "2000-01-02",
+                "photo": "photo 1",
+                "division": {"id": 1},
+            },
+            {"name": "employee 2", "division_id": 2},
+            {"name": "employee 3"},
+        ],
+        batch_size=2,
+    )
+    session.commit()
+
+    assert count == 3
+    queried_employees = session.query(employee).order_by(employee.id).all()
+    assert [
+        (
+            queried_employee.name,
+            queried_employee.joined,
+            queried_employee.photo,
+            queried_employee.division_id,
+        )
+        for queried_employee in queried_employees
+    ] == [
+        ("employee 1", datetime.date(2000, 1, 2), b"photo 1", 1),
+        ("employee 2", None, None, 2),
+        ("employee 3", None, None, None),
+    ]
+    assert queried_employees[0].division.name == "division 1"
+
+
+@pytest.mark.parametrize(
+    "value, expected_exception",
+    [
+        pytest.param(
+            {"name": "employee name too long"},
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="invalid",
+        ),
+        pytest.param(
+            {"name": 1},
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="invalid type",
+        ),
+        pytest.param(
+            {"unknown": 1},
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="unknown key",
+        ),
+        pytest.param(
+            {"division": {"name": "division 1"}},
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="relationship without foreign key property",
+        ),
+        pytest.param(
+            {"division": 1},
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="relationship not dictionary",
+        ),
+        pytest.param(
+            "employee",
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="not dictionary",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_bulk_insert_from_dicts_invalid(
+    engine, sessionmaker, value, expected_exception
+):
+    """
+    GIVEN models and dictionaries with an invalid dictionary
+    WHEN bulk_insert_from_dicts is called with the dictionaries
+    THEN the expected exception is raised with the index of the invalid dictionary.
+    """
+    _, employee = _define_models(engine)
+    session = sessionmaker()
+
+    with pytest.raises(expected_exception) as exc_info:
+        employee.bulk_insert_from_dicts(session, [{"name": "employee"}, value])
+
+    assert exc_info.value.index == 1
+
+
+@pytest.mark.integration
+def test_bulk_insert_from_dicts_invalid_same_error(engine, sessionmaker):
+    """
+    GIVEN models and dictionary that does not satisfy the schema
+    WHEN bulk_insert_from_dicts and from_dicts are called with the dictionary
+    THEN the same error is raised.
+    """
+    _, employee = _define_models(engine)
+    session = sessionmaker()
+    values = [{"name": "employee name too long"}]
+
+    with pytest.raises(
+        open_alchemy.exceptions.MalformedModelDictionaryError
+    ) as bulk_exc_info:
+        employee.bulk_insert_from_dicts(session, values)
+    with pytest.raises(
+        open_alchemy.exceptions.MalformedModelDictionaryError
+    ) as exc_info:
+        employee.from_dicts(values)
+
+    assert bulk_exc_info.value.args == exc_info.value.args
+    assert bulk_exc_info.value.path == exc_info.value.path == ["name"]
+    assert bulk_exc_info.value.model is exc_info.value.model is employee
+    assert bulk_exc_info.value.schema is exc_info.value.schema
+
+
+@pytest.mark.integration
+def test_bulk_insert_from_dicts_one_to_many(engine, sessionmaker):
+    """
+    GIVEN models and dictionary with the value of a one to many relationship
+    WHEN bulk_insert_from_dicts is called with the dictionary
+    THEN MalformedModelDictionaryError is raised.
+    """
+    division, _ = _define_models(engine)
+    session = sessionmaker()
+
+    with pytest.raises(open_alchemy.exceptions.MalformedModelDictionaryError):
+        division.bulk_insert_from_dicts(session, [{"id": 1, "employees": []}])
+
+
+@pytest.mark.integration
+def test_bulk_insert_from_dicts_collect_errors(engine, sessionmaker):
+    """
+    GIVEN models and dictionaries with invalid dictionaries
+    WHEN bulk_insert_from_dicts is called with the dictionaries and collect_errors
+    THEN the valid dictionaries are inserted and BatchError is raised with the
+        errors.
+    """
+    _, employee = _define_models(engine)
+    session = sessionmaker()
+    values = [{"name": "employee 1"}, {"name": 2}, {"name": "employee 3"}, {"id": "4"}]
+
+    with pytest.raises(open_alchemy.exceptions.BatchError) as exc_info:
+        employee.bulk_insert_from_dicts(
+            session, values, batch_size=1, collect_errors=True
+        )
+
+    assert list(exc_info.value.errors.keys()) == [1, 3]
+    assert [queried_employee.name for queried_employee in session.query(employee)] == [
+        "employee 1",
+        "employee 3",
+    ]
+
+
+@pytest.mark.parametrize(
+    "model_level, validation_level, expected_exception",
+    [
+        pytest.param(
+            open_alchemy.ValidationLevel.FULL,
+            None,
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="model full",
+        ),
+        pytest.param(
+            open_alchemy.ValidationLevel.TRUSTED, None, None, id="model trusted"
+        ),
+        pytest.param(
+            open_alchemy.ValidationLevel.FULL,
+            open_alchemy.ValidationLevel.TYPES,
+            None,
+            id="types",
+        ),
+    ],
+)
+@pytest.mark.integration
+def test_bulk_insert_from_dicts_validation_level(
+    engine, sessionmaker, model_level, validation_level, expected_exception
+):
+    """
+    GIVEN models with a validation level and dictionary that does not satisfy the
+        schema but has values of the expected types
+    WHEN bulk_insert_from_dicts is called with the dictionary and validation level
+    THEN the dictionary is validated based on the level.
+    """
+    _, employee = _define_models(engine, validation_level=model_level)
+    session = sessionmaker()
+    values = [{"name": "employee name too long"}]
+
+    if expected_exception is not None:
+        with pytest.raises(expected_exception):
+            employee.bulk_insert_from_dicts(
+                session, values, validation_level=validation_level
+            )
+        return
+
+    count = employee.bulk_insert_from_dicts(
+        session, values, validation_level=validation_level
+    )
+
+    assert count == 1
+
+
+@pytest.mark.integration
+def test_bulk_insert_from_dicts_context_trusted(engine, sessionmaker):
+    """
+    GIVEN models defined on the namespace of a context with object and array
+        relationships
+    WHEN from_dicts and bulk_insert_from_dicts are called with nested dictionaries and
+        the trusted level
+    THEN the related models are retrieved from the namespace of the context.
+    """
+    context = open_alchemy.OpenAlchemy(name="trusted_models")
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base, spec=SPEC, context=context
+    )
+    project = model_factory(name="Project")
+    division = model_factory(name="Division")
+    employee = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+    level = open_alchemy.ValidationLevel.TRUSTED
+
+    (division_instance,) = division.from_dicts(
+        [{"id": 1, "employees": [{"id": 1}]}], validation_level=level
+    )
+    (employee_instance,) = employee.from_dicts(
+        [{"id": 1, "division": {"id": 2}}], validation_level=level
+    )
+    with open_alchemy.utility_base.validation.use_level(level):
+        nested_employee_instance = employee.from_dict(id=2, division={"id": 3})
+    session = sessionmaker()
+    session.add(division_instance)
+    session.flush()
+    count = employee.bulk_insert_from_dicts(
+        session, [{"id": 3, "division": {"id": 1}}], validation_level=level
+    )
+
+    assert type(division_instance.employees[0]) is project
+    assert type(employee_instance.division) is division
+    assert type(nested_employee_instance.division) is division
+    assert count == 1
+    assert session.query(employee).get(3).division is division_instance
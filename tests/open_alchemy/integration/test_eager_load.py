@@ -0,0 +1,197 @@
+"""Integration tests for the eager loading options of to_dict."""
+
+import pytest
+import sqlalchemy
+from sqlalchemy.ext import declarative
+
+import open_alchemy
+
+SPEC = {
+    "components": {
+        "schemas": {
+            "Division": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "employees": {
+                        "type": "array",
+                        "readOnly": True,
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "id": {"type": "integer"},
+                                "name": {"type": "string"},
+                            },
+                        },
+                    },
+                },
+                "x-tablename": "division",
+                "x-backref": "employees",
+                "type": "object",
+            },
+            "Employee": {
+                "properties": {
+                    "id": {"type": "integer", "x-primary-key": True},
+                    "name": {"type": "string"},
+                    "division": {"$ref": "#/components/schemas/Division"},
+                },
+                "x-tablename": "employee",
+                "type": "object",
+            },
+        }
+    }
+}
+
+
+def _define_models(engine, sessionmaker, count):
+    """Define the models and add employees with their own division."""
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(base=base, spec=SPEC)
+    division = model_factory(name="Division")
+    employee = model_factory(name="Employee")
+    base.metadata.create_all(engine)
+
+    session = sessionmaker()
+    for idx in range(count):
+        session.add(
+            employee.from_dict(
+                id=idx,
+                name=f"employee {idx}",
+                division={"id": idx, "name": f"division {idx}"},
+            )
+        )
+    session.commit()
+    session.close()
+    return division, employee
+
+
+def _count_queries(engine, func):
+    """Count the queries executed by the function."""
+    statements = []
+
+    def before_cursor_execute(*args):
+        """Record the statement."""
+        statements.append(args[2])
+
+    sqlalchemy.event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        return_value = func()
+    finally:
+        sqlalchemy.event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return return_value, len(statements)
+
+
+@pytest.mark.parametrize("strategy", ["selectin", "joined"])
+@pytest.mark.parametrize("count", [2, 5])
+@pytest.mark.integration
+def test_eager_load_options_query_count(engine, sessionmaker, strategy, count):
+    """
+    GIVEN models with relationships and instances
+    WHEN the instances are queried with the eager loading options and converted
+        using to_dicts
+    THEN the number of queries does not depend on the number of instances.
+    """
+    _, employee = _define_models(engine, sessionmaker, count)
+    session = sessionmaker()
+    options = employee.eager_load_options(strategy=strategy)
+
+    dictionaries, query_count = _count_queries(
+        engine, lambda: employee.to_dicts(session.query(employee).options(*options))
+    )
+
+    assert len(dictionaries) == count
+    assert dictionaries[0] == {
+        "id": 0,
+        "name": "employee 0",
+        "division": {
+            "id": 0,
+            "name": "division 0",
+            "employees": [{"id": 0, "name": "employee 0"}],
+        },
+    }
+    expected_query_count = {"selectin": 3, "joined": 1}[strategy]
+    assert query_count == expected_query_count
+
+
+@pytest.mark.integration
+def test_eager_load_options_no_options(engine, sessionmaker):
+    """
+    GIVEN models with relationships and instances
+    WHEN the instances are queried without the eager loading options and converted
+        using to_dicts
+    THEN the relationships are loaded for each instance.
+    """
+    _, employee = _define_models(engine, sessionmaker, 5)
+    session = sessionmaker()
+
+    _, query_count = _count_queries(
+        engine, lambda: employee.to_dicts(session.query(employee))
+    )
+
+    assert query_count > 4
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_query_count",
+    [
+        pytest.param({"max_depth": 0}, 1, id="max_depth 0"),
+        pytest.param({"exclude": ["division.employees"]}, 2, id="exclude"),
+        pytest.param({"include": ["id", "division.id"]}, 2, id="include"),
+    ],
+)
+@pytest.mark.integration
+def test_eager_load_options_selection(
+    engine, sessionmaker, kwargs, expected_query_count
+):
+    """
+    GIVEN models with relationships and instances
+    WHEN the instances are queried with the eager loading options for a selection
+        and converted using to_dicts with the selection
+    THEN only the selected relationships are loaded.
+    """
+    _, employee = _define_models(engine, sessionmaker, 5)
+    session = sessionmaker()
+    options = employee.eager_load_options(**kwargs)
+
+    _, query_count = _count_queries(
+        engine,
+        lambda: employee.to_dicts(session.query(employee).options(*options), **kwargs),
+    )
+
+    assert query_count == expected_query_count
+
+
+@pytest.mark.integration
+def test_eager_load_options_read_only(engine, sessionmaker):
+    """
+    GIVEN models with a readOnly relationship and instances
+    WHEN the instances are queried with the eager loading options that exclude a
+        property of the readOnly relationship
+    THEN the related instances are loaded without the excluded column.
+    """
+    division, _ = _define_models(engine, sessionmaker, 2)
+    session = sessionmaker()
+    options = division.eager_load_options(exclude=["employees.name"])
+
+    queried_division = session.query(division).options(*options).first()
+
+    assert queried_division.to_dict(exclude=["employees.name"]) == {
+        "id": 0,
+        "name": "division 0",
+        "employees": [{"id": 0}],
+    }
+    queried_employee = queried_division.employees[0]
+    assert "name" in sqlalchemy.inspect(queried_employee).unloaded
+
+
+@pytest.mark.integration
+def test_eager_load_options_invalid_strategy(engine, sessionmaker):
+    """
+    GIVEN model
+    WHEN eager_load_options is called with a strategy that is not known
+    THEN ValueError is raised.
+    """
+    _, employee = _define_models(engine, sessionmaker, 0)
+
+    with pytest.raises(ValueError):
+        employee.eager_load_options(strategy="subquery")
@@ -1,14 +1,19 @@
 """Integration tests for initialization."""
 
 import json
+import runpy
 import sys
+from concurrent import futures
 from unittest import mock
 
 import pytest
 import yaml
+from sqlalchemy import orm
 
 import open_alchemy
 from open_alchemy import facades
+from open_alchemy import helpers
+from open_alchemy import schemas
 
 
 @pytest.mark.integration
@@ -30,6 +35,10 @@ def test_init_optional_base_none_call(
         spec=spec,
         models_filename=None,
         spec_path=None,
+        processed=False,
+        lazy=False,
+        validation_level=open_alchemy.ValidationLevel.FULL,
+        context=None,
     )
 
 
@@ -64,7 +73,14 @@ def test_init_optional_base_def_call(mocked_init_model_factory: mock.MagicMock):
     open_alchemy._init_optional_base(base=base, spec=spec)
 
     mocked_init_model_factory.assert_called_once_with(
-        base=base, spec=spec, models_filename=None, spec_path=None
+        base=base,
+        spec=spec,
+        models_filename=None,
+        spec_path=None,
+        processed=False,
+        lazy=False,
+        validation_level=open_alchemy.ValidationLevel.FULL,
+        context=None,
     )
 
 
@@ -193,6 +209,44 @@ def test_schema():
     assert isinstance(model.column.type, facades.sqlalchemy.types.Integer)
 
 
+@pytest.mark.integration
+def test_models_file_artifacts_once(tmp_path):
+    """
+    GIVEN valid specification with single property
+    WHEN init_model_factory is called with the specification and a models file path
+    THEN the property is validated and its artifacts are calculated once.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "properties": {"column": {"type": "integer"}},
+                    "x-tablename": "table",
+                    "type": "object",
+                }
+            }
+        }
+    }
+    models_file = tmp_path / "models.py"
+
+    with mock.patch.object(
+        schemas.validation.property_,
+        "check",
+        wraps=schemas.validation.property_.check,
+    ) as mock_check, mock.patch.object(
+        schemas.artifacts.property_,
+        "_get",
+        wraps=schemas.artifacts.property_._get,
+    ) as mock_get:
+        open_alchemy.init_model_factory(
+            base=mock.MagicMock, spec=spec, models_filename=str(models_file)
+        )
+
+    assert mock_check.call_count == 1
+    assert mock_get.call_count == 1
+    assert "Table: typing.Type[TTable] = models.Table" in models_file.read_text()
+
+
 BASIC_SPEC = {
     "components": {
         "schemas": {
@@ -237,6 +291,132 @@ def test_init_json(engine, sessionmaker, tmp_path):
     assert queried_model.column == value
 
 
+@pytest.mark.integration
+def test_init_json_backend(tmp_path):
+    """
+    GIVEN specification stored in a JSON file and context with a JSON backend
+    WHEN init_json is called with the file and the context
+    THEN the models use the backend and the default backend is not changed.
+    """
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(BASIC_SPEC))
+    context = open_alchemy.OpenAlchemy(json_backend=facades.json.Backend.JSON)
+
+    _, model_factory = open_alchemy.init_json(str(spec_file), context=context)
+    model = model_factory(name="Table")
+
+    assert model._json_backend == facades.json.Backend.JSON
+    assert facades.json.get_backend() == facades.json.Backend.AUTO
+    assert model.from_str('{"column": 1}').to_str() == '{"column": 1}'
+
+
+@pytest.mark.integration
+def test_init_json_cache(engine, sessionmaker, tmp_path):
+    """
+    GIVEN specification stored in a JSON file and context with a cache directory
+    WHEN init_json is called with the file and context multiple times
+    THEN the schemas are only processed and the remote references are only prefetched
+        the first time and valid model factories are returned.
+    """
+    # Generate spec file
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.json"
+    spec_file.write_text(json.dumps(BASIC_SPEC))
+    context = open_alchemy.OpenAlchemy(cache_dir=str(tmp_path / "cache"))
+
+    # Creating model factories
+    with mock.patch.object(
+        schemas, "process", wraps=schemas.process
+    ) as mock_process, mock.patch.object(
+        helpers.ref, "prefetch", wraps=helpers.ref.prefetch
+    ) as mock_prefetch:
+        open_alchemy.init_json(str(spec_file), context=context)
+        base, model_factory = open_alchemy.init_json(str(spec_file), context=context)
+    assert mock_process.call_count == 1
+    assert mock_prefetch.call_count == 1
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+    # Creating model instance
+    model_instance = model(column=1)
+    session = sessionmaker()
+    session.add(model_instance)
+    session.flush()
+
+    # Querying session
+    queried_model = session.query(model).first()
+    assert queried_model.column == 1
+
+
+@pytest.mark.integration
+def test_init_json_lazy(engine, sessionmaker, tmp_path):
+    """
+    GIVEN specification with related and unrelated models stored in a JSON file
+    WHEN init_json is called with the file and lazy set and a model is retrieved
+    THEN only the model and the models it has relationships to are constructed.
+    """
+    spec = {
+        "components": {
+            "schemas": {
+                "Parent": {
+                    "type": "object",
+                    "x-tablename": "parent",
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "child": {
+                            "allOf": [
+                                {"$ref": "#/components/schemas/Child"},
+                                {"x-backref": "parents", "x-uselist": True},
+                            ]
+                        },
+                    },
+                },
+                "Child": {
+                    "type": "object",
+                    "x-tablename": "child",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                },
+                "Unrelated": {
+                    "type": "object",
+                    "x-tablename": "unrelated",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                },
+            }
+        }
+    }
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(spec))
+
+    # Creating model factory
+    base, _ = open_alchemy.init_json(str(spec_file), lazy=True)
+    assert "Parent" not in vars(open_alchemy.models)
+    parent = open_alchemy.models.Parent
+    assert "Child" in vars(open_alchemy.models)
+    assert "Unrelated" not in vars(open_alchemy.models)
+    with pytest.raises(AttributeError):
+        getattr(open_alchemy.models, "Missing")
+
+    # Creating models
+    base.metadata.create_all(engine)
+    # Creating model instance
+    session = sessionmaker()
+    session.add(open_alchemy.models.Child(id=1, parents=[parent(id=2)]))
+    session.flush()
+
+    # Querying session
+    queried_parent = session.query(parent).first()
+    assert queried_parent.child.id == 1
+
+    # Initializing without lazy removes lazy construction
+    open_alchemy.init_json(str(spec_file))
+    assert "__getattr__" not in vars(open_alchemy.models)
+    # Configure the models while they are referenced so that configuring the models
+    # of later tests does not depend on when these are garbage collected
+    orm.configure_mappers()
+
+
 @pytest.mark.integration
 def test_init_json_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_store):
     """
@@ -316,6 +496,42 @@ def test_init_yaml(engine, sessionmaker, tmp_path):
     assert queried_model.column == value
 
 
+@pytest.mark.integration
+def test_init_yaml_cache(engine, sessionmaker, tmp_path):
+    """
+    GIVEN specification stored in a YAML file and context with a cache directory
+    WHEN init_yaml is called with the file and context multiple times
+    THEN the file is only parsed the first time and a valid model factory is returned.
+    """
+    # Generate spec file
+    directory = tmp_path / "specs"
+    directory.mkdir()
+    spec_file = directory / "spec.yaml"
+    spec_file.write_text(yaml.dump(BASIC_SPEC))
+    context = open_alchemy.OpenAlchemy(cache_dir=str(tmp_path / "cache"))
+
+    # Creating model factories
+    with mock.patch.object(
+        open_alchemy.facades.yaml, "load", wraps=open_alchemy.facades.yaml.load
+    ) as mock_load:
+        open_alchemy.init_yaml(str(spec_file), context=context)
+        base, model_factory = open_alchemy.init_yaml(str(spec_file), context=context)
+    assert mock_load.call_count == 1
+    model = model_factory(name="Table")
+
+    # Creating models
+    base.metadata.create_all(engine)
+    # Creating model instance
+    model_instance = model(column=1)
+    session = sessionmaker()
+    session.add(model_instance)
+    session.flush()
+
+    # Querying session
+    queried_model = session.query(model).first()
+    assert queried_model.column == 1
+
+
 @pytest.mark.integration
 def test_init_yaml_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_store):
     """
@@ -364,6 +580,70 @@ def test_init_yaml_remote(engine, sessionmaker, tmp_path, _clean_remote_schemas_
     assert queried_model.column == value
 
 
+@pytest.mark.integration
+def test_init_json_context_threads(tmp_path, _clean_remote_schemas_store):
+    """
+    GIVEN specifications with remote references to files with the same name but
+        different schemas
+    WHEN init_json is called with the files and a context for each in different
+        threads at the same time
+    THEN the models of each specification are defined on the namespace of its context
+        using the remote schemas of the specification.
+    """
+    # pylint: disable=protected-access
+    spec = {
+        "components": {
+            "schemas": {
+                "Child": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "value": {"$ref": "remote.json#/Value"},
+                    },
+                    "x-tablename": "child",
+                    "type": "object",
+                },
+                "Parent": {
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "child": {"$ref": "#/components/schemas/Child"},
+                    },
+                    "x-tablename": "parent",
+                    "type": "object",
+                },
+            }
+        }
+    }
+    value_types = ["integer", "string"]
+    spec_files = []
+    for value_type in value_types:
+        directory = tmp_path / value_type
+        directory.mkdir()
+        (directory / "spec.json").write_text(json.dumps(spec))
+        (directory / "remote.json").write_text(
+            json.dumps({"Value": {"type": value_type}})
+        )
+        spec_files.append(str(directory / "spec.json"))
+    contexts = [open_alchemy.OpenAlchemy() for _ in spec_files]
+
+    with futures.ThreadPoolExecutor(max_workers=len(spec_files)) as executor:
+        list(
+            executor.map(
+                lambda args: open_alchemy.init_json(args[0], context=args[1]),
+                zip(spec_files, contexts),
+            )
+        )
+
+    for context, value_type, value in zip(contexts, value_types, [1, "value 1"]):
+        parent = context.models.Parent.from_dict(id=1, child={"id": 2, "value": value})
+        assert parent.child.value == value
+        assert context.models.Child._schema["properties"]["value"]["type"] == (
+            value_type
+        )
+    assert contexts[0].models.Base is not contexts[1].models.Base
+    assert not hasattr(open_alchemy.models, "Parent")
+    assert open_alchemy.helpers.ref.get_remote_contexts() == []
+
+
 @pytest.mark.integration
 def test_init_yaml_import_error():
     """
@@ -714,6 +994,66 @@ def test_build_json(tmp_path):
     assert "Schema: typing.Type[TSchema]" in init_contents
 
 
+@pytest.mark.integration
+def test_build_json_precompiled(engine, sessionmaker, tmp_path):
+    """
+    GIVEN spec with a relationship, package name and distribution path
+    WHEN build_json is called with precompiled set and the package is imported
+    THEN the schemas are not processed on import and the models are valid.
+    """
+    dist = tmp_path / "dist"
+    dist.mkdir()
+
+    name = "app_models"
+    spec = {
+        "components": {
+            "schemas": {
+                "Parent": {
+                    "type": "object",
+                    "x-tablename": "parent",
+                    "properties": {
+                        "id": {"type": "integer", "x-primary-key": True},
+                        "children": {
+                            "type": "array",
+                            "items": {"$ref": "#/components/schemas/Child"},
+                        },
+                    },
+                },
+                "Child": {
+                    "type": "object",
+                    "x-tablename": "child",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                },
+            }
+        },
+    }
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(spec))
+
+    open_alchemy.build_json(
+        str(spec_path), package_name=name, dist_path=str(dist), precompiled=True
+    )
+
+    # Import the package
+    init_path = dist / name / name / "__init__.py"
+    with mock.patch.object(schemas, "process", wraps=schemas.process) as mock_process:
+        runpy.run_path(str(init_path))
+    assert mock_process.call_count == 0
+
+    # Creating models
+    parent = open_alchemy.models.Parent
+    child = open_alchemy.models.Child
+    open_alchemy.models.Base.metadata.create_all(engine)
+    session = sessionmaker()
+    session.add(parent(id=1, children=[child(id=2)]))
+    session.flush()
+
+    # Querying session
+    queried_child = session.query(child).first()
+    assert queried_child.id == 2
+    assert queried_child.parent_children_id == 1
+
+
 @pytest.mark.integration
 def test_build_yaml(tmp_path):
     """
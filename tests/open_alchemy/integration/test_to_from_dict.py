@@ -1,6 +1,7 @@
 """Integration tests for from_dict and to_dict."""
 
 import pytest
+import sqlalchemy
 from sqlalchemy.ext import declarative
 
 import open_alchemy
@@ -587,3 +588,122 @@ def test_inheritance(engine, sessionmaker):
     assert queried_employee.to_dict() == employee_dict
     queried_manager = session.query(manager).first()
     assert queried_manager.to_dict() == manager_dict
+
+
+@pytest.mark.parametrize(
+    "validation_level, expected_exception",
+    [
+        pytest.param(
+            open_alchemy.ValidationLevel.FULL,
+            open_alchemy.exceptions.MalformedModelDictionaryError,
+            id="full",
+        ),
+        pytest.param(
+            open_alchemy.ValidationLevel.TYPES,
+            open_alchemy.exceptions.InvalidInstanceError,
+            id="types",
+        ),
+        pytest.param(open_alchemy.ValidationLevel.TRUSTED, None, id="trusted"),
+    ],
+)
+@pytest.mark.integration
+def test_from_dict_validation_level(validation_level, expected_exception):
+    """
+    GIVEN specification and validation level
+    WHEN models are defined with the level and constructed using from_dict with a
+        dictionary that does not satisfy the schema
+    THEN the dictionary is validated based on the level.
+    """
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "name": {"type": "string", "maxLength": 1},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    }
+                }
+            }
+        },
+        validation_level=validation_level,
+    )
+    model = model_factory(name="Table")
+    model_dict = {"id": "1", "name": "name 1"}
+
+    if expected_exception is not None:
+        with pytest.raises(expected_exception):
+            model.from_dict(**model_dict)
+        return
+
+    instance = model.from_dict(**model_dict)
+
+    assert instance.name == "name 1"
+
+
+@pytest.mark.integration
+def test_to_dict_selection(engine, sessionmaker):
+    """
+    GIVEN specification that has a schema with a many to one relationship
+    WHEN model is defined based on schema, constructed using from_dict and to_dict is
+        called with include, exclude and max_depth
+    THEN the selected properties are returned and the relationship is only loaded if
+        it is selected.
+    """
+    # Creating model factory
+    base = declarative.declarative_base()
+    model_factory = open_alchemy.init_model_factory(
+        base=base,
+        spec={
+            "components": {
+                "schemas": {
+                    "RefTable": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "name": {"type": "string"},
+                        },
+                        "x-tablename": "ref_table",
+                        "type": "object",
+                    },
+                    "Table": {
+                        "properties": {
+                            "id": {"type": "integer", "x-primary-key": True},
+                            "name": {"type": "string"},
+                            "ref_table": {"$ref": "#/components/schemas/RefTable"},
+                        },
+                        "x-tablename": "table",
+                        "type": "object",
+                    },
+                }
+            }
+        },
+    )
+    model_factory(name="RefTable")
+    model = model_factory(name="Table")
+    # Creating models
+    base.metadata.create_all(engine)
+    instance = model.from_dict(
+        **{"id": 11, "name": "name 1", "ref_table": {"id": 12, "name": "name 2"}}
+    )
+    session = sessionmaker()
+    session.add(instance)
+    session.commit()
+    session.close()
+
+    session = sessionmaker()
+    queried_instance = session.query(model).first()
+    assert queried_instance.to_dict(max_depth=0) == {"id": 11, "name": "name 1"}
+    assert queried_instance.to_dict(exclude=["ref_table"]) == {
+        "id": 11,
+        "name": "name 1",
+    }
+    assert "ref_table" in sqlalchemy.inspect(queried_instance).unloaded
+    assert queried_instance.to_dict(include=["id", "ref_table.name"]) == {
+        "id": 11,
+        "ref_table": {"name": "name 2"},
+    }
@@ -0,0 +1,216 @@
+"""Tests for the index of the values resolved from the schemas."""
+
+from unittest import mock
+
+import pytest
+
+from open_alchemy.schemas.helpers import index
+from open_alchemy.schemas.helpers import iterate
+
+
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_memoise_no_index():
+    """
+    GIVEN no active index
+    WHEN memoise is called multiple times
+    THEN the value is calculated each time.
+    """
+    schemas = {}
+    schema = {}
+    calculate = mock.MagicMock()
+
+    index.memoise(schemas=schemas, kind="kind", schema=schema, calculate=calculate)
+    index.memoise(schemas=schemas, kind="kind", schema=schema, calculate=calculate)
+
+    assert calculate.call_count == 2
+
+
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_memoise():
+    """
+    GIVEN active index
+    WHEN memoise is called multiple times for the same and different schemas
+    THEN the value is calculated once for each schema.
+    """
+    schemas = {}
+    schema_1 = {}
+    schema_2 = {}
+    calculate = mock.MagicMock()
+
+    with index.build(schemas=schemas):
+        value_1 = index.memoise(
+            schemas=schemas, kind="kind", schema=schema_1, calculate=calculate
+        )
+        value_2 = index.memoise(
+            schemas=schemas, kind="kind", schema=schema_1, calculate=calculate
+        )
+        index.memoise(
+            schemas=schemas, kind="kind", schema=schema_2, calculate=calculate
+        )
+        index.memoise(schemas={}, kind="kind", schema=schema_1, calculate=calculate)
+
+    assert value_1 is value_2
+    assert calculate.call_count == 3
+    assert index.get(schemas=schemas) is None
+
+
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_invalidate():
+    """
+    GIVEN active index with derived and other values
+    WHEN invalidate is called
+    THEN only the derived values are calculated again.
+    """
+    schemas = {}
+    schema = {}
+    calculate = mock.MagicMock()
+    calculate_derived = mock.MagicMock()
+
+    with index.build(schemas=schemas) as index_:
+        for _ in range(2):
+            index.memoise(
+                schemas=schemas, kind="kind", schema=schema, calculate=calculate
+            )
+            index.memoise(
+                schemas=schemas,
+                kind="derived",
+                schema=schema,
+                calculate=calculate_derived,
+                derived=True,
+            )
+            index_.invalidate()
+
+    assert calculate.call_count == 1
+    assert calculate_derived.call_count == 2
+
+
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_iterate_uses_index():
+    """
+    GIVEN active index and schemas with a constructable schema
+    WHEN constructable and properties_items are called multiple times
+    THEN the schema is resolved once.
+    """
+    schemas = {
+        "Schema1": {
+            "x-tablename": "table 1",
+            "type": "object",
+            "properties": {"prop_1": {"type": "integer"}},
+        }
+    }
+
+    with mock.patch.object(
+        iterate.helpers.schema,
+        "constructable",
+        wraps=iterate.helpers.schema.constructable,
+    ) as mock_constructable, mock.patch.object(
+        iterate, "properties_values", wraps=iterate.properties_values
+    ) as mock_properties_values, index.build(
+        schemas=schemas
+    ):
+        for _ in range(2):
+            ((_, schema),) = iterate.constructable(schemas=schemas)
+            assert list(
+                iterate.properties_items(
+                    schema=schema, schemas=schemas, stay_within_model=True
+                )
+            ) == [("prop_1", {"type": "integer"})]
+
+    assert mock_constructable.call_count == 1
+    assert mock_properties_values.call_count == 1
+
+
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_iterate_constructable_invalidate():
+    """
+    GIVEN active index and schemas
+    WHEN constructable is called, a schema is added and constructable is called before
+        and after the index is invalidated
+    THEN the added schema is only included after the index is invalidated.
+    """
+    schemas = {"Schema1": {"x-tablename": "table 1"}}
+
+    with index.build(schemas=schemas) as index_:
+        assert [name for name, _ in iterate.constructable(schemas=schemas)] == [
+            "Schema1"
+        ]
+        schemas["Schema2"] = {"x-tablename": "table 2"}
+        assert [name for name, _ in iterate.constructable(schemas=schemas)] == [
+            "Schema1"
+        ]
+        index_.invalidate()
+        assert [name for name, _ in iterate.constructable(schemas=schemas)] == [
+            "Schema1",
+            "Schema2",
+        ]
+
+
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_build_nested():
+    """
+    GIVEN active index for schemas
+    WHEN build is called for the same and different schemas
+    THEN the active index is re-used only for the same schemas.
+    """
+    schemas = {}
+
+    with index.build(schemas=schemas) as index_:
+        with index.build(schemas=schemas) as nested_index:
+            assert nested_index is index_
+        assert index.get(schemas=schemas) is index_
+
+        other_schemas = {}
+        with index.build(schemas=other_schemas) as other_index:
+            assert other_index is not index_
+            assert index.get(schemas=schemas) is None
+        assert index.get(schemas=schemas) is index_
+
+
+@pytest.mark.schemas
+@pytest.mark.helper
+def test_memoise_property():
+    """
+    GIVEN active index
+    WHEN memoise_property is called multiple times for properties of a schema
+    THEN the value is calculated once for each property until the index is invalidated.
+    """
+    schemas = {}
+    schema = {}
+    property_schema_1 = {}
+    property_schema_2 = {}
+    calculate = mock.MagicMock()
+
+    with index.build(schemas=schemas) as index_:
+        for property_name, property_schema in [
+            ("prop_1", property_schema_1),
+            ("prop_1", property_schema_1),
+            ("prop_2", property_schema_2),
+            ("prop_2", property_schema_1),
+        ]:
+            index.memoise_property(
+                schemas=schemas,
+                kind="kind",
+                schema=schema,
+                property_name=property_name,
+                property_schema=property_schema,
+                calculate=calculate,
+            )
+        assert calculate.call_count == 3
+
+        index_.invalidate()
+        index.memoise_property(
+            schemas=schemas,
+            kind="kind",
+            schema=schema,
+            property_name="prop_1",
+            property_schema=property_schema_1,
+            calculate=calculate,
+        )
+
+    assert calculate.call_count == 4
@@ -1,8 +1,14 @@
 """Tests for validation rules."""
 
+import json
+import time
+from unittest import mock
+
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import helpers
+from open_alchemy.schemas import helpers as schemas_helpers
 from open_alchemy.schemas import validation
 
 PROCESS_TESTS = [
@@ -259,6 +265,164 @@ def test_process(schemas, raises):
         validation.process(schemas=schemas)
 
 
+@pytest.mark.parametrize(
+    "schemas, expected_message",
+    [
+        pytest.param(
+            {
+                "Schema1": {
+                    "type": "object",
+                    "x-tablename": "schema_1",
+                    "properties": {"prop_1": {}},
+                },
+                "Schema2": {"x-tablename": "schema_2"},
+            },
+            "Schema2 :: ",
+            id="model after property",
+        ),
+        pytest.param(
+            {
+                "Schema1": {
+                    "type": "object",
+                    "x-tablename": "schema_1",
+                    "properties": {"prop_1": {}},
+                },
+                "Schema2": {
+                    "type": "object",
+                    "x-tablename": "schema_2",
+                    "properties": {"prop_2": {}},
+                },
+            },
+            "Schema1 :: prop_1 :: ",
+            id="multiple properties",
+        ),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_first_error(schemas, expected_message):
+    """
+    GIVEN schemas with multiple errors
+    WHEN process is called with the schemas
+    THEN any invalid model is reported before any invalid property.
+    """
+    with pytest.raises(exceptions.MalformedSchemaError) as exc:
+        with schemas_helpers.index.build(schemas=schemas):
+            validation.process(schemas=schemas)
+
+    assert str(exc.value).startswith(expected_message)
+
+
+def _parallel_schemas(invalid_property_names, invalid_model_names):
+    """Generate many schemas with invalid properties and models."""
+    schemas = {}
+    for idx in range(20):
+        name = f"Schema{idx}"
+        schemas[name] = {
+            "type": "object",
+            "x-tablename": f"schema_{idx}",
+            "properties": {
+                "id": {"type": "integer", "x-primary-key": True},
+                "prop": {} if name in invalid_property_names else {"type": "string"},
+            },
+        }
+        if name in invalid_model_names:
+            schemas[name] = {"x-tablename": f"schema_{idx}"}
+    return schemas
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [validation.Executor.THREAD, validation.Executor.PROCESS],
+)
+@pytest.mark.parametrize(
+    "schemas, expected_message",
+    [
+        pytest.param(_parallel_schemas([], []), None, id="valid"),
+        pytest.param(
+            _parallel_schemas(["Schema12", "Schema5"], []),
+            "Schema5 :: prop :: ",
+            id="multiple properties",
+        ),
+        pytest.param(
+            _parallel_schemas(["Schema5"], ["Schema15", "Schema17"]),
+            "Schema15 :: ",
+            id="model after property",
+        ),
+    ],
+)
+@pytest.mark.schemas
+@pytest.mark.validate
+def test_process_parallel(schemas, expected_message, executor):
+    """
+    GIVEN many schemas and executor
+    WHEN process is called with the schemas, multiple workers and the executor
+    THEN the same error is raised as when the models are validated one after the
+        other.
+    """
+    if expected_message is None:
+        validation.process(schemas=schemas, workers=2, executor=executor)
+        return
+
+    with pytest.raises(exceptions.MalformedSchemaError) as serial_exc:
+        validation.process(schemas=schemas)
+    with pytest.raises(exceptions.MalformedSchemaError) as exc:
+        validation.process(schemas=schemas, workers=2, executor=executor)
+
+    assert str(exc.value).startswith(expected_message)
+    assert str(exc.value) == str(serial_exc.value)
+
+
+@pytest.mark.schemas
+@pytest.mark.validate
+@pytest.mark.usefixtures("_clean_remote_schemas_store")
+def test_process_parallel_thread_remote(tmp_path):
+    """
+    GIVEN many schemas with properties that reference remote schemas that reference
+        other remote schemas
+    WHEN process is called with the schemas and multiple thread workers
+    THEN each remote context is only loaded once and the same error is raised as when
+        the models are validated one after the other.
+    """
+    # pylint: disable=protected-access
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text("{}")
+    for idx in range(4):
+        (tmp_path / f"remote_{idx}.json").write_text(
+            json.dumps({"Prop": {"$ref": f"nested_{idx}.json#/Prop"}})
+        )
+        (tmp_path / f"nested_{idx}.json").write_text(
+            json.dumps({"Prop": {"type": "string" if idx else "invalid"}})
+        )
+    schemas = _parallel_schemas([], [])
+    for idx, schema in enumerate(schemas.values()):
+        schema["properties"]["prop"] = {"$ref": f"remote_{idx % 4}.json#/Prop"}
+    store = helpers.ref.get_store()
+    helpers.ref.set_context(path=str(spec_file))
+    load_schemas = store._load_schemas
+
+    def slow_load_schemas(*, context):
+        """Load the schemas slowly so that the threads overlap."""
+        time.sleep(0.01)
+        return load_schemas(context=context)
+
+    with mock.patch.object(
+        store, "_load_schemas", side_effect=slow_load_schemas
+    ) as mock_load:
+        with pytest.raises(exceptions.MalformedSchemaError) as exc:
+            validation.process(
+                schemas=schemas, workers=4, executor=validation.Executor.THREAD
+            )
+    with pytest.raises(exceptions.MalformedSchemaError) as serial_exc:
+        validation.process(schemas=schemas)
+
+    loaded_contexts = [call[1]["context"] for call in mock_load.call_args_list]
+    assert sorted(loaded_contexts) == sorted(set(loaded_contexts))
+    assert len(loaded_contexts) == 8
+    assert str(exc.value).startswith("Schema0 :: prop :: ")
+    assert str(exc.value) == str(serial_exc.value)
+
+
 CHECK_TESTS = [
     pytest.param(
         True,
@@ -269,6 +269,25 @@ init_json(parent_path / "spec.json")"""
     assert returned_contents == expected_contents
 
 
+@pytest.mark.build
+def test_generate_init_open_alchemy_precompiled():
+    """
+    GIVEN precompiled is set
+    WHEN generate_init_open_alchemy is called
+    THEN the __init__.py file contents that skip processing the spec are returned.
+    """
+    returned_contents = build.generate_init_open_alchemy(precompiled=True)
+
+    expected_contents = """import pathlib
+
+from open_alchemy import init_json
+
+parent_path = pathlib.Path(__file__).parent.absolute()
+init_json(parent_path / "spec.json", processed=True)"""
+
+    assert returned_contents == expected_contents
+
+
 GENERATE_INIT_MODELS_FILE_TESTS = [
     # pylint: disable=line-too-long
     pytest.param(
@@ -0,0 +1,374 @@
+"""Tests for the cache of the processed schemas and artifacts."""
+
+import json
+import os
+import pickle
+import stat
+from unittest import mock
+from urllib import error
+
+import pytest
+
+from open_alchemy import cache
+
+
+def _create_entry(remote_hashes=None):
+    """Create an entry for the cache."""
+    return cache.Entry(
+        schemas={"Schema1": {"type": "object"}},
+        artifacts={},
+        models_file_artifacts=None,
+        remote_hashes={} if remote_hashes is None else remote_hashes,
+    )
+
+
+@pytest.mark.cache
+def test_calculate_key():
+    """
+    GIVEN specifications
+    WHEN calculate_key is called with the specifications
+    THEN the key only changes if the specification changes.
+    """
+    key_1 = cache.calculate_key(spec={"key_1": "value 1", "key_2": "value 2"})
+    key_2 = cache.calculate_key(spec={"key_2": "value 2", "key_1": "value 1"})
+    key_3 = cache.calculate_key(spec={"key_1": "value 2"})
+
+    assert key_1 == key_2
+    assert key_1 != key_3
+
+
+@pytest.mark.cache
+def test_calculate_key_spec_path(tmp_path):
+    """
+    GIVEN specification at different paths
+    WHEN calculate_key is called with the specification and each path
+    THEN the key changes with the path.
+    """
+    spec = {"key_1": "value 1"}
+
+    key_1 = cache.calculate_key(spec=spec, spec_path=str(tmp_path / "dir1/spec.json"))
+    key_2 = cache.calculate_key(spec=spec, spec_path=str(tmp_path / "dir2/spec.json"))
+
+    assert key_1 != key_2
+    assert key_1 == cache.calculate_key(
+        spec=spec, spec_path=str(tmp_path / "dir1/../dir1/spec.json")
+    )
+
+
+@pytest.mark.cache
+def test_calculate_key_source(monkeypatch):
+    """
+    GIVEN specification
+    WHEN the source of the package changes
+    THEN the key changes.
+    """
+    # pylint: disable=protected-access
+    spec = {"key_1": "value 1"}
+    key_1 = cache.calculate_key(spec=spec)
+
+    monkeypatch.setattr(cache, "_calculate_source_hash", lambda: "other")
+
+    assert cache.calculate_key(spec=spec) != key_1
+
+
+@pytest.mark.cache
+def test_load_missing(tmp_path):
+    """
+    GIVEN empty cache directory
+    WHEN load is called
+    THEN None is returned.
+    """
+    assert cache.load(directory=str(tmp_path), key="key 1") is None
+
+
+@pytest.mark.cache
+def test_store_load(tmp_path):
+    """
+    GIVEN entry
+    WHEN store is called with the entry for a directory that doesn't exist and load is
+        called
+    THEN the entry is returned without any temporary files left in the directory.
+    """
+    directory = str(tmp_path / "cache")
+    entry = _create_entry()
+
+    cache.store(directory=directory, key="key1", entry=entry)
+    returned_entry = cache.load(directory=directory, key="key1")
+
+    assert returned_entry == entry
+    assert os.listdir(directory) == ["key1.pickle"]
+
+
+@pytest.mark.cache
+def test_load_corrupt(tmp_path):
+    """
+    GIVEN cache directory with an entry that is not valid
+    WHEN load is called
+    THEN None is returned.
+    """
+    (tmp_path / "key1.pickle").write_bytes(b"invalid")
+
+    assert cache.load(directory=str(tmp_path), key="key1") is None
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        pytest.param(b"\x80\x09", id="protocol"),
+        pytest.param(b"I1x\n.", id="value"),
+        pytest.param(b"\x80\x02ccollections\nOrderedDict\nK\x01\x85R.", id="construct"),
+        pytest.param(b"\x80\x04\x95", id="truncated"),
+    ],
+)
+@pytest.mark.cache
+def test_load_corrupt_after_header(tmp_path, contents):
+    """
+    GIVEN cache directory with an entry with the header followed by contents that
+        can't be unpickled
+    WHEN load is called
+    THEN None is returned.
+    """
+    # pylint: disable=protected-access
+    (tmp_path / "key1.pickle").write_bytes(cache._HEADER + contents)
+
+    assert cache.load(directory=str(tmp_path), key="key1") is None
+
+
+@pytest.mark.parametrize(
+    "exception",
+    [
+        pytest.param(ValueError, id="ValueError"),
+        pytest.param(TypeError, id="TypeError"),
+        pytest.param(KeyError, id="KeyError"),
+        pytest.param(IndexError, id="IndexError"),
+    ],
+)
+@pytest.mark.cache
+def test_load_unpickle_error(tmp_path, exception):
+    """
+    GIVEN cache directory with an entry and unpickling that raises an exception
+    WHEN load is called
+    THEN None is returned.
+    """
+    directory = str(tmp_path / "cache")
+    cache.store(directory=directory, key="key1", entry=_create_entry())
+
+    with mock.patch.object(pickle, "load", side_effect=exception):
+        assert cache.load(directory=directory, key="key1") is None
+
+
+@pytest.mark.cache
+@pytest.mark.usefixtures("_clean_remote_schemas_store")
+def test_load_remote_changed(tmp_path):
+    """
+    GIVEN entry stored for a remote reference
+    WHEN the remote reference is changed and load is called
+    THEN the entry is only returned before the remote reference changes.
+    """
+    # pylint: disable=protected-access
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text("{}")
+    remote_file = tmp_path / "remote.json"
+    remote_file.write_text(json.dumps({"Schema1": {"type": "integer"}}))
+    cache.helpers.ref.set_context(path=str(spec_file))
+    directory = str(tmp_path / "cache")
+    entry = _create_entry(
+        remote_hashes=cache.calculate_remote_hashes(
+            schemas={"Schema1": {"$ref": "remote.json#/Schema1"}}
+        )
+    )
+    cache.store(directory=directory, key="key1", entry=entry)
+
+    cache.helpers.ref._remote_schema_store.reset()
+    cache.helpers.ref.set_context(path=str(spec_file))
+    assert cache.load(directory=directory, key="key1") == entry
+
+    remote_file.write_text(json.dumps({"Schema1": {"type": "string"}}))
+    cache.helpers.ref._remote_schema_store.reset()
+    cache.helpers.ref.set_context(path=str(spec_file))
+    assert cache.load(directory=directory, key="key1") is None
+
+
+@pytest.mark.cache
+@pytest.mark.usefixtures("_clean_remote_schemas_store")
+def test_calculate_remote_hashes(tmp_path):
+    """
+    GIVEN schemas that reference a remote context that references another context
+        and another remote context that has been loaded
+    WHEN calculate_remote_hashes is called with the schemas
+    THEN only the contexts reachable from the schemas are hashed.
+    """
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text("{}")
+    (tmp_path / "remote1.json").write_text(
+        json.dumps({"Schema1": {"$ref": "remote2.json#/Schema2"}})
+    )
+    (tmp_path / "remote2.json").write_text(json.dumps({"Schema2": {"type": "integer"}}))
+    (tmp_path / "other.json").write_text(json.dumps({"Schema3": {"type": "integer"}}))
+    cache.helpers.ref.set_context(path=str(spec_file))
+    cache.helpers.ref.get_remote_schemas(context="other.json")
+
+    remote_hashes = cache.calculate_remote_hashes(
+        schemas={"Schema": {"$ref": "remote1.json#/Schema1"}}
+    )
+
+    assert sorted(remote_hashes) == ["remote1.json", "remote2.json"]
+
+
+@pytest.mark.cache
+def test_load_no_header(tmp_path):
+    """
+    GIVEN cache directory with a pickle that was not written by the cache
+    WHEN load is called
+    THEN None is returned without unpickling it.
+    """
+    (tmp_path / "key1.pickle").write_bytes(pickle.dumps(_create_entry()))
+
+    with mock.patch.object(pickle, "load") as mock_load:
+        assert cache.load(directory=str(tmp_path), key="key1") is None
+
+    mock_load.assert_not_called()
+
+
+@pytest.mark.cache
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="platform has no user ids")
+@pytest.mark.parametrize("writable", ["directory", "file"])
+def test_load_untrusted(tmp_path, writable):
+    """
+    GIVEN entry in a directory or file that others can write to
+    WHEN load is called
+    THEN None is returned.
+    """
+    directory = tmp_path / "cache"
+    cache.store(directory=str(directory), key="key1", entry=_create_entry())
+    path = directory if writable == "directory" else directory / "key1.pickle"
+    path.chmod(path.stat().st_mode | stat.S_IWOTH)
+
+    assert cache.load(directory=str(directory), key="key1") is None
+
+
+@pytest.mark.cache
+def test_store_evict(tmp_path, monkeypatch):
+    """
+    GIVEN cache with the maximum number of entries
+    WHEN an entry is loaded and another entry is stored
+    THEN the least recently used entry is removed.
+    """
+    monkeypatch.setattr(cache, "MAX_ENTRIES", 2)
+    directory = str(tmp_path)
+    entry = _create_entry()
+    cache.store(directory=directory, key="key1", entry=entry)
+    cache.store(directory=directory, key="key2", entry=entry)
+    os.utime(os.path.join(directory, "key1.pickle"), ns=(0, 0))
+    os.utime(os.path.join(directory, "key2.pickle"), ns=(1, 1))
+    cache.load(directory=directory, key="key1")
+
+    cache.store(directory=directory, key="key3", entry=entry)
+
+    assert sorted(os.listdir(directory)) == ["key1.pickle", "key3.pickle"]
+
+
+@pytest.mark.cache
+def test_load_spec(tmp_path):
+    """
+    GIVEN specification file
+    WHEN load_spec is called multiple times while the modification time and the
+        contents of the file change
+    THEN the file is only parsed if its contents have changed.
+    """
+    directory = str(tmp_path / "cache")
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("key: value 1")
+    parse = mock.MagicMock(side_effect=lambda contents: {"contents": contents})
+
+    spec_1 = cache.load_spec(directory=directory, filename=str(spec_path), parse=parse)
+    spec_2 = cache.load_spec(directory=directory, filename=str(spec_path), parse=parse)
+    os.utime(spec_path, ns=(0, 0))
+    spec_3 = cache.load_spec(directory=directory, filename=str(spec_path), parse=parse)
+    spec_path.write_text("key: value 2")
+    spec_4 = cache.load_spec(directory=directory, filename=str(spec_path), parse=parse)
+
+    assert spec_1 == spec_2 == spec_3 == {"contents": b"key: value 1"}
+    assert spec_4 == {"contents": b"key: value 2"}
+    assert parse.call_count == 2
+
+
+@pytest.mark.cache
+def test_load_spec_corrupt(tmp_path):
+    """
+    GIVEN cache directory with a parsed specification that is not valid
+    WHEN load_spec is called
+    THEN the file is parsed.
+    """
+    spec_path = tmp_path / "spec.yaml"
+    spec_path.write_text("key: value")
+    cache.load_spec(directory=str(tmp_path), filename=str(spec_path), parse=str)
+    (sidecar_name,) = [name for name in os.listdir(tmp_path) if ".spec." in name]
+    (tmp_path / sidecar_name).write_bytes(b"invalid")
+    parse = mock.MagicMock(return_value={"key": "value"})
+
+    spec = cache.load_spec(
+        directory=str(tmp_path), filename=str(spec_path), parse=parse
+    )
+
+    assert spec == {"key": "value"}
+    parse.assert_called_once_with(b"key: value")
+
+
+@pytest.mark.cache
+def test_load_url(tmp_path, document_server):
+    """
+    GIVEN server with a document
+    WHEN load_url is called multiple times while the document changes
+    THEN the cached document is revalidated and only retrieved again if it changed.
+    """
+    document_server.documents["/doc.json"] = b'{"key": "value 1"}'
+    url = document_server.url("/doc.json")
+
+    contents_1 = cache.load_url(directory=str(tmp_path), url=url, timeout=5)
+    contents_2 = cache.load_url(directory=str(tmp_path), url=url, timeout=5)
+    document_server.documents["/doc.json"] = b'{"key": "value 2"}'
+    contents_3 = cache.load_url(directory=str(tmp_path), url=url, timeout=5)
+
+    assert contents_1 == contents_2 == b'{"key": "value 1"}'
+    assert contents_3 == b'{"key": "value 2"}'
+    if_none_match = [
+        headers.get("If-None-Match") for _, headers in document_server.requests
+    ]
+    assert if_none_match[0] is None
+    assert if_none_match[1] is not None
+    assert if_none_match[2] == if_none_match[1]
+
+
+@pytest.mark.cache
+def test_load_url_offline(tmp_path, document_server):
+    """
+    GIVEN document that has been cached
+    WHEN the server can no longer be reached and load_url is called
+    THEN the cached document is returned.
+    """
+    document_server.documents["/doc.json"] = b'{"key": "value"}'
+    url = document_server.url("/doc.json")
+    cache.load_url(directory=str(tmp_path), url=url, timeout=5)
+
+    document_server.stop()
+    contents = cache.load_url(directory=str(tmp_path), url=url, timeout=5)
+
+    assert contents == b'{"key": "value"}'
+
+
+@pytest.mark.cache
+def test_load_url_not_cached(tmp_path, document_server):
+    """
+    GIVEN server that can't be reached or is missing a document that is not cached
+    WHEN load_url is called
+    THEN URLError is raised.
+    """
+    missing_url = document_server.url("/missing.json")
+
+    with pytest.raises(error.HTTPError):
+        cache.load_url(directory=str(tmp_path), url=missing_url, timeout=5)
+
+    document_server.stop()
+    with pytest.raises(error.URLError):
+        cache.load_url(directory=str(tmp_path), url=missing_url, timeout=5)
@@ -0,0 +1,107 @@
+"""Tests for the context of the models of a specification."""
+
+from unittest import mock
+
+import pytest
+
+import open_alchemy
+from open_alchemy import context
+from open_alchemy import facades
+from open_alchemy import helpers
+from open_alchemy import schemas
+
+
+@pytest.mark.init
+def test_activate():
+    """
+    GIVEN context
+    WHEN activate is entered and exited
+    THEN the namespace and remote schema store of the context are only in use while
+        it is entered.
+    """
+    context_ = context.OpenAlchemy(name="models_1")
+
+    with context_.activate() as active_context:
+        assert active_context is context_
+        assert facades.models.get_namespace() is context_.models
+        assert helpers.ref.get_store() is context_.remote_schema_store
+
+    assert context_.models.__name__ == "models_1"
+    assert facades.models.get_namespace() is open_alchemy.models
+    assert helpers.ref.get_store() is not context_.remote_schema_store
+
+
+@pytest.mark.init
+def test_validation_settings():
+    """
+    GIVEN context with validation workers and executor
+    WHEN init_model_factory is called with the context
+    THEN the schemas are validated using the workers and executor of the context.
+    """
+    context_ = context.OpenAlchemy(validation_workers=2, validation_executor="THREAD")
+    spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "type": "object",
+                    "x-tablename": "table",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                }
+            }
+        }
+    }
+
+    with mock.patch.object(
+        schemas.validation, "process", wraps=schemas.validation.process
+    ) as mock_process:
+        open_alchemy.init_model_factory(
+            base=mock.MagicMock, spec=spec, context=context_
+        )
+
+    mock_process.assert_called_once_with(
+        schemas=spec["components"]["schemas"],
+        workers=2,
+        executor=schemas.validation.Executor.THREAD,
+    )
+
+
+@pytest.mark.init
+def test_cache_dir(tmp_path):
+    """
+    GIVEN context with a cache directory
+    WHEN init_model_factory is called with the context
+    THEN the cache directory is used for the remote schemas of the context and the
+        processed schemas are cached in it.
+    """
+    cache_dir = tmp_path / "cache"
+    context_ = context.OpenAlchemy(cache_dir=str(cache_dir))
+    spec = {
+        "components": {
+            "schemas": {
+                "Table": {
+                    "type": "object",
+                    "x-tablename": "table",
+                    "properties": {"id": {"type": "integer", "x-primary-key": True}},
+                }
+            }
+        }
+    }
+
+    open_alchemy.init_model_factory(base=mock.MagicMock, spec=spec, context=context_)
+
+    assert context_.remote_schema_store.cache_dir == str(cache_dir)
+    assert helpers.ref.get_store().cache_dir is None
+    assert list(cache_dir.iterdir())
+
+
+@pytest.mark.init
+def test_json_backend():
+    """
+    GIVEN the name of a JSON backend
+    WHEN the context is constructed with the name
+    THEN the JSON backend of the context is the backend.
+    """
+    context_ = context.OpenAlchemy(json_backend="json")
+
+    assert context_.json_backend == facades.json.Backend.JSON
+    assert context.OpenAlchemy().json_backend is None
@@ -0,0 +1,44 @@
+"""Tests for importing open_alchemy."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Modules only needed to build packages, generate the models file, validate
+# dictionaries or load remote references which are imported on first use
+DEFERRED_MODULES = [
+    "jinja2",
+    "jsonschema",
+    "urllib.request",
+    "open_alchemy.models_file",
+]
+
+
+def _imported_modules():
+    """Calculate the modules imported by importing open_alchemy in a new interpreter."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys; import open_alchemy; print(json.dumps(list(sys.modules)))",
+        ],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout))
+
+
+@pytest.mark.init
+def test_import_deferred_modules():
+    """
+    GIVEN new interpreter
+    WHEN open_alchemy is imported
+    THEN the deferred modules are not imported.
+    """
+    modules = _imported_modules()
+
+    assert "open_alchemy" in modules
+    assert [name for name in DEFERRED_MODULES if name in modules] == []
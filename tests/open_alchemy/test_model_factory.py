@@ -10,7 +10,9 @@ import pytest
 from sqlalchemy import schema as sql_schema
 
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import model_factory
+from open_alchemy import utility_base
 from open_alchemy.facades import sqlalchemy
 from open_alchemy.schemas import artifacts as schemas_artifacts
 
@@ -795,3 +797,98 @@ class TestPrepareModelDict:
         returned_dict = model_factory._prepare_model_dict(schema=schema)
 
         assert expected_dict == returned_dict
+
+
+@pytest.mark.parametrize(
+    "json_schema_draft",
+    [
+        pytest.param(None, id="default"),
+        pytest.param(facades.jsonschema.Draft.DRAFT4, id="draft 4"),
+    ],
+)
+@pytest.mark.model
+def test_validator(json_schema_draft):
+    """
+    GIVEN schemas and JSON schema draft
+    WHEN model_factory is called with the schemas and the draft
+    THEN a model with a validator for the model schema and draft is returned.
+    """
+    schemas = {
+        "Schema": {
+            "x-tablename": "table 1",
+            "type": "object",
+            "properties": {"property_1": {"type": "integer"}},
+        }
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+
+    model = model_factory.model_factory(
+        name="Schema",
+        get_base=_mock_get_base,
+        schemas=schemas,
+        artifacts=artifacts,
+        json_schema_draft=json_schema_draft,
+    )
+
+    assert model._validator.schema is model._schema
+    assert model._validator.draft == json_schema_draft
+
+
+@pytest.mark.model
+def test_validation_level():
+    """
+    GIVEN schemas and validation level
+    WHEN model_factory is called with the schemas and the level as a string
+    THEN a model with the validation level is returned.
+    """
+    schemas = {
+        "Schema": {
+            "x-tablename": "table 1",
+            "type": "object",
+            "properties": {"property_1": {"type": "integer"}},
+        }
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+
+    model = model_factory.model_factory(
+        name="Schema",
+        get_base=_mock_get_base,
+        schemas=schemas,
+        artifacts=artifacts,
+        validation_level="trusted",
+    )
+
+    assert model._validation_level == utility_base.validation.Level.TRUSTED
+
+
+@pytest.mark.model
+def test_json_backend():
+    """
+    GIVEN schemas and JSON backend
+    WHEN model_factory is called with the schemas and the backend as a string
+    THEN a model with the JSON backend is returned.
+    """
+    schemas = {
+        "Schema": {
+            "x-tablename": "table 1",
+            "type": "object",
+            "properties": {"property_1": {"type": "integer"}},
+        }
+    }
+    artifacts = schemas_artifacts.get_from_schemas(
+        schemas=schemas, stay_within_model=True
+    )
+
+    model = model_factory.model_factory(
+        name="Schema",
+        get_base=_mock_get_base,
+        schemas=schemas,
+        artifacts=artifacts,
+        json_backend="json",
+    )
+
+    assert model._json_backend == facades.json.Backend.JSON
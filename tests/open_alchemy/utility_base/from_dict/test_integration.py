@@ -1,6 +1,7 @@
 """Integration tests for dictionary to model conversion."""
 
 import copy
+import datetime
 from unittest import mock
 
 import pytest
@@ -98,3 +99,45 @@ def test_convert_array(mocked_facades_models):
         mocked_facades_models.get_model.return_value.from_dict.return_value
     ]
     assert returned_value == expected_value
+
+
+@pytest.mark.utility_base
+def test_compile_plan():
+    """
+    GIVEN properties with valid and invalid schemas
+    WHEN compile_plan is called with the properties
+    THEN a plan is returned that converts valid values and raises for the invalid
+        schema only when a value for it is converted.
+    """
+    properties = {
+        "key_1": {"type": "string", "format": "date"},
+        "key_2": {"type": "unsupported"},
+    }
+
+    plan = utility_base.from_dict.compile_plan(properties=properties)
+
+    assert plan["key_1"]("2000-01-01") == datetime.date(2000, 1, 1)
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        plan["key_2"]("value 1")
+
+
+@pytest.mark.utility_base
+def test_compile_object_model_reused(mocked_facades_models):
+    """
+    GIVEN schema for object property
+    WHEN compile_ is called with the resolved schema and the result is called multiple
+        times
+    THEN the referenced model is only retrieved once.
+    """
+    schema = {"type": "object", "x-de-$ref": "RefModel"}
+
+    convert = utility_base.from_dict.compile_(
+        property_=utility_base.resolved.resolve(schema=schema)
+    )
+    convert({"key": "value 1"})
+    convert({"key": "value 2"})
+
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="RefModel",
+        namespace=mocked_facades_models.get_namespace.return_value,
+    )
@@ -1,5 +1,7 @@
 """Tests for object conversion."""
 
+import types
+
 import pytest
 
 from open_alchemy import exceptions
@@ -53,9 +55,34 @@ def test_convert_valid(mocked_facades_models):
 
     returned_value = utility_base.from_dict.object_.convert(value, schema=schema)
 
-    mocked_facades_models.get_model.assert_called_once_with(name="RefModel")
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="RefModel",
+        namespace=mocked_facades_models.get_namespace.return_value,
+    )
     mocked_facades_models.get_model.return_value.from_dict.assert_called_once_with(
         **{"key": "value"}
     )
     expected_value = mocked_facades_models.get_model.return_value.from_dict.return_value
     assert returned_value == expected_value
+
+
+@pytest.mark.utility_base
+def test_compile_namespace(mocked_facades_models):
+    """
+    GIVEN mocked models facade, resolved property and namespace
+    WHEN compile_ is called with the property and namespace and the returned function
+        is called
+    THEN the referenced model is retrieved from the namespace instead of the namespace
+        of the current context.
+    """
+    property_ = utility_base.resolved.resolve(schema={"x-de-$ref": "RefModel"})
+    namespace = types.ModuleType("models")
+
+    convert = utility_base.from_dict.object_.compile_(
+        property_=property_, namespace=namespace
+    )
+    convert({"key": "value"})
+
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="RefModel", namespace=namespace
+    )
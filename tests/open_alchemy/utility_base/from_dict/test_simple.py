@@ -150,3 +150,36 @@ def test_convert(schema, value, expected_value):
     returned_value = utility_base.from_dict.simple.convert(schema=schema, value=value)
 
     assert returned_value == expected_value
+
+
+@pytest.mark.parametrize(
+    "schema, value, expected_value",
+    [
+        pytest.param({"type": "integer"}, "1", "1", id="integer"),
+        pytest.param({"type": "number"}, 1, 1, id="number"),
+        pytest.param({"type": "string"}, 1, 1, id="string"),
+        pytest.param({"type": "boolean"}, 1, 1, id="boolean"),
+        pytest.param(
+            {"type": "string", "format": "date"},
+            "2000-01-01",
+            datetime.date(year=2000, month=1, day=1),
+            id="string date",
+        ),
+        pytest.param({"type": "string", "format": "binary"}, "a", b"a", id="binary"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compile_no_check_types(schema, value, expected_value):
+    """
+    GIVEN schema and value
+    WHEN compile_ is called with the schema and check_types not set and the function
+        is called with the value
+    THEN the value is converted without checking its type.
+    """
+    property_ = utility_base.resolved.resolve(schema=schema)
+
+    convert = utility_base.from_dict.simple.compile_(
+        property_=property_, check_types=False
+    )
+
+    assert convert(value) == expected_value
@@ -0,0 +1,65 @@
+"""Tests for batch conversion."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import utility_base
+
+
+def _convert(value):
+    """Convert a value, raising for negative values."""
+    if value < 0:
+        raise exceptions.InvalidInstanceError("negative")
+    return value * 2
+
+
+@pytest.mark.utility_base
+def test_iterate():
+    """
+    GIVEN valid values
+    WHEN iterate is called with the values
+    THEN the converted values are returned.
+    """
+    returned_values = utility_base.batch.iterate(_convert, [1, 2, 3])
+
+    assert list(returned_values) == [2, 4, 6]
+
+
+@pytest.mark.utility_base
+def test_iterate_fail_fast():
+    """
+    GIVEN values where some are not valid
+    WHEN iterate is called with the values
+    THEN the error of the first invalid value is raised with its index.
+    """
+    returned_values = utility_base.batch.iterate(_convert, [1, -1, -2])
+
+    assert next(returned_values) == 2
+    with pytest.raises(exceptions.InvalidInstanceError) as exc_info:
+        next(returned_values)
+
+    assert exc_info.value.index == 1
+
+
+@pytest.mark.utility_base
+def test_iterate_collect_errors():
+    """
+    GIVEN values where some are not valid
+    WHEN iterate is called with the values and collect_errors set
+    THEN the valid values are returned and BatchError is raised with all errors.
+    """
+    returned_values = utility_base.batch.iterate(
+        _convert, [1, -1, 2, -2], collect_errors=True
+    )
+
+    converted_values = []
+    with pytest.raises(exceptions.BatchError) as exc_info:
+        for value in returned_values:
+            converted_values.append(value)
+
+    assert converted_values == [2, 4]
+    assert list(exc_info.value.errors.keys()) == [1, 3]
+    assert all(
+        isinstance(error, exceptions.InvalidInstanceError)
+        for error in exc_info.value.errors.values()
+    )
@@ -0,0 +1,83 @@
+"""Tests for inserting rows from dictionaries in bulk."""
+
+from unittest import mock
+
+import pytest
+import sqlalchemy
+
+from open_alchemy import exceptions
+from open_alchemy.utility_base import bulk
+
+TABLE = sqlalchemy.Table(
+    "table",
+    sqlalchemy.MetaData(),
+    sqlalchemy.Column("key_1", sqlalchemy.Integer),
+    sqlalchemy.Column("key_2", sqlalchemy.Integer),
+)
+
+
+@pytest.mark.parametrize(
+    "rows, batch_size, expected_batches",
+    [
+        pytest.param([], 2, [], id="empty"),
+        pytest.param([{"key_1": 1}], 2, [[{"key_1": 1}]], id="single"),
+        pytest.param(
+            [{"key_1": 1}, {"key_1": 2}, {"key_1": 3}],
+            2,
+            [[{"key_1": 1}, {"key_1": 2}], [{"key_1": 3}]],
+            id="batch size",
+        ),
+        pytest.param(
+            [{"key_1": 1}, {"key_1": 2, "key_2": 3}, {"key_2": 4, "key_1": 5}],
+            5,
+            [[{"key_1": 1}], [{"key_1": 2, "key_2": 3}, {"key_2": 4, "key_1": 5}]],
+            id="different columns",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_insert(rows, batch_size, expected_batches):
+    """
+    GIVEN rows and batch size
+    WHEN insert is called with the rows
+    THEN consecutive rows with the same columns are inserted in batches.
+    """
+    bind = mock.MagicMock()
+    batches = []
+    bind.execute.side_effect = lambda _, batch: batches.append(list(batch))
+
+    count = bulk.insert(bind=bind, table=TABLE, rows=rows, batch_size=batch_size)
+
+    assert count == len(rows)
+    assert batches == expected_batches
+
+
+@pytest.mark.utility_base
+def test_insert_batch_error():
+    """
+    GIVEN rows that raise BatchError after they have been consumed
+    WHEN insert is called with the rows
+    THEN the pending rows are inserted before BatchError is raised.
+    """
+    bind = mock.MagicMock()
+
+    def rows():
+        """Yield a row and raise BatchError."""
+        yield {"key_1": 1}
+        raise exceptions.BatchError("message", errors={})
+
+    with pytest.raises(exceptions.BatchError):
+        bulk.insert(bind=bind, table=TABLE, rows=rows(), batch_size=2)
+
+    bind.execute.assert_called_once()
+
+
+@pytest.mark.utility_base
+def test_insert_batch_size_invalid():
+    """
+    GIVEN batch size less than 1
+    WHEN insert is called with the batch size
+    THEN ValueError is raised.
+    """
+    with pytest.raises(ValueError):
+        bulk.insert(bind=mock.MagicMock(), table=TABLE, rows=[], batch_size=0)
@@ -1,10 +1,13 @@
 """Tests for UtilityBase."""
 
 import datetime
+import types
+from unittest import mock
 
 import pytest
 
 from open_alchemy import exceptions
+from open_alchemy import facades
 from open_alchemy import utility_base
 
 
@@ -240,7 +243,9 @@ def test_from_dict_inheritance_call(mocked_facades_models, __init__):
 
     model.from_dict(**{"key": "value", "parent_key": "parent value"})
 
-    mocked_facades_models.get_model.assert_called_once_with(name="Parent")
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="Parent", namespace=None
+    )
     check_func = mocked_facades_models.get_model.return_value.construct_from_dict_init
     check_func.assert_called_once_with(**{"parent_key": "parent value"})
 
@@ -269,7 +274,9 @@ def test_from_dict_inheritance_return(mocked_facades_models, __init__):
 
     instance = model.from_dict(**{"key": "value", "parent_key": "parent value"})
 
-    mocked_facades_models.get_model.assert_called_once_with(name="Parent")
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="Parent", namespace=None
+    )
     assert instance.key == "value"  # pylint: disable=no-member
     assert instance.parent_key == "parent value"  # pylint: disable=no-member
 
@@ -318,3 +325,316 @@ def test_from_str(__init__):
     instance = model.from_str('{"key_1": 1}')
 
     assert getattr(instance, "key_1") == 1
+
+
+@pytest.mark.utility_base
+def test_from_dict_validator_compiled_once(__init__):
+    """
+    GIVEN class that derives from UtilityBase and schema and child class of it
+    WHEN from_dict is called multiple times
+    THEN the validator is compiled once for each class from its own schema.
+    """
+    # pylint: disable=protected-access
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    child = type(
+        "child", (model,), {"_schema": {"properties": {"key": {"type": "string"}}}}
+    )
+
+    model.from_dict(key=1)
+    validator = model._validator
+    model.from_dict(key=2)
+    child.from_dict(key="value")
+
+    assert model._validator is validator
+    assert child._validator is not validator
+    assert child._validator.schema is child._schema
+
+
+@pytest.mark.utility_base
+def test_from_dicts(__init__):
+    """
+    GIVEN class that derives from UtilityBase and dictionaries
+    WHEN from_dicts and iter_from_dicts are called with the dictionaries
+    THEN an instance is returned for each dictionary.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+    dictionaries = [{"key": 1}, {"key": 2}]
+
+    instances = model.from_dicts(dictionaries)
+    lazy_instances = model.iter_from_dicts(iter(dictionaries))
+
+    assert [instance.key for instance in instances] == [1, 2]
+    assert [instance.key for instance in lazy_instances] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "dictionaries, expected_index",
+    [
+        pytest.param([{"key": "1"}], 0, id="first invalid"),
+        pytest.param([{"key": 1}, {"key": "2"}, {"key": "3"}], 1, id="second invalid"),
+        pytest.param([{"key": 1}, "key"], 1, id="not dictionary"),
+    ],
+)
+@pytest.mark.utility_base
+def test_from_dicts_invalid(__init__, dictionaries, expected_index):
+    """
+    GIVEN class that derives from UtilityBase and dictionaries with invalid ones
+    WHEN from_dicts is called with the dictionaries
+    THEN MalformedModelDictionaryError is raised with the index of the first invalid
+        dictionary.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError) as exc_info:
+        model.from_dicts(dictionaries)
+
+    assert exc_info.value.index == expected_index
+
+
+@pytest.mark.utility_base
+def test_from_dicts_collect_errors(__init__):
+    """
+    GIVEN class that derives from UtilityBase and dictionaries with invalid ones
+    WHEN from_dicts is called with the dictionaries and collect_errors set
+    THEN BatchError is raised with the errors of all invalid dictionaries.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+
+    with pytest.raises(exceptions.BatchError) as exc_info:
+        model.from_dicts([{"key": "1"}, {"key": 2}, {"key": "3"}], collect_errors=True)
+
+    assert list(exc_info.value.errors.keys()) == [0, 2]
+
+
+@pytest.mark.utility_base
+def test_from_dicts_inheritance(mocked_facades_models, __init__):
+    """
+    GIVEN class that derives from UtilityBase that inherits and dictionaries
+    WHEN from_dicts is called with the dictionaries
+    THEN the parent is retrieved once and instances are constructed.
+    """
+    parent = mocked_facades_models.get_model.return_value
+    parent.construct_from_dict_init.return_value = {}
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {"key": {"type": "integer"}},
+                "x-inherits": "Parent",
+            },
+            "__init__": __init__,
+        },
+    )
+
+    instances = model.from_dicts([{"key": 1}, {"key": 2}])
+
+    assert [instance.key for instance in instances] == [1, 2]
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="Parent", namespace=None
+    )
+
+
+@pytest.mark.parametrize(
+    "level, dictionary, expected_exception",
+    [
+        pytest.param(
+            utility_base.validation.Level.FULL,
+            {"key": 1},
+            exceptions.MalformedModelDictionaryError,
+            id="full schema invalid",
+        ),
+        pytest.param(
+            utility_base.validation.Level.TYPES,
+            {"key": 1},
+            None,
+            id="types schema invalid",
+        ),
+        pytest.param(
+            utility_base.validation.Level.TYPES,
+            {"key": "1"},
+            exceptions.InvalidInstanceError,
+            id="types type invalid",
+        ),
+        pytest.param(
+            utility_base.validation.Level.TRUSTED,
+            {"key": "1"},
+            None,
+            id="trusted type invalid",
+        ),
+        pytest.param(
+            utility_base.validation.Level.TRUSTED,
+            {"other": 1},
+            exceptions.MalformedModelDictionaryError,
+            id="trusted not in properties",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_from_dict_validation_level(__init__, level, dictionary, expected_exception):
+    """
+    GIVEN class that derives from UtilityBase with a validation level and dictionary
+    WHEN from_dict is called with the dictionary
+    THEN the dictionary is validated based on the level.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer", "minimum": 2}}},
+            "_validation_level": level,
+            "__init__": __init__,
+        },
+    )
+
+    if expected_exception is not None:
+        with pytest.raises(expected_exception):
+            model.from_dict(**dictionary)
+        return
+
+    instance = model.from_dict(**dictionary)
+
+    assert instance.key == dictionary["key"]
+
+
+@pytest.mark.utility_base
+def test_from_dict_validation_level_override(mocked_facades_models, __init__):
+    """
+    GIVEN class that derives from UtilityBase with an object property
+    WHEN from_dict is called with an invalid dictionary with the level overridden
+    THEN the level is used for the model and the referenced model.
+    """
+    ref_model = type(
+        "RefModel",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"properties": {"key": {"type": "integer"}}},
+            "__init__": __init__,
+        },
+    )
+    mocked_facades_models.get_model.return_value = ref_model
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key": {"type": "integer", "minimum": 2},
+                    "ref": {"type": "object", "x-de-$ref": "RefModel"},
+                }
+            },
+            "__init__": __init__,
+        },
+    )
+    dictionary = {"key": 1, "ref": {"key": "1"}}
+
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dict(**dictionary)
+    with utility_base.validation.use_level(utility_base.validation.Level.TYPES):
+        with pytest.raises(exceptions.InvalidInstanceError):
+            model.from_dict(**dictionary)
+    with utility_base.validation.use_level(utility_base.validation.Level.TRUSTED):
+        instance = model.from_dict(**dictionary)
+
+    assert instance.key == 1
+    assert instance.ref.key == "1"
+
+
+@pytest.mark.utility_base
+def test_from_dicts_validation_level(__init__):
+    """
+    GIVEN class that derives from UtilityBase and dictionaries that are not valid
+    WHEN from_dicts and iter_from_dicts are called with the dictionaries and the
+        trusted level
+    THEN an instance is returned for each dictionary.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+    dictionaries = [{"key": "1"}, {"key": "2"}]
+
+    instances = model.from_dicts(
+        dictionaries, validation_level=utility_base.validation.Level.TRUSTED
+    )
+    lazy_instances = model.iter_from_dicts(
+        iter(dictionaries), validation_level=utility_base.validation.Level.TRUSTED
+    )
+
+    assert [instance.key for instance in instances] == ["1", "2"]
+    assert [instance.key for instance in lazy_instances] == ["1", "2"]
+    with pytest.raises(exceptions.MalformedModelDictionaryError):
+        model.from_dicts(dictionaries)
+
+
+@pytest.mark.utility_base
+def test_from_dict_nested_single_pass(__init__):
+    """
+    GIVEN model with an array property of another model whose validator is mocked
+    WHEN from_dict is called with valid and invalid nested dictionaries
+    THEN the nested dictionaries are validated with the dictionary and not again when
+        the nested models are constructed and the error has the path to the value that
+        is not valid and the nested model.
+    """
+    namespace = types.ModuleType("models")
+    namespace.RefModel = type(
+        "RefModel",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "type": "object",
+                "properties": {"key": {"type": "integer", "minimum": 1}},
+            },
+            "_validator": mock.MagicMock(),
+            "_models": namespace,
+            "__init__": __init__,
+        },
+    )
+    model = type(
+        "Model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "type": "object",
+                "properties": {
+                    "refs": {
+                        "type": "array",
+                        "items": {"type": "object", "x-de-$ref": "RefModel"},
+                    }
+                },
+            },
+            "_models": namespace,
+            "__init__": __init__,
+        },
+    )
+
+    with facades.models.use_namespace(namespace):
+        instance = model.from_dict(refs=[{"key": 1}, {"key": 2}])
+        with pytest.raises(exceptions.MalformedModelDictionaryError) as exc_info:
+            model.from_dict(refs=[{"key": 1}, {"key": 0}])
+
+    assert [ref.key for ref in instance.refs] == [1, 2]
+    assert exc_info.value.path == ["refs", 1, "key"]
+    assert exc_info.value.model is namespace.RefModel
+    assert exc_info.value.schema is namespace.RefModel._schema
+    namespace.RefModel._validator.validate.assert_not_called()
@@ -0,0 +1,107 @@
+"""Tests for the properties resolved for the utilities."""
+
+import pytest
+
+from open_alchemy import exceptions
+from open_alchemy import utility_base
+
+
+@pytest.mark.utility_base
+def test_resolve():
+    """
+    GIVEN property schema with all the values used by the utilities
+    WHEN resolve is called with the schema
+    THEN the values are exposed as attributes.
+    """
+    items_schema = {"type": "object", "x-de-$ref": "RefModel"}
+    schema = {
+        "type": "array",
+        "format": "format 1",
+        "nullable": True,
+        "readOnly": False,
+        "writeOnly": False,
+        "x-json": False,
+        "items": items_schema,
+    }
+
+    property_ = utility_base.resolved.resolve(schema=schema)
+
+    assert property_.schema is schema
+    assert property_.type == "array"
+    assert property_.format == "format 1"
+    assert property_.nullable is True
+    assert property_.read_only is False
+    assert property_.write_only is False
+    assert property_.json is False
+    assert property_.de_ref is None
+    assert property_.items.schema is items_schema
+    assert property_.items.type == "object"
+    assert property_.items.de_ref == "RefModel"
+    assert property_.items.items is None
+    assert not hasattr(property_, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "schema, expected_exception",
+    [
+        pytest.param({"type": True}, exceptions.TypeMissingError, id="type"),
+        pytest.param(
+            {"type": "string", "nullable": "True"},
+            exceptions.MalformedSchemaError,
+            id="nullable",
+        ),
+        pytest.param(
+            {"type": "array", "items": True},
+            exceptions.MalformedSchemaError,
+            id="items",
+        ),
+        pytest.param(
+            {"type": "array", "items": {"type": True}},
+            exceptions.TypeMissingError,
+            id="items type",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_resolve_invalid(schema, expected_exception):
+    """
+    GIVEN malformed property schema
+    WHEN resolve is called with the schema
+    THEN the expected exception is raised.
+    """
+    with pytest.raises(expected_exception):
+        utility_base.resolved.resolve(schema=schema)
+
+
+@pytest.mark.utility_base
+def test_type_missing():
+    """
+    GIVEN property schema without a type
+    WHEN resolve is called with the schema and the type is retrieved
+    THEN the type is None and TypeMissingError is raised when it is required.
+    """
+    property_ = utility_base.resolved.resolve(schema={"readOnly": True})
+
+    assert property_.type is None
+    with pytest.raises(exceptions.TypeMissingError):
+        utility_base.resolved.type_(property_=property_)
+
+
+@pytest.mark.utility_base
+def test_resolve_properties():
+    """
+    GIVEN properties with valid and malformed schemas
+    WHEN resolve_properties is called with the properties
+    THEN only the valid properties are resolved.
+    """
+    properties = {
+        "key_1": {"type": "integer"},
+        "key_2": {"type": "integer", "readOnly": "True"},
+    }
+
+    resolved_properties = utility_base.resolved.resolve_properties(
+        properties=properties
+    )
+
+    assert list(resolved_properties.keys()) == ["key_1"]
+    assert resolved_properties["key_1"].type == "integer"
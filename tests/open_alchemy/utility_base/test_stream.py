@@ -0,0 +1,81 @@
+"""Tests for stream."""
+
+import io
+import json
+
+import pytest
+
+from open_alchemy import utility_base
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param([], id="empty"),
+        pytest.param([{"key": 1}], id="single"),
+        pytest.param([{"key": 1}, {"key": 2}, {"key": 3}], id="multiple"),
+    ],
+)
+@pytest.mark.utility_base
+def test_iterate(values):
+    """
+    GIVEN values
+    WHEN iterate is called with the values
+    THEN the joined chunks are the same as the JSON string of the values.
+    """
+    returned_chunks = utility_base.stream.iterate(iter(values))
+
+    assert "".join(returned_chunks) == json.dumps(values)
+
+
+@pytest.mark.utility_base
+def test_iterate_ndjson():
+    """
+    GIVEN values
+    WHEN iterate is called with the values and ndjson set
+    THEN a line with the JSON string is returned for each value.
+    """
+    values = [{"key": 1}, {"key": 2}]
+
+    returned_chunks = utility_base.stream.iterate(values, ndjson=True)
+
+    assert list(returned_chunks) == ['{"key": 1}\n', '{"key": 2}\n']
+
+
+@pytest.mark.utility_base
+def test_iterate_lazy():
+    """
+    GIVEN generator of values
+    WHEN iterate is called with the values
+    THEN values are only consumed as the chunks are consumed.
+    """
+    consumed = []
+
+    def values():
+        """Generate values recording which were consumed."""
+        for idx in range(3):
+            consumed.append(idx)
+            yield {"key": idx}
+
+    returned_chunks = utility_base.stream.iterate(values())
+    next(returned_chunks)
+
+    assert consumed == [0]
+
+
+@pytest.mark.parametrize("ndjson", [False, True])
+@pytest.mark.utility_base
+def test_write(ndjson):
+    """
+    GIVEN values and file
+    WHEN write is called with the values and file
+    THEN the chunks are written to the file.
+    """
+    values = [{"key": 1}, {"key": 2}]
+    file = io.StringIO()
+
+    utility_base.stream.write(values, file, ndjson=ndjson)
+
+    assert file.getvalue() == "".join(
+        utility_base.stream.iterate(values, ndjson=ndjson)
+    )
@@ -1,5 +1,6 @@
 """Tests for UtilityBase."""
 
+import io
 from unittest import mock
 
 import pytest
@@ -165,7 +166,9 @@ def test_to_dict_inheritance_call(mocked_facades_models, __init__):
     returned_dict = instance.to_dict()
 
     assert returned_dict == {"key": "value", "parent_key": "parent value"}
-    mocked_facades_models.get_model.assert_called_once_with(name="Parent")
+    mocked_facades_models.get_model.assert_called_once_with(
+        name="Parent", namespace=None
+    )
     check_func = mocked_facades_models.get_model.return_value.instance_to_dict
     check_func.assert_called_once_with(instance)
 
@@ -192,3 +195,184 @@ def test_to_str(__init__):
     assert returned_str == '{"key_1": 1}'
     assert str(instance) == '{"key_1": 1}'
     assert repr(instance) == "open_alchemy.models.Model(key_1=1)"
+
+
+@pytest.mark.utility_base
+def test_to_dicts(__init__):
+    """
+    GIVEN class that derives from UtilityBase and instances
+    WHEN to_dicts and iter_to_dicts are called with the instances
+    THEN a dictionary is returned for each instance.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+    instances = [model(key=1), model(key=2)]
+
+    dictionaries = model.to_dicts(instances)
+    lazy_dictionaries = model.iter_to_dicts(iter(instances))
+
+    assert dictionaries == [{"key": 1}, {"key": 2}]
+    assert list(lazy_dictionaries) == [{"key": 1}, {"key": 2}]
+
+
+class _Instance:
+    """Instance whose value for the property that raises can't be accessed."""
+
+    def __init__(self, **kwargs):
+        """Construct."""
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    @property
+    def raises(self):
+        """Fail for any access."""
+        raise AssertionError("raises should not have been accessed")
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_value",
+    [
+        pytest.param(
+            {"include": ["key_1", "ref.key_1"]},
+            {"key_1": 1, "ref": {"key_1": 3}},
+            id="include",
+        ),
+        pytest.param(
+            {"include": ["ref"], "exclude": ["ref.raises"]},
+            {"ref": {"key_1": 3, "key_2": 4}},
+            id="include relationship exclude nested",
+        ),
+        pytest.param(
+            {"exclude": ["raises", "ref.raises", "ref.key_2", "refs.raises"]},
+            {"key_1": 1, "key_2": 2, "ref": {"key_1": 3}, "refs": [{"key_1": 5}]},
+            id="exclude",
+        ),
+        pytest.param(
+            {"exclude": ["raises"], "max_depth": 0},
+            {"key_1": 1, "key_2": 2},
+            id="max_depth",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_to_dict_selection(kwargs, expected_value):
+    """
+    GIVEN models with a relationship and instances with a property that can't be
+        accessed
+    WHEN to_dict is called with include, exclude and max_depth that exclude the
+        property
+    THEN the selected properties are returned without accessing the property.
+    """
+    properties = {
+        "key_1": {"type": "integer"},
+        "key_2": {"type": "integer"},
+        "raises": {"type": "integer"},
+    }
+    ref_model = type(
+        "RefModel",
+        (_Instance, utility_base.UtilityBase),
+        {"_schema": {"properties": properties}},
+    )
+    model = type(
+        "Model",
+        (_Instance, utility_base.UtilityBase),
+        {
+            "_schema": {
+                "properties": {
+                    **properties,
+                    "ref": {"type": "object", "x-de-$ref": "RefModel"},
+                    "refs": {
+                        "type": "array",
+                        "items": {"type": "object", "x-de-$ref": "RefModel"},
+                    },
+                }
+            }
+        },
+    )
+    instance = model(
+        key_1=1,
+        key_2=2,
+        ref=ref_model(key_1=3, key_2=4),
+        refs=[ref_model(key_1=5)],
+    )
+
+    returned_value = instance.to_dict(**kwargs)
+
+    assert returned_value == expected_value
+
+
+@pytest.mark.utility_base
+def test_to_dicts_selection(__init__):
+    """
+    GIVEN class that derives from UtilityBase and instances
+    WHEN to_dicts and iter_to_dicts are called with the instances and include
+    THEN a dictionary with the included properties is returned for each instance.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {
+                "properties": {
+                    "key_1": {"type": "integer"},
+                    "key_2": {"type": "integer"},
+                }
+            },
+            "__init__": __init__,
+        },
+    )
+    instances = [model(key_1=1, key_2=2), model(key_1=3)]
+
+    dictionaries = model.to_dicts(instances, include=["key_1"])
+    lazy_dictionaries = model.iter_to_dicts(iter(instances), exclude=["key_1"])
+
+    assert dictionaries == [{"key_1": 1}, {"key_1": 3}]
+    assert list(lazy_dictionaries) == [{"key_2": 2}, {}]
+
+
+@pytest.mark.utility_base
+def test_to_dicts_invalid(__init__):
+    """
+    GIVEN class that derives from UtilityBase and instances with invalid values
+    WHEN to_dicts is called with the instances with and without collect_errors
+    THEN the error is raised with the index or BatchError is raised with all errors.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+    instances = [model(key=1), model(key="2"), model(key="3")]
+
+    with pytest.raises(exceptions.InvalidInstanceError) as exc_info:
+        model.to_dicts(instances)
+    assert exc_info.value.index == 1
+
+    with pytest.raises(exceptions.BatchError) as batch_exc_info:
+        model.to_dicts(instances, collect_errors=True)
+    assert list(batch_exc_info.value.errors.keys()) == [1, 2]
+
+
+@pytest.mark.utility_base
+def test_iter_str_dump_str(__init__):
+    """
+    GIVEN class that derives from UtilityBase and instances
+    WHEN iter_str and dump_str are called with the instances
+    THEN the JSON array of the instances is returned and written.
+    """
+    model = type(
+        "model",
+        (utility_base.UtilityBase,),
+        {"_schema": {"properties": {"key": {"type": "integer"}}}, "__init__": __init__},
+    )
+    instances = [model(key=1), model(key=2)]
+    file = io.StringIO()
+
+    returned_chunks = model.iter_str(iter(instances))
+    model.dump_str(instances, file, ndjson=True)
+
+    assert "".join(returned_chunks) == '[{"key": 1}, {"key": 2}]'
+    assert file.getvalue() == '{"key": 1}\n{"key": 2}\n'
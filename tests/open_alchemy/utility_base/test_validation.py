@@ -0,0 +1,202 @@
+"""Tests for the level of validation of the dictionaries passed to from_dict."""
+
+import types
+
+import pytest
+
+from open_alchemy import utility_base
+from open_alchemy.utility_base import validation
+
+
+@pytest.mark.utility_base
+def test_use_level():
+    """
+    GIVEN no level for the current context
+    WHEN use_level is called with a level, including as a string
+    THEN the level is used in the block and reset after it.
+    """
+    assert validation.get_level() is None
+
+    with validation.use_level(validation.Level.TYPES):
+        assert validation.get_level() == validation.Level.TYPES
+        with validation.use_level("trusted"):
+            assert validation.get_level() == validation.Level.TRUSTED
+        assert validation.get_level() == validation.Level.TYPES
+
+    assert validation.get_level() is None
+
+
+def _define_model(namespace, name, properties, **schema):
+    """Define a model with the properties on the namespace."""
+    model = type(
+        name,
+        (utility_base.UtilityBase,),
+        {
+            "_schema": {"type": "object", "properties": properties, **schema},
+            "_models": namespace,
+        },
+    )
+    setattr(namespace, name, model)
+    return model
+
+
+@pytest.mark.utility_base
+def test_compose():
+    """
+    GIVEN model with object and array properties that reference another model
+    WHEN compose is called with the model
+    THEN the schema of the other model is merged into the properties and the other
+        model is returned.
+    """
+    namespace = types.ModuleType("models")
+    ref_model = _define_model(
+        namespace, "RefModel", {"key": {"type": "integer"}}, required=["key"]
+    )
+    model = _define_model(
+        namespace,
+        "Model",
+        {
+            "ref": {"type": "object", "x-de-$ref": "RefModel", "nullable": True},
+            "refs": {
+                "type": "array",
+                "items": {"type": "object", "x-de-$ref": "RefModel"},
+            },
+        },
+    )
+
+    schema, models = validation.compose(model=model)
+
+    assert schema == {
+        "type": "object",
+        "properties": {
+            "ref": {
+                "type": "object",
+                "x-de-$ref": "RefModel",
+                "nullable": True,
+                "properties": {"key": {"type": "integer"}},
+                "required": ["key"],
+            },
+            "refs": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "x-de-$ref": "RefModel",
+                    "properties": {"key": {"type": "integer"}},
+                    "required": ["key"],
+                },
+            },
+        },
+    }
+    assert models == frozenset({ref_model})
+
+
+@pytest.mark.utility_base
+def test_compose_self_reference():
+    """
+    GIVEN model with a property that references the model
+    WHEN compose is called with the model
+    THEN the composed schema is merged into the property and the nested property
+        references the definition of the composed schema.
+    """
+    namespace = types.ModuleType("models")
+    model = _define_model(
+        namespace,
+        "Model",
+        {"parent": {"type": "object", "x-de-$ref": "Model", "readOnly": False}},
+    )
+
+    schema, models = validation.compose(model=model)
+
+    parent_schema = {"type": "object", "x-de-$ref": "Model", "readOnly": False}
+    definition = {
+        "type": "object",
+        "properties": {
+            "parent": {"allOf": [parent_schema, {"$ref": "#/definitions/Model"}]}
+        },
+    }
+    assert schema == {
+        "type": "object",
+        "properties": {"parent": {**parent_schema, **definition}},
+        "definitions": {"Model": definition},
+    }
+    assert models == frozenset({model})
+
+
+@pytest.mark.parametrize(
+    "ref_name",
+    [
+        pytest.param("Undefined", id="not defined"),
+        pytest.param("Child", id="inherits"),
+    ],
+)
+@pytest.mark.utility_base
+def test_compose_not_composed(ref_name):
+    """
+    GIVEN model with a property that references a model that is not defined or
+        inherits
+    WHEN compose is called with the model
+    THEN the property is not composed.
+    """
+    namespace = types.ModuleType("models")
+    _define_model(
+        namespace, "Child", {"key": {"type": "integer"}}, **{"x-inherits": "Parent"}
+    )
+    properties = {"ref": {"type": "object", "x-de-$ref": ref_name}}
+    model = _define_model(namespace, "Model", properties)
+
+    schema, models = validation.compose(model=model)
+
+    assert schema == {"type": "object", "properties": properties}
+    assert models == frozenset()
+
+
+@pytest.mark.parametrize(
+    "path, expected_name",
+    [
+        pytest.param([], "Model", id="empty"),
+        pytest.param(["key"], "Model", id="column"),
+        pytest.param(["ref"], "RefModel", id="object"),
+        pytest.param(["ref", "key"], "RefModel", id="object property"),
+        pytest.param(["ref", "ref", "key"], "RefRefModel", id="object nested"),
+        pytest.param(["refs"], "Model", id="array"),
+        pytest.param(["refs", 1, "key"], "RefModel", id="array item property"),
+        pytest.param(["other"], "Model", id="not composed"),
+    ],
+)
+@pytest.mark.utility_base
+def test_locate(path, expected_name):
+    """
+    GIVEN model with object and array properties that reference other models and a
+        path within a dictionary of the model
+    WHEN locate is called with the model, the composed models and the path
+    THEN the innermost composed model along the path is returned.
+    """
+    namespace = types.ModuleType("models")
+    _define_model(namespace, "RefRefModel", {"key": {"type": "integer"}})
+    _define_model(
+        namespace,
+        "RefModel",
+        {
+            "key": {"type": "integer"},
+            "ref": {"type": "object", "x-de-$ref": "RefRefModel"},
+        },
+    )
+    _define_model(namespace, "OtherModel", {"key": {"type": "integer"}})
+    model = _define_model(
+        namespace,
+        "Model",
+        {
+            "key": {"type": "integer"},
+            "ref": {"type": "object", "x-de-$ref": "RefModel"},
+            "refs": {
+                "type": "array",
+                "items": {"type": "object", "x-de-$ref": "RefModel"},
+            },
+            "other": {"type": "object", "x-de-$ref": "OtherModel"},
+        },
+    )
+    models = frozenset({namespace.RefModel, namespace.RefRefModel})
+
+    returned_model = validation.locate(model=model, models=models, path=path)
+
+    assert returned_model is getattr(namespace, expected_name)
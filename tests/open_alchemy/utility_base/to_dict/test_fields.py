@@ -0,0 +1,115 @@
+"""Tests for the selection of the properties included by to_dict."""
+
+import pytest
+
+from open_alchemy.utility_base.to_dict import fields
+
+
+@pytest.mark.utility_base
+def test_create_all():
+    """
+    GIVEN no include, exclude or max_depth
+    WHEN create is called
+    THEN None is returned.
+    """
+    assert fields.create() is None
+    assert fields.create(exclude=[]) is None
+
+
+@pytest.mark.utility_base
+def test_create_cached():
+    """
+    GIVEN the same paths in a different order
+    WHEN create is called with them
+    THEN the same selection is returned.
+    """
+    selection = fields.create(include=["key_2", "key_1"])
+
+    assert fields.create(include=("key_1", "key_2", "key_1")) is selection
+    assert selection.include == ("key_1", "key_2")
+
+
+@pytest.mark.parametrize(
+    "kwargs, name, relationship, expected_includes",
+    [
+        pytest.param({"include": ["key"]}, "key", False, True, id="include"),
+        pytest.param({"include": ["key"]}, "other", False, False, id="not include"),
+        pytest.param({"include": "key"}, "key", False, True, id="include string"),
+        pytest.param(
+            {"include": ["key.nested"]}, "key", True, True, id="include nested"
+        ),
+        pytest.param({"exclude": ["key"]}, "key", False, False, id="exclude"),
+        pytest.param({"exclude": ["key"]}, "other", False, True, id="not exclude"),
+        pytest.param(
+            {"exclude": ["key.nested"]}, "key", True, True, id="exclude nested"
+        ),
+        pytest.param(
+            {"include": ["key"], "exclude": ["key"]},
+            "key",
+            False,
+            False,
+            id="include and exclude",
+        ),
+        pytest.param({"max_depth": 0}, "key", False, True, id="max_depth 0 column"),
+        pytest.param(
+            {"max_depth": 0}, "key", True, False, id="max_depth 0 relationship"
+        ),
+        pytest.param(
+            {"max_depth": 1}, "key", True, True, id="max_depth 1 relationship"
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_includes(kwargs, name, relationship, expected_includes):
+    """
+    GIVEN selection and the name of a property
+    WHEN includes is called with the name
+    THEN whether the property is included is returned.
+    """
+    selection = fields.create(**kwargs)
+
+    assert selection.includes(name, relationship=relationship) == expected_includes
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected_kwargs",
+    [
+        pytest.param({"include": ["key"]}, None, id="include"),
+        pytest.param(
+            {"include": ["key.nested_1", "key.nested_2", "other.nested"]},
+            {"include": ("nested_1", "nested_2"), "exclude": (), "max_depth": None},
+            id="include nested",
+        ),
+        pytest.param(
+            {"include": ["key", "key.nested"]}, None, id="include and include nested"
+        ),
+        pytest.param(
+            {"exclude": ["other", "key.nested"]},
+            {"include": None, "exclude": ("nested",), "max_depth": None},
+            id="exclude nested",
+        ),
+        pytest.param(
+            {"max_depth": 2},
+            {"include": None, "exclude": (), "max_depth": 1},
+            id="max_depth",
+        ),
+    ],
+)
+@pytest.mark.utility_base
+def test_nested(kwargs, expected_kwargs):
+    """
+    GIVEN selection
+    WHEN nested is called with the name of a property
+    THEN the selection for the related instances of the property is returned.
+    """
+    selection = fields.create(**kwargs)
+
+    nested = selection.nested("key")
+
+    if expected_kwargs is None:
+        assert nested is None
+    else:
+        assert nested.include == expected_kwargs["include"]
+        assert nested.exclude == expected_kwargs["exclude"]
+        assert nested.max_depth == expected_kwargs["max_depth"]
+    assert selection.nested("key") is nested
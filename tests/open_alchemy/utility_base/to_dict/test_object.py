@@ -68,6 +68,29 @@ class TestConvertRelationship:
         )
         assert returned_value == expected_return_value
 
+    @staticmethod
+    @pytest.mark.utility_base
+    def test_valid_selection():
+        """
+        GIVEN value that has a to_dict function and selection
+        WHEN _convert_relationship is called with the value and selection
+        THEN to_dict is called with the paths and depth of the selection.
+        """
+        object_value = mock.MagicMock()
+        selection = utility_base.to_dict.fields.create(
+            include=["key"], exclude=["key.nested"], max_depth=1
+        )
+
+        returned_value = utility_base.to_dict.object_._convert_relationship(
+            value=object_value, selection=selection
+        )
+
+        # pylint: disable=no-member
+        object_value.to_dict.assert_called_once_with(
+            include=("key",), exclude=("key.nested",), max_depth=1
+        )
+        assert returned_value == object_value.to_dict.return_value
+
     @staticmethod
     @pytest.mark.utility_base
     def test_valid_none():
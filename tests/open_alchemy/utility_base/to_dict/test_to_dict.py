@@ -1,7 +1,10 @@
 """Tests for to_dict."""
 
+import datetime
+
 import pytest
 
+from open_alchemy import exceptions
 from open_alchemy.utility_base import to_dict
 
 
@@ -72,3 +75,34 @@ def test_return_none(schema, expected_result):
     result = to_dict.return_none(schema=schema, property_name="prop_1")
 
     assert result == expected_result
+
+
+@pytest.mark.utility_base
+def test_compile_plan():
+    """
+    GIVEN model schema with required, nullable, writeOnly and invalid properties
+    WHEN compile_plan is called with the schema
+    THEN the plan excludes writeOnly properties, records whether None is returned and
+        raises for the invalid schema only when a value for it is converted.
+    """
+    schema = {
+        "properties": {
+            "prop_1": {"type": "string", "format": "date"},
+            "prop_2": {"type": "integer", "nullable": True},
+            "prop_3": {"type": "integer", "writeOnly": True},
+            "prop_4": {"type": "unsupported"},
+        },
+        "required": ["prop_1"],
+    }
+
+    plan = to_dict.compile_plan(schema=schema)
+
+    assert [(entry.name, entry.return_none) for entry in plan] == [
+        ("prop_1", True),
+        ("prop_2", True),
+        ("prop_4", False),
+    ]
+    assert plan[0].convert(datetime.date(2000, 1, 1)) == "2000-01-01"
+    assert plan[1].convert(1) == 1
+    with pytest.raises(exceptions.FeatureNotImplementedError):
+        plan[2].convert("value 1")
@@ -68,6 +68,18 @@ def test_validate_specfile_does_not_exist(tmp_path):
             ["specfile='specfile.yaml'", "name='my_package'", "output='my_output_dir'"],
             id="cli build command",
         ),
+        pytest.param(
+            [
+                "openalchemy",
+                "build",
+                "specfile.yaml",
+                "my_package",
+                "my_output_dir",
+                "--precompiled",
+            ],
+            ["precompiled=True"],
+            id="cli build command precompiled",
+        ),
         pytest.param(
             ["openalchemy", "generate", "specfile.yaml", "models.py"],
             ["specfile='specfile.yaml'", "output='models.py'"],